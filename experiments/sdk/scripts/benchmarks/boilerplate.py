@@ -0,0 +1,63 @@
+"""
+Loads src/boilerplates/python.py as a generated client module, so benchmarks run the same code a generated SDK ships.
+
+Template params are replaced like replaceParamsInTemplate in src/sdk.ts, src/boilerplates/python-runtime.py is
+loaded as the runtime module the client imports and the unkey types in scripts/openapi-tests/types.py are used as
+the components module.
+"""
+import importlib.util
+import re
+import sys
+import types
+from pathlib import Path
+
+SDK_ROOT = Path(__file__).resolve().parents[2]
+
+PARAMS = {
+    "ClientName": "ExampleClient",
+    "ErrorName": "ExampleError",
+    "UrlDefault": "http://localhost:3000",
+}
+
+
+def replace_params_in_template(template: str, params: dict) -> str:
+    def replace(match: re.Match) -> str:
+        name = match.group(0)[len("_replaced") :]
+        if name in params:
+            return params[name]
+        for prefix, value in params.items():
+            if name.startswith(prefix):
+                return value + name[len(prefix) :]
+        raise KeyError(f"Missing parameters: {name}")
+
+    return re.sub(r"\b_replaced[a-zA-Z]+\b", replace, template)
+
+
+def load_components(path: Path = SDK_ROOT / "scripts/openapi-tests/types.py") -> types.ModuleType:
+    spec = importlib.util.spec_from_file_location("components", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["components"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_template(path: Path, name: str) -> types.ModuleType:
+    module = types.ModuleType(name)
+    module.__file__ = f"{name}.py"
+    sys.modules[name] = module
+    template = path.read_text()
+    exec(compile(replace_params_in_template(template, PARAMS), module.__file__, "exec"), module.__dict__)
+    return module
+
+
+def load_runtime() -> types.ModuleType:
+    if "runtime" in sys.modules:
+        return sys.modules["runtime"]
+    if "components" not in sys.modules:
+        load_components()
+    return load_template(SDK_ROOT / "src/boilerplates/python-runtime.py", "runtime")
+
+
+def load_sdk(name: str = "example_sdk") -> types.ModuleType:
+    load_runtime()
+    return load_template(SDK_ROOT / "src/boilerplates/python.py", name)
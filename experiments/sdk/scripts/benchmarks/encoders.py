@@ -0,0 +1,89 @@
+"""
+Request body encoding throughput of the compiled encoders in types.py against dataclasses.asdict + json.dumps.
+
+    python scripts/benchmarks/encoders.py --items 1000 --rounds 200
+
+Encodes a multi_ratelimit body with --items ratelimits (unkey types) and a page of Dub links with sparse geo
+(partial types). asdict also keeps snake_case keys and None optionals, so its output is not even valid on the
+wire; it is the baseline generated methods used before.
+"""
+import argparse
+import dataclasses
+import json
+import time
+
+from boilerplate import load_components
+from models import load_types, make_page
+
+sdk_types = load_components()
+partial_types = load_types("dataclasses")
+
+
+def multi_ratelimit_body(items: int):
+    return sdk_types.V1RatelimitMultiRatelimitRequestBody(
+        ratelimits=[
+            sdk_types.Item(duration=60000, identifier=f"user_{i}", limit=100, cost=None if i % 2 else 1)
+            for i in range(items)
+        ],
+        schema=None,
+    )
+
+
+def asdict_dumps(obj) -> bytes:
+    return json.dumps(dataclasses.asdict(obj), default=str).encode()
+
+
+def links_asdict_dumps(links) -> bytes:
+    return json.dumps([dataclasses.asdict(link) for link in links], default=str).encode()
+
+
+def compiled(encode, dumps):
+    def run(obj) -> bytes:
+        return dumps(encode(obj))
+
+    return run
+
+
+def json_dumps(value) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def run(name: str, function, obj, rounds: int, size: int):
+    function(obj)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        function(obj)
+    elapsed = time.perf_counter() - start
+    print(f"{name:>32}: {rounds * size / elapsed:12.0f} records/s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    dumps = {"json": json_dumps}
+    try:
+        import orjson
+
+        dumps["orjson"] = orjson.dumps
+    except ImportError:
+        pass
+
+    body = multi_ratelimit_body(args.items)
+    print(f"multi_ratelimit with {args.items} items")
+    run("asdict + json.dumps", asdict_dumps, body, args.rounds, args.items)
+    for name, function in dumps.items():
+        run(f"compiled encoder + {name}", compiled(sdk_types.encode, function), body, args.rounds, args.items)
+
+    links = make_page(partial_types, args.items)
+    rounds = max(1, args.rounds // 20)
+    print(f"page of {args.items} links")
+    run("asdict + json.dumps", links_asdict_dumps, links, rounds, args.items)
+    for name, function in dumps.items():
+        run(f"compiled encoder + {name}", compiled(partial_types.encode, function), links, rounds, args.items)
+
+
+if __name__ == "__main__":
+    main()
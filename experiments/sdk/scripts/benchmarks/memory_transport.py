@@ -0,0 +1,90 @@
+"""
+In memory transport for the runtime tests, answers requests from a handler without any network.
+"""
+import asyncio
+import json
+from typing import Any, Callable, List, Optional
+
+from multidict import CIMultiDict
+
+from boilerplate import load_runtime
+
+runtime = load_runtime()
+
+
+class Request:
+    def __init__(self, method: str, url: str, headers: dict, body: Optional[bytes]):
+        self.method = method
+        self.url = url
+        self.headers = headers
+        self.body = body
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class Reply:
+    """
+    Status, headers and body chunks of a response, delay is waited before the headers are returned and
+    chunk_delay before each body chunk.
+    """
+
+    def __init__(
+        self,
+        body: Any = None,
+        status: int = 200,
+        headers: Optional[dict] = None,
+        delay: float = 0.0,
+        chunk_delay: float = 0.0,
+    ):
+        self.status = status
+        # case insensitive like the headers of every real transport
+        self.headers = CIMultiDict({"Content-Type": "application/json", **(headers or {})})
+        if isinstance(body, bytes):
+            self.chunks = [body]
+        elif isinstance(body, list) and body and isinstance(body[0], bytes):
+            self.chunks = body
+        else:
+            self.chunks = [json.dumps(body).encode()] if body is not None else []
+        self.delay = delay
+        self.chunk_delay = chunk_delay
+
+
+class MemoryTransport(runtime.Transport):
+    """
+    Calls handler(request) for every request, it returns a Reply, raises or is a coroutine function.
+
+    requests keeps every request with its body read, released counts the responses whose body was released.
+    """
+
+    def __init__(self, handler: Callable[[Request], Any]):
+        self.handler = handler
+        self.requests: List[Request] = []
+        self.released = 0
+
+    async def request(self, method, url, headers, content, timeout=None, trace=None):
+        body = await read_content(content)
+        request = Request(method, url, dict(headers), body)
+        self.requests.append(request)
+        reply = self.handler(request)
+        if asyncio.iscoroutine(reply):
+            reply = await reply
+        if reply.delay:
+            await asyncio.sleep(reply.delay)
+
+        async def stream():
+            for chunk in reply.chunks:
+                if reply.chunk_delay:
+                    await asyncio.sleep(reply.chunk_delay)
+                yield chunk
+
+        async def release():
+            self.released += 1
+
+        return runtime.Response(reply.status, reply.headers, stream(), release)
+
+
+async def read_content(content) -> Optional[bytes]:
+    if content is None or isinstance(content, bytes):
+        return content
+    return b"".join([chunk async for chunk in content])
@@ -0,0 +1,163 @@
+"""
+Memory and construction time of a page of Dub Link models for each python style of generateTypesFromSchema.
+
+    python scripts/benchmarks/models.py --links 1000
+
+Uses the partial-types snapshots in scripts/openapi-tests (dataclasses, slots and msgspec). Three links in four
+have a Geo object with two of its ~250 countries set and the rest have a null geo, like real getLinks responses.
+The dense style is the dataclasses one with the sparse LinkGeoTargeting and Geo models turned back into plain
+dataclasses, for comparison:
+
+    python scripts/benchmarks/models.py --links 10000 --styles dense dataclasses
+
+The second table decodes the same page from JSON with decode() and with lazy view(), reading three fields of
+each link like a typical getLinks consumer.
+"""
+import argparse
+import dataclasses
+import gc
+import importlib.util
+import json
+import time
+import tracemalloc
+import typing
+
+from boilerplate import SDK_ROOT
+
+STYLES = {
+    "dense": "partial-types.py",
+    "dataclasses": "partial-types.py",
+    "slots": "partial-types.slots.py",
+    "msgspec": "partial-types.msgspec.py",
+}
+
+
+def load_types(style: str):
+    path = SDK_ROOT / "scripts/openapi-tests" / STYLES[style]
+    spec = importlib.util.spec_from_file_location(f"types_{style}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    if style == "dense":
+        for name in ("LinkGeoTargeting", "Geo"):
+            densify(module, name)
+    return module
+
+
+def densify(module, name: str) -> None:
+    sparse = getattr(module, name)
+    dense = dataclasses.make_dataclass(name, list(sparse.__annotations__.items()))
+    attributes = getattr(module, f"_{name}_attributes")
+
+    def decode(data):
+        return dense(**{name: data.get(key) for key, name in attributes.items()})
+
+    setattr(module, name, dense)
+    setattr(module, f"_decode_{name}", decode)
+    module.DECODERS[dense] = decode
+    module.VIEW_FIELDS[dense] = module.VIEW_FIELDS[sparse]
+
+
+def field_names(cls) -> list:
+    return list(cls.__annotations__)
+
+
+def field_type(annotation):
+    # msgspec models declare required fields as Optional too
+    if typing.get_origin(annotation) is typing.Union:
+        return typing.get_args(annotation)[0]
+    return annotation
+
+
+def make_page(module, links: int) -> list:
+    geo_fields = {name: None for name in field_names(module.Geo)}
+    link_fields = field_names(module.Link)
+    annotations = module.Link.__annotations__
+    defaults = {bool: False, float: 0.0}
+    tag = module.Tag(color=module.Color.BLUE, id="tag_1", name="docs")
+
+    page = []
+    for i in range(links):
+        values = {name: defaults.get(field_type(annotations[name]), f"{name}-{i}") for name in link_fields}
+        if i % 4 != 3:
+            values["geo"] = module.Geo(**{**geo_fields, "us": "https://example.com/us", "de": "https://example.com/de"})
+        else:
+            values["geo"] = None
+        values["tags"] = [tag]
+        values["webhook_ids"] = []
+        page.append(module.Link(**values))
+    return page
+
+
+def measure(module, links: int):
+    gc.collect()
+    tracemalloc.start()
+    page = make_page(module, links)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del page
+    # construction time without tracemalloc overhead
+    start = time.perf_counter()
+    make_page(module, links)
+    elapsed = time.perf_counter() - start
+    return size, elapsed
+
+
+def decode_page(module, payload: list, lazy: bool) -> list:
+    convert = module.view if lazy else module.decode
+    page = [convert(module.Link, item) for item in payload]
+    for link in page:
+        link.url, link.short_link, link.clicks
+    return page
+
+
+def measure_decode(module, payload: list, lazy: bool):
+    gc.collect()
+    tracemalloc.start()
+    page = decode_page(module, payload, lazy)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del page
+    start = time.perf_counter()
+    decode_page(module, payload, lazy)
+    elapsed = time.perf_counter() - start
+    return size, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--links", type=int, default=1000)
+    parser.add_argument("--styles", nargs="+", default=list(STYLES))
+    args = parser.parse_args()
+
+    for style in args.styles:
+        try:
+            module = load_types(style)
+        except ImportError as error:
+            print(f"{style:>20}: skipped ({error})")
+            continue
+        size, elapsed = measure(module, args.links)
+        print(
+            f"{style:>20}: {size / 1024 / 1024:8.2f} MiB"
+            f" {size / args.links / 1024:8.2f} KiB/link"
+            f" {args.links / elapsed:10.0f} links/s"
+        )
+
+    dataclasses_types = load_types("dataclasses")
+    payload = json.loads(json.dumps(dataclasses_types.encode(make_page(dataclasses_types, args.links))))
+    print(f"decoding {args.links} links and reading 3 fields")
+    for style in args.styles:
+        try:
+            module = load_types(style)
+        except ImportError:
+            continue
+        for lazy in (False, True):
+            size, elapsed = measure_decode(module, payload, lazy)
+            name = f"{style} {'view' if lazy else 'decode'}"
+            print(
+                f"{name:>20}: {size / 1024 / 1024:8.2f} MiB"
+                f" {args.links / elapsed:10.0f} links/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Server sent events parsing throughput in events per second.
+
+    python scripts/benchmarks/sse.py --events 200000 --chunk-size 4096
+
+The payload uses the spiceflow wire format (event: message + one JSON data line). The legacy parser is
+the line based stream_sse_response the boilerplate shipped before SSEParser, kept here as a baseline.
+"""
+import argparse
+import json
+import time
+
+from boilerplate import load_runtime
+
+runtime = load_runtime()
+
+
+def make_payload(events: int) -> bytes:
+    return b"".join(
+        b"event: message\ndata: "
+        + json.dumps({"count": i, "timestamp": 1700000000000 + i, "text": "hello world"}).encode()
+        + b"\n\n"
+        for i in range(events)
+    )
+
+
+def legacy_parse(chunks) -> int:
+    count = 0
+    buffer = b""
+    for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line = line.decode("utf-8")
+            if not line.startswith("data: "):
+                continue
+            data = line[6:].strip()
+            if not data:
+                continue
+            json.loads(data)
+            count += 1
+    return count
+
+
+def parser_only(chunks) -> int:
+    parser = runtime.SSEParser()
+    count = 0
+    for chunk in chunks:
+        count += len(parser.feed(chunk))
+    return count
+
+
+def parser_json(codec):
+    def parse(chunks) -> int:
+        parser = runtime.SSEParser()
+        count = 0
+        for chunk in chunks:
+            for event in parser.feed(chunk):
+                event.json(codec)
+                count += 1
+        return count
+
+    return parse
+
+
+def installed_codecs():
+    yield runtime.JSONCodec()
+    for codec in (runtime.OrjsonCodec, runtime.MsgspecCodec):
+        try:
+            yield codec()
+        except ImportError:
+            pass
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--events", type=int, default=200000)
+    arg_parser.add_argument("--chunk-size", type=int, default=4096)
+    args = arg_parser.parse_args()
+
+    payload = make_payload(args.events)
+    chunks = [payload[i : i + args.chunk_size] for i in range(0, len(payload), args.chunk_size)]
+    print(f"{args.events} events, {len(payload) / 1e6:.1f} MB in {len(chunks)} chunks of {args.chunk_size} bytes")
+
+    for name, parse in [
+        ("legacy line parser + json", legacy_parse),
+        ("SSEParser", parser_only),
+        *((f"SSEParser + {codec.name}", parser_json(codec)) for codec in installed_codecs()),
+    ]:
+        start = time.perf_counter()
+        count = parse(chunks)
+        elapsed = time.perf_counter() - start
+        assert count == args.events, (name, count)
+        print(f"{name:<28} {count / elapsed:>12,.0f} events/s")
+
+
+if __name__ == "__main__":
+    main()
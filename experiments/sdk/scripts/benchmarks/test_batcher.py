@@ -0,0 +1,165 @@
+"""
+Checks MicroBatcher and client.coalesce batch concurrent calls and route every result back to its caller.
+
+    python -m pytest scripts/benchmarks
+"""
+import asyncio
+
+import pytest
+
+from boilerplate import load_sdk
+from memory_transport import MemoryTransport, Reply, runtime
+
+sdk = load_sdk()
+
+
+class Recorder:
+    """send for a batcher, returns the items upper cased and keeps every batch it was called with"""
+
+    def __init__(self, error=None):
+        self.batches = []
+        self.error = error
+
+    async def __call__(self, key, items):
+        self.batches.append((key, items))
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        return [item.upper() for item in items]
+
+
+def test_concurrent_calls_share_a_batch():
+    async def main():
+        send = Recorder()
+        batcher = runtime.MicroBatcher(send, max_delay=0.001)
+        results = await asyncio.gather(*[batcher(item) for item in "abc"])
+        assert results == ["A", "B", "C"]
+        assert send.batches == [(None, ["a", "b", "c"])]
+
+    asyncio.run(main())
+
+
+def test_max_size_and_keys_split_batches():
+    async def main():
+        send = Recorder()
+        batcher = runtime.MicroBatcher(send, key=lambda item: item[0], max_size=2, max_delay=0.001)
+        results = await asyncio.gather(*[batcher(item) for item in ["a1", "b1", "a2", "a3"]])
+        assert results == ["A1", "B1", "A2", "A3"]
+        assert sorted(send.batches) == [("a", ["a1", "a2"]), ("a", ["a3"]), ("b", ["b1"])]
+
+    asyncio.run(main())
+
+
+def test_send_errors_reach_every_call():
+    async def main():
+        batcher = runtime.MicroBatcher(Recorder(error=RuntimeError("bulk failed")), max_delay=0.001)
+        results = await asyncio.gather(*[batcher(item) for item in "ab"], return_exceptions=True)
+        assert [str(result) for result in results] == ["bulk failed", "bulk failed"]
+
+    asyncio.run(main())
+
+
+def test_wrong_number_of_results_raises():
+    async def main():
+        async def send(key, items):
+            return items[:1]
+
+        batcher = runtime.MicroBatcher(send, max_delay=0.001)
+        results = await asyncio.gather(*[batcher(item) for item in "ab"], return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+
+    asyncio.run(main())
+
+
+def test_cancelled_call_keeps_the_batch():
+    async def main():
+        send = Recorder()
+        batcher = runtime.MicroBatcher(send, max_delay=0.005)
+        first = asyncio.ensure_future(batcher("a"))
+        second = asyncio.ensure_future(batcher("b"))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == "B"
+        assert send.batches == [(None, ["a", "b"])]
+
+    asyncio.run(main())
+
+
+def test_stats_record_batch_sizes_and_queue_delay():
+    async def main():
+        batcher = runtime.MicroBatcher(Recorder(), key=lambda item: item[0], max_size=2, max_delay=0.001)
+        await asyncio.gather(*[batcher(item) for item in ["a1", "b1", "a2", "a3"]])
+        stats = batcher.stats
+        assert (stats.batches, stats.items, stats.max_batch_size) == (3, 4, 2)
+        assert stats.batch_sizes == {2: 1, 1: 2}
+        assert stats.mean_batch_size == 4 / 3
+        # b1 and a3 waited for max_delay, the full a batch was sent right away
+        assert stats.queue_delay_max >= stats.mean_queue_delay > 0
+        assert repr(stats).startswith("BatchStats(batches=3, items=4, mean_batch_size=1.3, max_batch_size=2,")
+
+    asyncio.run(main())
+
+
+def test_invalid_max_size():
+    with pytest.raises(ValueError):
+        runtime.MicroBatcher(Recorder(), max_size=0)
+
+
+class RatelimitClient(sdk.ExampleClientAsync):
+    async def ratelimit(self, request: dict) -> dict:
+        response = await self.fetch("POST", "/v1/ratelimits.limit", body=request)
+        return await response.json()
+
+    async def multi_ratelimit(self, requests: list) -> list:
+        response = await self.fetch("POST", "/v1/ratelimits.multiLimit", body={"ratelimits": requests})
+        return (await response.json())["ratelimits"]
+
+
+def ratelimit_transport():
+    def handler(request):
+        body = request.json()
+        if request.url.endswith("multiLimit"):
+            ratelimits = [{"identifier": item["identifier"], "bulk": True} for item in body["ratelimits"]]
+            return Reply({"ratelimits": ratelimits})
+        return Reply({"identifier": body["identifier"], "bulk": False})
+
+    return MemoryTransport(handler)
+
+
+def test_coalesce_ratelimit_into_multi_ratelimit():
+    async def main():
+        transport = ratelimit_transport()
+        client = RatelimitClient(transport=transport)
+        batcher = client.batcher(lambda _, requests: client.multi_ratelimit(requests), max_delay=0.001)
+        client.coalesce("ratelimit", batcher, when=lambda request: request.get("lease") is None)
+
+        results = await asyncio.gather(
+            client.ratelimit({"identifier": "user_1"}),
+            client.ratelimit({"identifier": "user_2"}),
+            client.ratelimit({"identifier": "user_3", "lease": "lease_1"}),
+        )
+        assert results == [
+            {"identifier": "user_1", "bulk": True},
+            {"identifier": "user_2", "bulk": True},
+            {"identifier": "user_3", "bulk": False},
+        ]
+        assert sorted(request.url.rsplit("/", 1)[1] for request in transport.requests) == [
+            "ratelimits.limit",
+            "ratelimits.multiLimit",
+        ]
+        assert batcher.stats.batch_sizes == {2: 1}
+
+    asyncio.run(main())
+
+
+def test_aclose_sends_pending_batches():
+    async def main():
+        send = Recorder()
+        client = sdk.ExampleClientAsync(transport=MemoryTransport(lambda request: Reply({})))
+        batcher = client.batcher(send, max_delay=60)
+        call = asyncio.ensure_future(batcher("a"))
+        await asyncio.sleep(0)
+        await client.aclose()
+        assert await call == "A"
+
+    asyncio.run(main())
@@ -0,0 +1,148 @@
+"""
+Checks ResponseCache freshness, ETag revalidation, Vary keys and its size bounds through fetch.
+
+    python -m pytest scripts/benchmarks
+"""
+import asyncio
+
+from boilerplate import load_sdk
+from memory_transport import MemoryTransport, Reply, runtime
+
+sdk = load_sdk()
+
+
+def cached_client(handler, **cache_options):
+    transport = MemoryTransport(handler)
+    client = sdk.ExampleClientAsync(transport=transport, cache=runtime.ResponseCache(**cache_options))
+    return client, transport
+
+
+async def get_json(client, path="/users/1", headers=None):
+    return await (await client.fetch("GET", path, headers=headers)).json()
+
+
+def test_fresh_responses_are_served_from_the_cache():
+    async def main():
+        client, transport = cached_client(lambda request: Reply({"id": 1}, headers={"Cache-Control": "max-age=60"}))
+        first = await get_json(client)
+        second = await get_json(client)
+        assert first == {"id": 1}
+        # the decoded JSON is stored with the body and shared
+        assert second is first
+        assert len(transport.requests) == 1
+        assert (client.cache.hits, client.cache.misses) == (1, 1)
+
+    asyncio.run(main())
+
+
+def test_uncacheable_requests_and_responses():
+    async def main():
+        client, transport = cached_client(
+            lambda request: Reply(
+                {"path": request.url},
+                status=404 if request.url.endswith("missing") else 200,
+                headers={"Cache-Control": "no-store" if request.url.endswith("private") else "max-age=60"},
+            )
+        )
+        for _ in range(2):
+            await get_json(client, "/private")
+            await get_json(client, "/missing")
+            await get_json(client, "/users/1", headers={"Cache-Control": "no-cache"})
+            await (await client.fetch("POST", "/users/1", body={})).read()
+        assert len(transport.requests) == 8
+        assert len(client.cache) == 0
+
+    asyncio.run(main())
+
+
+def test_stale_responses_are_revalidated_with_their_etag():
+    def handler(request):
+        headers = {"Cache-Control": "no-cache", "ETag": '"v1"'}
+        if request.headers.get("If-None-Match") == '"v1"':
+            return Reply(status=304, headers=headers)
+        return Reply({"id": 1}, headers=headers)
+
+    async def main():
+        client, transport = cached_client(handler)
+        first = await get_json(client)
+        second = await get_json(client)
+        assert second is first
+        assert [request.headers.get("If-None-Match") for request in transport.requests] == [None, '"v1"']
+        assert client.cache.revalidations == 1
+        # the 304 response is released, its connection goes back to the pool
+        assert transport.released == 2
+
+    asyncio.run(main())
+
+
+def test_vary_headers_are_part_of_the_key():
+    async def main():
+        client, transport = cached_client(
+            lambda request: Reply(
+                {"language": request.headers.get("Accept-Language")},
+                headers={"Cache-Control": "max-age=60", "Vary": "Accept-Language"},
+            )
+        )
+        await get_json(client)
+        english = await get_json(client, headers={"Accept-Language": "en"})
+        german = await get_json(client, headers={"Accept-Language": "de"})
+        assert (english, german) == ({"language": "en"}, {"language": "de"})
+        assert await get_json(client, headers={"Accept-Language": "en"}) is english
+        assert len(transport.requests) == 3
+
+    asyncio.run(main())
+
+
+def test_authorization_is_part_of_the_key():
+    async def main():
+        client, transport = cached_client(lambda request: Reply({}, headers={"Cache-Control": "max-age=60"}))
+        await get_json(client, headers={"Authorization": "Bearer a"})
+        await get_json(client, headers={"Authorization": "Bearer b"})
+        assert len(transport.requests) == 2
+
+    asyncio.run(main())
+
+
+def test_size_bounds():
+    async def main():
+        client, transport = cached_client(
+            lambda request: Reply(
+                b"x" * (100 if request.url.endswith("big") else 10), headers={"Cache-Control": "max-age=60"}
+            ),
+            max_entries=2,
+            max_entry_bytes=50,
+        )
+        for path in ["/big", "/a", "/b", "/c"]:
+            await (await client.fetch("GET", path)).read()
+        assert len(client.cache) == 2
+        assert (client.cache.size, client.cache.evictions) == (20, 1)
+        # /a was the least recently used entry
+        await (await client.fetch("GET", "/a")).read()
+        await (await client.fetch("GET", "/c")).read()
+        assert [request.url.rsplit("/", 1)[1] for request in transport.requests] == ["big", "a", "b", "c", "a"]
+
+    asyncio.run(main())
+
+
+def test_partially_read_bodies_are_not_stored():
+    async def main():
+        client, transport = cached_client(
+            lambda request: Reply([b"a" * 10, b"b" * 10], headers={"Cache-Control": "max-age=60"})
+        )
+        async with client.stream("GET", "/export") as response:
+            async for _ in response:
+                break
+        assert len(client.cache) == 0
+        async with client.stream("GET", "/export") as response:
+            assert [chunk async for chunk in response] == [b"a" * 10, b"b" * 10]
+        assert len(client.cache) == 1
+
+    asyncio.run(main())
+
+
+def test_parse_cache_control():
+    assert runtime.parse_cache_control('max-age=60, no-cache, private="x"') == {
+        "max-age": "60",
+        "no-cache": None,
+        "private": "x",
+    }
@@ -0,0 +1,56 @@
+"""
+Checks every JSON codec round trips values and raises ValueError for invalid JSON.
+
+    python -m pytest scripts/benchmarks
+"""
+import asyncio
+
+import pytest
+
+from boilerplate import load_sdk
+from memory_transport import MemoryTransport, Reply, runtime
+
+sdk = load_sdk()
+
+CODECS = [("json", runtime.JSONCodec), ("orjson", runtime.OrjsonCodec), ("msgspec", runtime.MsgspecCodec)]
+
+
+@pytest.fixture(params=CODECS, ids=[name for name, _ in CODECS])
+def codec(request):
+    name, codec_class = request.param
+    pytest.importorskip(name)
+    return codec_class()
+
+
+def test_round_trip(codec):
+    value = {"id": "user_1", "tags": ["a", "b"], "score": 1.5, "active": True, "parent": None}
+
+    assert codec.loads(codec.dumps(value)) == value
+
+
+@pytest.mark.parametrize("data", [b"not json", b'{"id": ', b"\xff\xfe"])
+def test_invalid_json_raises_value_error(codec, data):
+    with pytest.raises(ValueError):
+        codec.loads(data)
+
+
+def test_response_json_raises_value_error(codec):
+    async def main():
+        transport = MemoryTransport(lambda request: Reply(b"<html>bad gateway</html>"))
+        client = sdk.ExampleClientAsync(transport=transport, json_codec=codec)
+        response = await client.fetch("GET", "/users/1")
+        with pytest.raises(ValueError):
+            await response.json()
+
+    asyncio.run(main())
+
+
+def test_sse_data_that_is_not_json(codec):
+    async def main():
+        body = b'data: {"count": 1}\n\ndata: plain text\n\n'
+        transport = MemoryTransport(lambda request: Reply(body, headers={"Content-Type": "text/event-stream"}))
+        client = sdk.ExampleClientAsync(transport=transport, json_codec=codec)
+        response = await client.fetch("GET", "/events")
+        return [data async for data in runtime.stream_sse_response(response)]
+
+    assert asyncio.run(main()) == [{"count": 1}, "plain text"]
@@ -0,0 +1,149 @@
+"""
+Checks HedgePolicy sends a second copy of slow requests and CircuitBreaker fails fast for unhealthy hosts.
+
+    python -m pytest scripts/benchmarks
+"""
+import asyncio
+
+import pytest
+
+from boilerplate import load_sdk
+from memory_transport import MemoryTransport, Reply, runtime
+
+sdk = load_sdk()
+
+
+async def get(client):
+    return await (await client.fetch("GET", "/users/1")).json()
+
+
+def test_slow_requests_are_hedged():
+    async def main():
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            # the 6th request hangs, its hedge answers right away
+            return Reply({"call": len(calls)}, delay=1.0 if len(calls) == 6 else 0.001)
+
+        transport = MemoryTransport(handler)
+        hedge = runtime.HedgePolicy(min_samples=5, min_delay=0.01)
+        client = sdk.ExampleClientAsync(transport=transport, hedge=hedge)
+        for _ in range(5):
+            await get(client)
+        assert hedge.delay(("GET", "localhost:3000")) >= 0.01
+
+        started = asyncio.get_running_loop().time()
+        assert await get(client) == {"call": 7}
+        assert asyncio.get_running_loop().time() - started < 0.5
+        assert (hedge.requests, hedge.hedges, hedge.wins) == (6, 1, 1)
+
+    asyncio.run(main())
+
+
+def test_no_hedges_before_min_samples_or_for_other_methods():
+    async def main():
+        transport = MemoryTransport(lambda request: Reply({}, delay=0.02))
+        hedge = runtime.HedgePolicy(min_samples=5)
+        client = sdk.ExampleClientAsync(transport=transport, hedge=hedge)
+        await get(client)
+        await (await client.fetch("POST", "/users", body={})).read()
+        assert hedge.requests == 1
+        assert hedge.hedges == 0
+        assert len(transport.requests) == 2
+
+    asyncio.run(main())
+
+
+def test_hedges_are_paid_from_the_budget():
+    async def main():
+        # only the first request is fast, every later one waits long enough to be hedged
+        transport = MemoryTransport(lambda request: Reply({}, delay=0.05 if transport.requests[1:] else 0.001))
+        hedge = runtime.HedgePolicy(
+            min_samples=1, min_delay=0.005, budget=runtime.RetryBudget(ratio=0, max_tokens=1)
+        )
+        client = sdk.ExampleClientAsync(transport=transport, hedge=hedge)
+        for _ in range(4):
+            await get(client)
+        # the first request has no latency yet, then the budget only pays for one hedge
+        assert hedge.hedges == 1
+        assert len(transport.requests) == 5
+
+    asyncio.run(main())
+
+
+def breaker_client(handler, **options):
+    breaker = runtime.CircuitBreaker(failure_threshold=2, recovery_time=0.02, **options)
+    transport = MemoryTransport(handler)
+    client = sdk.ExampleClientAsync(
+        transport=transport, circuit_breaker=breaker, retry=runtime.RetryPolicy(max_attempts=1)
+    )
+    return client, breaker, transport
+
+
+def test_circuit_opens_after_consecutive_failures_and_recovers():
+    healthy = []
+
+    def handler(request):
+        return Reply({}, status=200 if healthy else 503)
+
+    async def main():
+        client, breaker, transport = breaker_client(handler)
+        for _ in range(2):
+            assert (await client.fetch("GET", "/users/1")).status == 503
+        assert breaker.state("localhost:3000") == "open"
+        with pytest.raises(sdk.ExampleError) as error:
+            await client.fetch("GET", "/users/1")
+        assert error.value.status == 503
+        assert (breaker.rejected, len(transport.requests)) == (1, 2)
+
+        await asyncio.sleep(0.03)
+        healthy.append(True)
+        assert (await client.fetch("GET", "/users/1")).status == 200
+        assert breaker.state("localhost:3000") == "closed"
+
+    asyncio.run(main())
+
+
+def test_failed_probe_opens_the_circuit_again():
+    async def main():
+        client, breaker, transport = breaker_client(lambda request: Reply({}, status=503))
+        for _ in range(2):
+            await client.fetch("GET", "/users/1")
+        await asyncio.sleep(0.03)
+        assert (await client.fetch("GET", "/users/1")).status == 503
+        assert breaker.state("localhost:3000") == "open"
+        with pytest.raises(sdk.ExampleError):
+            await client.fetch("GET", "/users/1")
+        assert len(transport.requests) == 3
+
+    asyncio.run(main())
+
+
+def test_successes_reset_the_failure_count():
+    statuses = [503, 200, 503, 200]
+
+    async def main():
+        client, breaker, _ = breaker_client(lambda request: Reply({}, status=statuses.pop(0)))
+        for _ in range(4):
+            await client.fetch("GET", "/users/1")
+        assert breaker.state("localhost:3000") == "closed"
+
+    asyncio.run(main())
+
+
+def test_half_open_allows_limited_probes():
+    async def main():
+        async def handler(request):
+            await asyncio.sleep(0.01)
+            return Reply({})
+
+        client, breaker, transport = breaker_client(handler)
+        for _ in range(2):
+            breaker.record("localhost:3000", failed=True)
+        await asyncio.sleep(0.03)
+        results = await asyncio.gather(*[client.fetch("GET", "/users/1") for _ in range(3)], return_exceptions=True)
+        assert [isinstance(result, sdk.ExampleError) for result in results] == [False, True, True]
+        assert len(transport.requests) == 1
+
+    asyncio.run(main())
@@ -0,0 +1,50 @@
+"""
+Checks JSONArrayStream and NDJSONStream bodies decode to the records they were given.
+
+    python -m pytest scripts/benchmarks
+"""
+import asyncio
+import json
+
+import pytest
+
+from boilerplate import load_sdk
+from memory_transport import MemoryTransport, Reply, runtime
+
+sdk = load_sdk()
+
+
+def send(body):
+    async def main():
+        transport = MemoryTransport(lambda request: Reply({}))
+        client = sdk.ExampleClientAsync(transport=transport)
+        await (await client.fetch("POST", "/v1/bulk", body=body)).read()
+        [request] = transport.requests
+        return request.headers["Content-Type"], request.body
+
+    return asyncio.run(main())
+
+
+def test_array_nested_next_to_fields():
+    records = [{"id": index} for index in range(1000)]
+    content_type, body = send(runtime.JSONArrayStream(records, fields={"keyring": "user"}, key="data", flush_size=64))
+    assert content_type == "application/json"
+    assert json.loads(body) == {"keyring": "user", "data": records}
+
+
+def test_bare_array_and_ndjson():
+    async def records():
+        for index in range(3):
+            yield {"id": index}
+
+    assert json.loads(send(runtime.JSONArrayStream(records()))[1]) == [{"id": 0}, {"id": 1}, {"id": 2}]
+    content_type, body = send(runtime.NDJSONStream(records()))
+    assert content_type == "application/x-ndjson"
+    assert [json.loads(line) for line in body.splitlines()] == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+
+def test_key_must_not_be_a_field():
+    with pytest.raises(ValueError):
+        runtime.JSONArrayStream([1], fields={"data": [], "keyring": "user"}, key="data")
+    with pytest.raises(ValueError):
+        runtime.JSONArrayStream([1], fields={"keyring": "user"})
@@ -0,0 +1,143 @@
+"""
+Checks LeaseManager against an in memory rate limit that hands out leases and refunds their unused tokens.
+
+    python -m pytest scripts/benchmarks
+"""
+import asyncio
+
+from boilerplate import load_sdk
+from memory_transport import MemoryTransport, Reply, runtime
+
+sdk = load_sdk()
+
+
+class Limiter:
+    """Server side of the leases: limit tokens per identifier, commits give back what a lease did not use"""
+
+    def __init__(self, limit: int, fail_commits: bool = False):
+        self.limit = limit
+        self.tokens = {}
+        self.leases = {}
+        self.reserved = []
+        self.committed = []
+        self.fail_commits = fail_commits
+
+    async def reserve(self, identifier, cost, timeout):
+        await asyncio.sleep(0)
+        self.reserved.append((identifier, cost))
+        available = self.tokens.setdefault(identifier, self.limit)
+        if available < cost:
+            return None
+        self.tokens[identifier] = available - cost
+        lease = f"lease_{len(self.leases) + 1}"
+        self.leases[lease] = (identifier, cost)
+        return lease
+
+    async def commit(self, lease, used):
+        await asyncio.sleep(0)
+        if self.fail_commits:
+            raise RuntimeError("commit failed")
+        identifier, cost = self.leases.pop(lease)
+        self.tokens[identifier] += cost - used
+        self.committed.append((lease, used))
+
+
+def test_decisions_are_local_until_the_block_runs_low():
+    async def main():
+        limiter = Limiter(limit=1000)
+        leases = runtime.LeaseManager(limiter.reserve, limiter.commit, block_size=10, refill_below=0.2)
+        assert [await leases.limit("user_1") for _ in range(8)] == [True] * 8
+        assert limiter.reserved == [("user_1", 10)]
+        assert (leases.reservations, leases.local_decisions) == (1, 7)
+        # 2 tokens left is below the refill threshold, a new block is reserved in the background
+        await leases.limit("user_1")
+        await asyncio.sleep(0.01)
+        assert limiter.reserved == [("user_1", 10), ("user_1", 10)]
+        # the replaced lease is committed with what it actually used
+        assert limiter.committed == [("lease_1", 9)]
+        await leases.flush()
+        assert limiter.committed == [("lease_1", 9), ("lease_2", 0)]
+        assert limiter.tokens["user_1"] == 1000 - 9
+
+    asyncio.run(main())
+
+
+def test_denied_when_the_limit_is_exhausted():
+    async def main():
+        limiter = Limiter(limit=3)
+        leases = runtime.LeaseManager(limiter.reserve, limiter.commit, block_size=10, refill_below=0)
+        results = [await leases.limit("user_1") for _ in range(5)]
+        # a block does not fit, each call then reserves just its own cost
+        assert results == [True, True, True, False, False]
+        assert limiter.reserved[:2] == [("user_1", 10), ("user_1", 1)]
+        assert leases.denied == 2
+        assert await leases.limit("user_2")
+
+    asyncio.run(main())
+
+
+def test_concurrent_callers_share_one_reservation():
+    async def main():
+        limiter = Limiter(limit=1000)
+        leases = runtime.LeaseManager(limiter.reserve, limiter.commit, block_size=10, refill_below=0)
+        results = await asyncio.gather(*[leases.limit("user_1") for _ in range(5)])
+        assert results == [True] * 5
+        assert limiter.reserved == [("user_1", 10)]
+
+    asyncio.run(main())
+
+
+def test_bursts_larger_than_a_block_reserve_again():
+    async def main():
+        limiter = Limiter(limit=10000)
+        leases = runtime.LeaseManager(limiter.reserve, limiter.commit, block_size=100, refill_below=0)
+        results = await asyncio.gather(*[leases.limit("user_1") for _ in range(150)])
+        # callers that waited for the first block after it ran out wait for the next one instead of being denied
+        assert results == [True] * 150
+        assert leases.denied == 0
+        assert limiter.reserved == [("user_1", 100), ("user_1", 100)]
+        await leases.flush()
+        assert limiter.tokens["user_1"] == 10000 - 150
+
+    asyncio.run(main())
+
+
+def test_leases_are_committed_before_they_expire():
+    async def main():
+        limiter = Limiter(limit=1000)
+        leases = runtime.LeaseManager(
+            limiter.reserve, limiter.commit, block_size=10, lease_timeout=0.03, expiry_margin=0.02
+        )
+        await leases.limit("user_1", cost=3)
+        await asyncio.sleep(0.05)
+        assert limiter.committed == [("lease_1", 3)]
+        # the expired lease is not used anymore
+        await leases.limit("user_1")
+        assert limiter.reserved == [("user_1", 10), ("user_1", 10)]
+        await leases.flush()
+
+    asyncio.run(main())
+
+
+def test_commit_errors_are_kept():
+    async def main():
+        limiter = Limiter(limit=1000, fail_commits=True)
+        leases = runtime.LeaseManager(limiter.reserve, limiter.commit, block_size=10)
+        await leases.limit("user_1")
+        await leases.flush()
+        assert [str(error) for error in leases.commit_errors] == ["commit failed"]
+        assert leases.commits == 0
+
+    asyncio.run(main())
+
+
+def test_aclose_commits_leases():
+    async def main():
+        limiter = Limiter(limit=1000)
+        client = sdk.ExampleClientAsync(transport=MemoryTransport(lambda request: Reply({})))
+        leases = client.lease_manager(limiter.reserve, limiter.commit, block_size=10)
+        await leases.limit("user_1", cost=4)
+        await client.aclose()
+        assert limiter.committed == [("lease_1", 4)]
+
+    asyncio.run(main())
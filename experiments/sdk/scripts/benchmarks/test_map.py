@@ -0,0 +1,84 @@
+"""
+Checks client.map bounds the calls in flight, keeps input order and reports each failure in its result.
+
+    python -m pytest scripts/benchmarks
+"""
+import asyncio
+
+import pytest
+
+from boilerplate import load_sdk
+from memory_transport import MemoryTransport, Reply
+
+sdk = load_sdk()
+
+
+def client():
+    return sdk.ExampleClientAsync(transport=MemoryTransport(lambda request: Reply({})))
+
+
+class Tracker:
+    """Route method double that sleeps longer for smaller items and records the calls in flight"""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.started = []
+
+    async def __call__(self, item, scale=1):
+        self.started.append(item)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01 * (10 - item))
+            if item == 3:
+                raise ValueError("item 3 failed")
+            return item * scale
+        finally:
+            self.in_flight -= 1
+
+
+def run_map(args, **kwargs):
+    tracker = Tracker()
+
+    async def main():
+        return [result async for result in client().map(tracker, args, **kwargs)]
+
+    return asyncio.run(main()), tracker
+
+
+def test_ordered_results_and_bounded_concurrency():
+    results, tracker = run_map(range(10), concurrency=3)
+
+    assert [result.index for result in results] == list(range(10))
+    assert [result.value for result in results if result.error is None] == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+    assert str(results[3].error) == "item 3 failed"
+    with pytest.raises(ValueError):
+        results[3].result()
+    assert tracker.max_in_flight <= 3
+
+
+def test_unordered_results_come_as_they_complete():
+    results, _ = run_map(range(5), concurrency=5, ordered=False)
+
+    assert [result.item for result in results] == [4, 3, 2, 1, 0]
+
+
+def test_tuples_are_unpacked_and_async_iterables_pulled_lazily():
+    async def args():
+        for item in range(4):
+            yield (item, 10)
+
+    results, tracker = run_map(args(), concurrency=2)
+
+    assert [result.value for result in results if result.error is None] == [0, 10, 20]
+    assert tracker.started == [0, 1, 2, 3]
+
+
+def test_invalid_concurrency():
+    async def main():
+        async for _ in client().map(Tracker(), [1], concurrency=0):
+            pass
+
+    with pytest.raises(ValueError):
+        asyncio.run(main())
@@ -0,0 +1,112 @@
+"""
+Checks every response fetch returns is recorded in Metrics once its body was read.
+
+    python -m pytest scripts/benchmarks
+"""
+import asyncio
+
+from boilerplate import load_sdk
+from memory_transport import MemoryTransport, Reply, runtime
+
+sdk = load_sdk()
+
+BODY = {"id": "user_1", "name": "Ada"}
+SIZE = len(Reply(BODY).chunks[0])
+
+
+def series(metrics, route="/users/{id}"):
+    return [series for series in metrics.snapshot() if series.route == route]
+
+
+def test_streamed_response():
+    async def main():
+        metrics = runtime.Metrics()
+        client = sdk.ExampleClientAsync(transport=MemoryTransport(lambda request: Reply(BODY)), metrics=metrics)
+        response = await client.fetch("GET", "/users/1", route="/users/{id}")
+        assert series(metrics) == []
+        assert await response.json() == BODY
+        assert "body" in response.metadata.timing
+        return metrics
+
+    [recorded] = series(asyncio.run(main()))
+    assert (recorded.status, recorded.requests, recorded.response_bytes) == ("200", 1, SIZE)
+
+
+def test_cache_hits():
+    async def main():
+        metrics = runtime.Metrics()
+        transport = MemoryTransport(lambda request: Reply(BODY, headers={"Cache-Control": "max-age=60"}))
+        client = sdk.ExampleClientAsync(transport=transport, cache=runtime.ResponseCache(), metrics=metrics)
+        responses = []
+        for _ in range(3):
+            response = await client.fetch("GET", "/users/1", route="/users/{id}")
+            assert await response.json() == BODY
+            responses.append(response)
+        assert len(transport.requests) == 1
+        assert all("body" in response.metadata.timing for response in responses)
+        return metrics
+
+    [recorded] = series(asyncio.run(main()))
+    assert (recorded.requests, recorded.response_bytes) == (3, 3 * SIZE)
+
+
+def test_revalidated_response():
+    def handler(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return Reply(status=304, headers={"ETag": '"v1"', "Cache-Control": "no-cache"})
+        return Reply(BODY, headers={"ETag": '"v1"', "Cache-Control": "no-cache"})
+
+    async def main():
+        metrics = runtime.Metrics()
+        transport = MemoryTransport(handler)
+        client = sdk.ExampleClientAsync(transport=transport, cache=runtime.ResponseCache(), metrics=metrics)
+        for _ in range(2):
+            response = await client.fetch("GET", "/users/1", route="/users/{id}")
+            assert await response.read() == Reply(BODY).chunks[0]
+        assert len(transport.requests) == 2
+        return metrics
+
+    [recorded] = series(asyncio.run(main()))
+    assert recorded.requests == 2
+
+
+def test_single_flight_responses():
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        return Reply(BODY)
+
+    async def main():
+        metrics = runtime.Metrics()
+        transport = MemoryTransport(handler)
+        client = sdk.ExampleClientAsync(transport=transport, single_flight=True, metrics=metrics)
+
+        async def call():
+            response = await client.fetch("GET", "/users/1", route="/users/{id}")
+            return [chunk async for chunk in response]
+
+        results = await asyncio.gather(*[call() for _ in range(4)])
+        assert len(transport.requests) == 1
+        assert all(b"".join(chunks) == Reply(BODY).chunks[0] for chunks in results)
+        return metrics
+
+    [recorded] = series(asyncio.run(main()))
+    assert (recorded.requests, recorded.response_bytes) == (4, 4 * SIZE)
+
+
+def test_failed_request():
+    def handler(request):
+        raise runtime.TransportError("connection refused")
+
+    async def main():
+        metrics = runtime.Metrics()
+        client = sdk.ExampleClientAsync(
+            transport=MemoryTransport(handler), retry=runtime.RetryPolicy(max_attempts=1), metrics=metrics
+        )
+        try:
+            await client.fetch("GET", "/users/1", route="/users/{id}")
+        except runtime.TransportError:
+            pass
+        return metrics
+
+    [recorded] = series(asyncio.run(main()))
+    assert (recorded.status, recorded.requests) == ("error", 1)
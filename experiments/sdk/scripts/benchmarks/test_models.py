@@ -0,0 +1,69 @@
+"""
+Checks the generated Dub models round trip links the way getLinks returns them.
+
+    python -m pytest scripts/benchmarks
+"""
+import pytest
+
+from models import load_types, make_page
+
+STYLES = ["dataclasses", "slots", "msgspec"]
+
+
+def link_payload(module) -> dict:
+    return module.encode(make_page(module, 1))[0]
+
+
+@pytest.mark.parametrize("style", STYLES)
+def test_decode_null_geo(style):
+    module = load_types(style)
+    payload = link_payload(module)
+    payload["geo"] = None
+
+    link = module.decode(module.Link, payload)
+
+    assert link.geo is None
+    assert link.tags[0].name == "docs"
+
+
+@pytest.mark.parametrize("style", STYLES)
+def test_decode_null_nested_fields(style):
+    module = load_types(style)
+    payload = link_payload(module)
+    payload["tags"] = None
+
+    assert module.decode(module.Link, payload).tags is None
+    assert module.decode(module.Tag, {"color": None, "id": "tag_1", "name": "docs"}).color is None
+
+
+@pytest.mark.parametrize("style", STYLES)
+def test_decode_geo(style):
+    module = load_types(style)
+
+    link = module.decode(module.Link, link_payload(module))
+
+    assert link.geo.us == "https://example.com/us"
+    assert link.tags[0].color == module.Color.BLUE
+
+
+@pytest.mark.parametrize("style", STYLES)
+def test_encode_null_geo(style):
+    module = load_types(style)
+    page = make_page(module, 4)
+
+    payload = module.encode(page)
+
+    assert payload[0]["geo"]["US"] == "https://example.com/us"
+    assert payload[3]["geo"] is None
+    assert module.decode(module.Link, payload[3]) == page[3]
+
+
+@pytest.mark.parametrize("style", STYLES)
+def test_encode_models_in_dict(style):
+    module = load_types(style)
+    page = make_page(module, 1)
+
+    payload = module.encode({"links": page, "count": 1})
+
+    assert payload == {"links": module.encode(page), "count": 1}
+    assert payload["links"][0]["createdAt"] == "created_at-0"
@@ -0,0 +1,66 @@
+"""
+Checks multipart bodies send str values as text parts and file sources as streamed file parts.
+
+    python -m pytest scripts/benchmarks
+"""
+import asyncio
+import io
+from pathlib import Path
+
+from boilerplate import load_sdk
+from memory_transport import MemoryTransport, Reply, runtime
+
+sdk = load_sdk()
+
+
+def upload(multipart):
+    async def main():
+        transport = MemoryTransport(lambda request: Reply({}))
+        client = sdk.ExampleClientAsync(transport=transport)
+        await (await client.fetch("POST", "/upload", multipart=multipart)).read()
+        return transport.requests[0]
+
+    request = asyncio.run(main())
+    boundary = request.headers["Content-Type"].split("boundary=")[1]
+    parts = request.body.split(f"--{boundary}".encode())[1:-1]
+    # each part sits between the CRLF ending the boundary line and the one before the next boundary
+    return [part[2:-2].split(b"\r\n\r\n", 1) for part in parts]
+
+
+def test_text_and_file_parts(tmp_path: Path):
+    path = tmp_path / "avatar.png"
+    path.write_bytes(b"\x89PNG" * 1000)
+
+    parts = upload({"name": str(path), "count": 2, "public": True, "avatar": path, "skipped": None})
+
+    assert parts[0] == [b'Content-Disposition: form-data; name="name"', str(path).encode()]
+    assert parts[1][1] == b"2"
+    assert parts[2][1] == b"true"
+    assert b'name="avatar"; filename="avatar.png"' in parts[3][0]
+    assert parts[3][1] == b"\x89PNG" * 1000
+    assert len(parts) == 4
+
+
+def test_upload_file_sources(tmp_path: Path):
+    path = tmp_path / "report.csv"
+    path.write_bytes(b"a,b\n1,2\n")
+
+    async def chunks():
+        yield b"streamed "
+        yield b"body"
+
+    parts = upload(
+        {
+            "path": runtime.UploadFile(str(path), content_type="text/csv"),
+            "buffer": runtime.UploadFile(io.BytesIO(b"in memory"), filename="memory.txt"),
+            "bytes": b"raw",
+            "stream": chunks(),
+        }
+    )
+
+    assert b'filename="report.csv"\r\nContent-Type: text/csv' in parts[0][0]
+    assert parts[0][1] == b"a,b\n1,2\n"
+    assert b'filename="memory.txt"' in parts[1][0]
+    assert parts[1][1] == b"in memory"
+    assert parts[2][1] == b"raw"
+    assert parts[3][1] == b"streamed body"
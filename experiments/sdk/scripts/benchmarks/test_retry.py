@@ -0,0 +1,115 @@
+"""
+Checks which failed requests fetch retries, how long it waits and how the retry budget caps retries.
+
+    python -m pytest scripts/benchmarks
+"""
+import asyncio
+
+from boilerplate import load_sdk
+from memory_transport import MemoryTransport, Reply, runtime
+
+sdk = load_sdk()
+
+
+def replies(*outcomes):
+    """Handler answering with each outcome in turn, a Reply or an exception to raise, then with 200"""
+    remaining = list(outcomes)
+
+    def handler(request):
+        outcome = remaining.pop(0) if remaining else Reply({"ok": True})
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    return MemoryTransport(handler)
+
+
+def fetch(transport, method="GET", retry=None, **kwargs):
+    retry = retry or runtime.RetryPolicy(base_delay=0.001)
+
+    async def main():
+        client = sdk.ExampleClientAsync(transport=transport, retry=retry)
+        response = await client.fetch(method, "/users/1", **kwargs)
+        await response.read()
+        return response
+
+    return asyncio.run(main()), retry
+
+
+def test_retries_statuses_and_connection_errors():
+    transport = replies(Reply(status=503), runtime.TransportError("connection reset"))
+
+    response, retry = fetch(transport)
+
+    assert (response.status, response.attempts) == (200, 3)
+    assert retry.stats.reasons == {503: 1, "TransportError": 1}
+    # the failed response was released before the retry
+    assert transport.released == 2
+
+
+def test_gives_up_after_max_attempts():
+    transport = replies(*[Reply(status=500)] * 5)
+
+    response, retry = fetch(transport, retry=runtime.RetryPolicy(max_attempts=2, base_delay=0.001))
+
+    assert (response.status, response.attempts) == (500, 2)
+    assert (retry.stats.retries, retry.stats.gave_up) == (1, 1)
+
+
+def test_other_statuses_are_returned():
+    response, retry = fetch(replies(Reply(status=404)))
+
+    assert (response.status, response.attempts, retry.stats.retries) == (404, 1, 0)
+
+
+def test_non_idempotent_methods_need_an_idempotency_key():
+    response, _ = fetch(replies(Reply(status=503)), method="POST", body={})
+    assert response.status == 503
+
+    response, _ = fetch(replies(Reply(status=503)), method="POST", body={}, headers={"Idempotency-Key": "k1"})
+    assert (response.status, response.attempts) == (200, 2)
+
+
+def test_streamed_bodies_are_not_retried():
+    async def chunks():
+        yield b"{}"
+
+    response, _ = fetch(replies(Reply(status=503)), method="PUT", body=runtime.NDJSONStream(chunks()))
+
+    assert (response.status, response.attempts) == (503, 1)
+
+
+def test_retry_after():
+    waits = []
+    retry = runtime.RetryPolicy(on_retry=lambda method, url, attempt, delay, reason: waits.append(delay))
+
+    fetch(replies(Reply(status=429, headers={"Retry-After": "0"})), retry=retry)
+    response, _ = fetch(replies(Reply(status=429, headers={"Retry-After": "3600"})), retry=retry)
+
+    assert waits == [0.0]
+    # asking to wait longer than max_retry_after returns the response
+    assert response.status == 429
+
+
+def test_budget_caps_retries():
+    retry = runtime.RetryPolicy(base_delay=0.001, budget=runtime.RetryBudget(ratio=0.5, max_tokens=1))
+
+    for _ in range(3):
+        fetch(replies(Reply(status=503)), retry=retry)
+
+    # the first retry spends the initial token, every request then adds half a token
+    assert (retry.stats.retries, retry.stats.budget_exhausted) == (2, 1)
+
+
+def test_backoff_is_bounded():
+    retry = runtime.RetryPolicy(base_delay=0.1, max_delay=0.3)
+
+    assert all(0 <= retry.backoff(1) <= 0.1 for _ in range(100))
+    assert all(0 <= retry.backoff(5) <= 0.3 for _ in range(100))
+
+
+def test_parse_retry_after():
+    assert runtime.parse_retry_after("12") == 12.0
+    assert runtime.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert runtime.parse_retry_after("soon") is None
+    assert runtime.parse_retry_after(None) is None
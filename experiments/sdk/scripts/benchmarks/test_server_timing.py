@@ -0,0 +1,101 @@
+"""
+Checks parse_server_timing reads the Server-Timing headers spiceflow sends and ResponseMetadata reaches callers
+through with_response and capture_responses.
+
+    python -m pytest scripts/benchmarks
+"""
+import asyncio
+
+import pytest
+
+from boilerplate import load_sdk
+from memory_transport import MemoryTransport, Reply, runtime
+
+sdk = load_sdk()
+
+
+def parsed(value):
+    return [(entry.name, entry.duration, entry.description) for entry in runtime.parse_server_timing(value)]
+
+
+def test_metric_with_duration_and_description():
+    [entry] = runtime.parse_server_timing('handler;dur=12.5;desc="GET /users/:id"')
+    assert (entry.name, entry.duration, entry.description) == ("handler", 0.0125, "GET /users/:id")
+    assert entry.params == {"dur": "12.5", "desc": "GET /users/:id"}
+
+
+def test_several_metrics():
+    assert parsed("db;dur=3, cache;desc=hit, total;dur=10") == [
+        ("db", 0.003, None),
+        ("cache", None, "hit"),
+        ("total", 0.01, None),
+    ]
+
+
+def test_quoted_descriptions_keep_separators_and_escapes():
+    assert parsed('render;desc="a;b, c";dur=2, query;desc="say \\"hi\\""') == [
+        ("render", 0.002, "a;b, c"),
+        ("query", None, 'say "hi"'),
+    ]
+
+
+def test_metric_without_duration():
+    assert parsed("miss") == [("miss", None, None)]
+    assert parsed("miss;dur=") == [("miss", None, None)]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("", []),
+        (" , ;dur=1,", []),
+        ("db;dur=fast", [("db", None, None)]),
+        ('db;desc="unterminated', [("db", None, "unterminated")]),
+        ("db junk;dur=1, total;dur=4", [("db", None, None), ("total", 0.004, None)]),
+        ("db;DUR=5;dur=6", [("db", 0.005, None)]),
+    ],
+)
+def test_malformed_metrics(value, expected):
+    assert parsed(value) == expected
+
+
+def test_with_response_round_trip():
+    def handler(request):
+        reply = Reply({"id": "user_1"}, headers={"X-Request-Id": "req_1", "Server-Timing": "db;dur=4"})
+        # spiceflow sends one Server-Timing header per span, repeated headers are all read
+        reply.headers.add("Server-Timing", 'handler;dur=20;desc="GET /users/:id"')
+        return reply
+
+    class UsersClient(sdk.ExampleClientAsync):
+        async def get_user(self, id: str) -> dict:
+            response = await self.fetch("GET", f"/users/{id}", route="/users/{id}")
+            return await response.json()
+
+    async def main():
+        client = UsersClient(transport=MemoryTransport(handler))
+        user, response = await client.with_response(client.get_user, "1")
+        assert user == {"id": "user_1"}
+        assert (response.method, response.route, response.status) == ("GET", "/users/{id}", 200)
+        assert response.request_id == "req_1"
+        assert [(entry.name, entry.duration) for entry in response.server_timing] == [
+            ("db", 0.004),
+            ("handler", 0.02),
+        ]
+        assert response.server_duration == 0.02
+        assert response.network_duration == max(0.0, response.timing["headers"] - 0.02)
+        assert set(response.timing) == {"headers", "body", "decode"}
+
+        with runtime.capture_responses() as outer:
+            with runtime.capture_responses() as inner:
+                await client.get_user("1")
+            await client.get_user("2")
+        assert [metadata.url.rsplit("/", 1)[1] for metadata in inner] == ["1"]
+        assert [metadata.url.rsplit("/", 1)[1] for metadata in outer] == ["1", "2"]
+
+        # calls that send no request have no metadata
+        async def no_request():
+            return 1
+
+        assert await client.with_response(no_request) == (1, None)
+
+    asyncio.run(main())
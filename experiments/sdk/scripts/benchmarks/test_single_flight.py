@@ -0,0 +1,145 @@
+"""
+Checks concurrent identical GET requests share one request, and streamed calls never do.
+
+    python -m pytest scripts/benchmarks
+"""
+import asyncio
+import io
+import time
+
+from boilerplate import load_sdk
+from memory_transport import MemoryTransport, Reply, runtime
+
+sdk = load_sdk()
+
+BODY = {"id": "user_1"}
+
+
+def slow_transport(reply=lambda request: Reply(BODY)):
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        return reply(request)
+
+    return MemoryTransport(handler)
+
+
+def test_concurrent_calls_share_one_request():
+    async def main():
+        transport = slow_transport()
+        client = sdk.ExampleClientAsync(transport=transport, single_flight=True)
+
+        async def call(path):
+            return await (await client.fetch("GET", path)).json()
+
+        results = await asyncio.gather(*[call("/users/1") for _ in range(5)], call("/users/2"))
+        assert results == [BODY] * 6
+        assert sorted(request.url for request in transport.requests) == [
+            "http://localhost:3000/users/1",
+            "http://localhost:3000/users/2",
+        ]
+        assert (client.single_flight.requests, client.single_flight.shared) == (2, 4)
+        # the next call starts a new request once the first one completed
+        await call("/users/1")
+        assert len(transport.requests) == 3
+
+    asyncio.run(main())
+
+
+def test_requests_with_a_body_are_not_shared():
+    async def main():
+        transport = slow_transport()
+        client = sdk.ExampleClientAsync(transport=transport, single_flight=True)
+        await asyncio.gather(*[client.fetch("POST", "/users", body={"name": "Ada"}) for _ in range(3)])
+        assert len(transport.requests) == 3
+
+    asyncio.run(main())
+
+
+def test_cancelled_caller_does_not_cancel_the_others():
+    async def main():
+        transport = slow_transport()
+        client = sdk.ExampleClientAsync(transport=transport, single_flight=True)
+        first = asyncio.ensure_future(client.fetch("GET", "/users/1"))
+        second = asyncio.ensure_future(client.fetch("GET", "/users/1"))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await (await second).json() == BODY
+        assert first.cancelled()
+        assert len(transport.requests) == 1
+
+    asyncio.run(main())
+
+
+def test_errors_reach_every_caller():
+    async def main():
+        def fail(request):
+            raise runtime.TransportError("connection reset")
+
+        client = sdk.ExampleClientAsync(
+            transport=slow_transport(fail), single_flight=True, retry=runtime.RetryPolicy(max_attempts=1)
+        )
+        results = await asyncio.gather(*[client.fetch("GET", "/users/1") for _ in range(3)], return_exceptions=True)
+        assert all(isinstance(result, runtime.TransportError) for result in results)
+
+    asyncio.run(main())
+
+
+def test_stalled_body_fails_every_caller():
+    async def main():
+        transport = slow_transport(lambda request: Reply([b"{}", b"{}"], chunk_delay=2.0))
+        client = sdk.ExampleClientAsync(
+            transport=transport, single_flight=True, timeout=runtime.Timeout(read_idle=0.05)
+        )
+        started = time.monotonic()
+        results = await asyncio.gather(*[client.fetch("GET", "/users/1") for _ in range(3)], return_exceptions=True)
+        assert all(isinstance(result, asyncio.TimeoutError) for result in results)
+        assert time.monotonic() - started < 1.0
+        assert len(transport.requests) == 1
+
+    asyncio.run(main())
+
+
+def test_callers_stop_waiting_at_their_own_deadline():
+    async def main():
+        transport = slow_transport(lambda request: Reply([b"{}"], chunk_delay=0.2))
+        client = sdk.ExampleClientAsync(transport=transport, single_flight=True)
+
+        async def impatient():
+            await asyncio.sleep(0.001)
+            with runtime.Deadline(0.05):
+                return await client.fetch("GET", "/users/1")
+
+        leader, follower = await asyncio.gather(
+            client.fetch("GET", "/users/1"), impatient(), return_exceptions=True
+        )
+        assert isinstance(follower, runtime.DeadlineExceeded)
+        # the request the follower joined keeps going for the caller that started it
+        assert await leader.json() == {}
+        assert (client.single_flight.requests, client.single_flight.shared) == (1, 1)
+
+    asyncio.run(main())
+
+
+def test_streamed_calls_skip_single_flight():
+    chunks = [b"x" * 1024] * 64
+
+    async def main():
+        transport = slow_transport(lambda request: Reply(chunks, headers={"Content-Type": "application/octet-stream"}))
+        client = sdk.ExampleClientAsync(transport=transport, single_flight=True)
+
+        async def stream():
+            async with client.stream("GET", "/export") as response:
+                return [len(chunk) async for chunk in response.iter_chunks()]
+
+        async def download():
+            target = io.BytesIO()
+            return await client.download("GET", "/export", target)
+
+        streamed, downloaded = await asyncio.gather(stream(), download())
+        # chunks arrive as the transport sends them instead of as one buffered body
+        assert streamed == [1024] * 64
+        assert downloaded == 64 * 1024
+        assert len(transport.requests) == 2
+        assert client.single_flight.requests == 0
+
+    asyncio.run(main())
@@ -0,0 +1,113 @@
+"""
+Checks SSEParser against the WHATWG event stream rules for every way a stream can be split into chunks, and
+stream_sse_response decodes events and releases the response.
+
+    python -m pytest scripts/benchmarks
+"""
+import asyncio
+
+import pytest
+
+from memory_transport import MemoryTransport, Reply, runtime
+
+STREAM = (
+    b'event: message\ndata: {"count":1}\n\n'
+    b": comment\nid: 7\ndata: first\ndata: second\n\n"
+    b"event: ping\n\n"
+    b"data: last\n\n"
+)
+EXPECTED = [
+    ("message", '{"count":1}', None),
+    ("message", "first\nsecond", "7"),
+    ("message", "last", "7"),
+]
+
+
+def parse(chunks):
+    parser = runtime.SSEParser()
+    return [(event.event, event.data, event.id) for chunk in chunks for event in parser.feed(chunk)]
+
+
+def split(data: bytes, size: int):
+    return [data[start : start + size] for start in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("ending", [b"\n", b"\r\n", b"\r"], ids=["lf", "crlf", "cr"])
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 4096])
+def test_line_endings_and_chunk_sizes(ending, size):
+    assert parse(split(STREAM.replace(b"\n", ending), size)) == EXPECTED
+
+
+def test_cr_ending_dispatches_without_the_next_chunk():
+    parser = runtime.SSEParser()
+
+    assert [event.data for event in parser.feed(b"data: first\r\r")] == ["first"]
+    assert [event.data for event in parser.feed(b"data: second\r\r")] == ["second"]
+
+
+def test_crlf_split_between_chunks():
+    parser = runtime.SSEParser()
+
+    assert [event.data for event in parser.feed(b"data: first\r\n\r")] == ["first"]
+    # the LF ending the CRLF split above is not an extra blank line
+    assert parser.feed(b"\ndata: second\r") == []
+    assert [event.data for event in parser.feed(b"\n\r\n")] == ["second"]
+
+
+def test_byte_order_mark_and_retry():
+    parser = runtime.SSEParser()
+
+    [event] = parser.feed(b"\xef\xbb\xbfretry: 3000\ndata: hello\n\n")
+
+    assert (event.data, event.retry, parser.retry) == ("hello", 3000, 3000)
+
+
+def test_event_without_data_is_not_dispatched():
+    assert parse([b"event: ping\nid: 1\n\n"]) == []
+
+
+def sse_transport(*events: bytes):
+    return MemoryTransport(lambda request: Reply(list(events), headers={"Content-Type": "text/event-stream"}))
+
+
+async def sse_response(transport):
+    client = runtime.BaseClientAsync("http://localhost:3000", transport=transport)
+    return await client.fetch("GET", "/events", stream=True)
+
+
+def test_stream_sse_response_decodes_json():
+    async def main():
+        transport = sse_transport(b'data: {"count":1}\n\n', b"data: done\n\n")
+        response = await sse_response(transport)
+        assert [data async for data in runtime.stream_sse_response(response)] == [{"count": 1}, "done"]
+        assert transport.released == 1
+
+    asyncio.run(main())
+
+
+def test_error_event_raises_and_releases_the_response():
+    async def main():
+        transport = sse_transport(
+            b'data: {"count":1}\n\n', b'event: error\ndata: {"message":"boom"}\n\n', b"data: 2\n\n"
+        )
+        response = await sse_response(transport)
+        received = []
+        with pytest.raises(runtime.ExampleError) as error:
+            async for data in runtime.stream_sse_response(response):
+                received.append(data)
+        assert (received, str(error.value), error.value.data) == ([{"count": 1}], "boom", {"message": "boom"})
+        assert transport.released == 1
+
+    asyncio.run(main())
+
+
+def test_stopping_early_releases_the_response():
+    async def main():
+        transport = sse_transport(b"data: 1\n\n", b"data: 2\n\n")
+        events = runtime.stream_sse_response(await sse_response(transport))
+        async for _ in events:
+            break
+        await events.aclose()
+        assert transport.released == 1
+
+    asyncio.run(main())
@@ -0,0 +1,163 @@
+"""
+Checks the sync client drives the async route methods on BlockingTransport against a local HTTP server.
+
+    python -m pytest scripts/benchmarks
+"""
+import asyncio
+import http.server
+import json
+import threading
+import time
+
+import pytest
+
+from boilerplate import load_sdk
+from memory_transport import runtime
+
+sdk = load_sdk()
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # connections opened by the server, a reused keep-alive connection does not open another one
+    connections = 0
+
+    def setup(self):
+        super().setup()
+        Handler.connections += 1
+
+    def do_GET(self):
+        if self.path == "/users/1":
+            self.reply(200, json.dumps({"id": "user_1"}).encode())
+        elif self.path.startswith("/users/slow_"):
+            time.sleep(0.2)
+            self.reply(200, json.dumps({"id": self.path.rsplit("/", 1)[1]}).encode())
+        elif self.path == "/export":
+            self.reply(200, b"x" * 200000, content_type="application/octet-stream")
+        elif self.path == "/slow":
+            # each chunk arrives well within the idle timeout, the whole body takes 1 second
+            self.send_response(200)
+            self.send_header("Content-Length", "20")
+            self.end_headers()
+            for _ in range(20):
+                self.wfile.write(b"x")
+                self.wfile.flush()
+                time.sleep(0.05)
+        else:
+            self.reply(404, json.dumps({"message": "not found"}).encode())
+
+    def reply(self, status, body, content_type="application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class UsersClient(sdk.ExampleClientAsync):
+    async def get_user(self, id: str) -> dict:
+        response = await self.fetch("GET", f"/users/{id}", route="/users/{id}")
+        if response.status >= 400:
+            raise sdk.ExampleError((await response.json())["message"], status=response.status)
+        return await response.json()
+
+    async def get_user_later(self, id: str) -> dict:
+        await asyncio.sleep(0.01)
+        return await self.get_user(id)
+
+
+class UsersClientSync(sdk.ExampleClientSync):
+    client_class = UsersClient
+
+
+runtime.add_sync_methods(UsersClientSync, UsersClient)
+
+
+def test_route_methods_block_and_reuse_connections(base_url):
+    with UsersClientSync(base_url) as client:
+        connections = Handler.connections
+        assert [client.get_user("1") for _ in range(3)] == [{"id": "user_1"}] * 3
+        assert Handler.connections == connections + 1
+        # plain attributes come from the wrapped async client
+        assert client.base_url == base_url
+
+
+def test_errors(base_url):
+    with UsersClientSync(base_url) as client:
+        with pytest.raises(sdk.ExampleError) as error:
+            client.get_user("2")
+        assert (str(error.value), error.value.status) == ("not found", 404)
+        # route methods awaiting anything but the transport need the async client
+        with pytest.raises(RuntimeError):
+            client.get_user_later("1")
+    with UsersClientSync("http://127.0.0.1:9", retry=runtime.RetryPolicy(max_attempts=1)) as client:
+        with pytest.raises(runtime.TransportError):
+            client.get_user("1")
+
+
+def test_stream(base_url):
+    with UsersClientSync(base_url) as client:
+        with client.stream("GET", "/export") as response:
+            assert (response.status, response.content_type) == (200, "application/octet-stream")
+            sizes = [len(chunk) for chunk in response.iter_chunks(chunk_size=65536)]
+        assert sum(sizes) == 200000
+        assert max(sizes) == 65536
+        with client.stream("GET", "/users/1") as response:
+            assert response.json() == {"id": "user_1"}
+
+
+def test_deadline_bounds_the_body(base_url):
+    with UsersClientSync(base_url) as client:
+        started = time.monotonic()
+        with runtime.Deadline(0.2):
+            with client.stream("GET", "/slow") as response:
+                with pytest.raises(runtime.DeadlineExceeded):
+                    response.read()
+        assert time.monotonic() - started < 0.5
+        with client.stream("GET", "/slow", timeout=runtime.Timeout(total=0.2)) as response:
+            with pytest.raises(runtime.DeadlineExceeded):
+                response.read()
+
+
+def test_missing_client_is_an_attribute_error():
+    client = UsersClientSync.__new__(UsersClientSync)
+    assert not hasattr(client, "base_url")
+
+
+def test_map_runs_blocking_calls_concurrently_in_order(base_url):
+    with UsersClientSync(base_url) as client:
+        started = time.monotonic()
+        results = list(client.map(client.get_user, ["slow_1", "2", "slow_3", "slow_4"], concurrency=4))
+        assert time.monotonic() - started < 0.6
+        assert [result.value for result in results] == [{"id": "slow_1"}, None, {"id": "slow_3"}, {"id": "slow_4"}]
+        assert str(results[1].error) == "not found"
+        # calls run in threads that still see the deadline of the caller
+        with runtime.Deadline(0.1):
+            results = list(client.map(client.get_user, ["slow_1", "1"], concurrency=2))
+        assert isinstance(results[0].error, runtime.DeadlineExceeded)
+        assert results[1].value == {"id": "user_1"}
+        with pytest.raises(ValueError):
+            list(client.map(client.get_user, ["1"], concurrency=0))
+
+
+def test_map_threads_share_the_cache(base_url):
+    cache = runtime.ResponseCache(default_ttl=60)
+    with UsersClientSync(base_url, cache=cache) as client:
+        results = list(client.map(client.get_user, ["1"] * 50, concurrency=8))
+        assert all(result.value == {"id": "user_1"} for result in results)
+        assert cache.hits + cache.misses == 50
+        assert len(cache) == 1
@@ -0,0 +1,148 @@
+"""
+Checks Timeout and Deadline bound every phase of a call through fetch, including its retries and body reads.
+
+    python -m pytest scripts/benchmarks
+"""
+import asyncio
+import time
+
+import pytest
+
+from boilerplate import load_sdk
+from memory_transport import MemoryTransport, Reply, runtime
+
+sdk = load_sdk()
+
+
+def client(handler, **options):
+    transport = MemoryTransport(handler)
+    options.setdefault("retry", runtime.RetryPolicy(max_attempts=1))
+    return sdk.ExampleClientAsync(transport=transport, **options), transport
+
+
+async def get(client, **kwargs):
+    return await (await client.fetch("GET", "/users/1", **kwargs)).read()
+
+
+def test_ttfb_timeout_is_retried():
+    async def main():
+        replies = [Reply({}, delay=1.0), Reply({"ok": True})]
+        api, transport = client(
+            lambda request: replies.pop(0),
+            retry=runtime.RetryPolicy(base_delay=0.001),
+            timeout=runtime.Timeout(ttfb=0.02),
+        )
+        assert await get(api) == b'{"ok": true}'
+        assert len(transport.requests) == 2
+
+    asyncio.run(main())
+
+
+def test_read_idle_timeout():
+    async def main():
+        api, _ = client(lambda request: Reply([b"a", b"b"], chunk_delay=0.05))
+        with pytest.raises(asyncio.TimeoutError):
+            await get(api, timeout=runtime.Timeout(read_idle=0.02))
+        assert await get(api, timeout=runtime.Timeout(read_idle=0.2)) == b"ab"
+
+    asyncio.run(main())
+
+
+def test_total_timeout_covers_the_body():
+    async def main():
+        api, _ = client(lambda request: Reply([b"a"] * 5, chunk_delay=0.01))
+        with pytest.raises(runtime.DeadlineExceeded):
+            await get(api, timeout=runtime.Timeout(read_idle=1.0, total=0.03))
+
+    asyncio.run(main())
+
+
+def test_timeout_block_applies_to_every_call():
+    async def main():
+        api, _ = client(lambda request: Reply({}, delay=0.05))
+        with runtime.Timeout(ttfb=0.01):
+            with pytest.raises(asyncio.TimeoutError):
+                await get(api)
+        assert runtime.Timeout.current() is None
+        await get(api)
+
+    asyncio.run(main())
+
+
+def test_deadline_is_shared_by_retries():
+    async def main():
+        api, transport = client(
+            lambda request: Reply(status=503, delay=0.02),
+            retry=runtime.RetryPolicy(max_attempts=10, base_delay=0.001),
+        )
+        started = time.monotonic()
+        with runtime.Deadline(0.05):
+            with pytest.raises(asyncio.TimeoutError):
+                await get(api)
+        assert time.monotonic() - started < 0.2
+        assert 1 < len(transport.requests) < 10
+
+    asyncio.run(main())
+
+
+def test_retry_backoff_past_the_deadline_is_not_waited():
+    async def main():
+        api, transport = client(
+            lambda request: Reply(status=503, headers={"Retry-After": "5"}),
+            retry=runtime.RetryPolicy(max_attempts=3),
+        )
+        with runtime.Deadline(1.0):
+            response = await api.fetch("GET", "/users/1")
+        assert response.status == 503
+        assert len(transport.requests) == 1
+
+    asyncio.run(main())
+
+
+def test_expired_deadline_sends_nothing():
+    async def main():
+        api, transport = client(lambda request: Reply({}))
+        with runtime.Deadline(0):
+            with pytest.raises(runtime.DeadlineExceeded):
+                await api.fetch("GET", "/users/1")
+        assert transport.requests == []
+
+    asyncio.run(main())
+
+
+def test_nested_deadlines_only_shorten():
+    with runtime.Deadline(0.1) as outer:
+        with runtime.Deadline(10) as inner:
+            assert inner.expires_at == outer.expires_at
+            assert runtime.Deadline.current() is inner
+        with runtime.Deadline(0.01) as shorter:
+            assert shorter.expires_at < outer.expires_at
+        assert runtime.Deadline.current() is outer
+    assert runtime.Deadline.current() is None
+
+
+def test_cancelling_the_caller_is_not_a_timeout():
+    async def main():
+        api, _ = client(lambda request: Reply({}, delay=1.0), timeout=runtime.Timeout(ttfb=5.0))
+        call = asyncio.ensure_future(get(api))
+        await asyncio.sleep(0.01)
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+
+    asyncio.run(main())
+
+
+def test_single_flight_bodies_are_timed_out():
+    async def main():
+        api, transport = client(lambda request: Reply([b"a", b"b"], chunk_delay=2.0), single_flight=True)
+        started = time.monotonic()
+        with pytest.raises(asyncio.TimeoutError):
+            await get(api, timeout=runtime.Timeout(read_idle=0.05))
+        with runtime.Deadline(0.1):
+            with pytest.raises(runtime.DeadlineExceeded):
+                await get(api)
+        assert time.monotonic() - started < 1.0
+        assert len(transport.requests) == 2
+
+    asyncio.run(main())
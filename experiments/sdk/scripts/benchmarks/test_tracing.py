@@ -0,0 +1,106 @@
+"""
+Checks every transport reports the spans of a request in order against a local HTTP server, request_write
+lasting until the whole body was sent.
+
+    python -m pytest scripts/benchmarks
+"""
+import asyncio
+import http.server
+import json
+import threading
+import time
+
+import pytest
+
+from boilerplate import load_sdk
+from memory_transport import runtime
+
+sdk = load_sdk()
+
+# the server waits before reading the upload, the client blocks writing it once the socket buffers are full
+READ_DELAY = 0.1
+RECORDS = ["x" * 65536] * 128
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        time.sleep(READ_DELAY)
+        size = 0
+        while True:
+            chunk_size = int(self.rfile.readline(), 16)
+            size += len(self.rfile.read(chunk_size))
+            self.rfile.readline()
+            if chunk_size == 0:
+                break
+        body = json.dumps({"size": size}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+async def upload(client):
+    # NDJSONStream sends the records as a chunked body in chunks of about 64KB
+    response = await client.fetch("POST", "/upload", body=runtime.NDJSONStream(RECORDS))
+    assert (await response.json())["size"] > 128 * 65536
+
+
+def check(traces):
+    first, second = traces
+    assert [span.name for span in first.spans] == ["connect", "request_write", "ttfb", "body", "decode"]
+    # the second request reuses the keep-alive connection
+    assert [span.name for span in second.spans] == ["request_write", "ttfb", "body", "decode"]
+    for trace in traces:
+        assert all(span.end_ns <= next_span.start_ns for span, next_span in zip(trace.spans, trace.spans[1:]))
+        assert trace.span("request_write").duration >= READ_DELAY / 2
+        assert trace.span("ttfb").duration < READ_DELAY / 2
+
+
+def run_async(base_url, transport):
+    traces = []
+
+    async def main():
+        client = sdk.ExampleClientAsync(base_url, transport=transport(), tracer=traces.append)
+        for _ in range(2):
+            await upload(client)
+        await client.aclose()
+
+    asyncio.run(main())
+    check(traces)
+
+
+def test_aiohttp_spans(base_url):
+    run_async(base_url, lambda: runtime.AiohttpTransport(tracing=True))
+
+
+def test_httpx_spans(base_url):
+    run_async(base_url, runtime.HttpxTransport)
+
+
+def test_asyncio_spans(base_url):
+    run_async(base_url, runtime.AsyncioTransport)
+
+
+def test_blocking_spans(base_url):
+    traces = []
+    with sdk.ExampleClientSync(base_url, tracer=traces.append) as client:
+        for _ in range(2):
+            runtime.run_sync(upload(client._client))
+    check(traces)
@@ -0,0 +1,121 @@
+"""
+Checks AsyncioTransport and HttpxTransport against a raw HTTP/1.1 server: chunked bodies, keep-alive reuse,
+Connection: close and bodies cut short by the server.
+
+    python -m pytest scripts/benchmarks
+"""
+import asyncio
+
+import pytest
+
+from boilerplate import load_sdk
+from memory_transport import runtime
+
+sdk = load_sdk()
+
+USER = b'{"id": "user_1"}'
+# bytes the server writes for each path, the ones in CLOSING are followed by closing the connection
+RESPONSES = {
+    "/users/1": b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: 16\r\n\r\n" + USER,
+    "/chunked": b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n5;ext=1\r\nhello\r\n6\r\n world\r\n0\r\n\r\n",
+    "/close": b"HTTP/1.1 200 OK\r\nConnection: close\r\nContent-Length: 5\r\n\r\nclose",
+    "/until-eof": b"HTTP/1.1 200 OK\r\nConnection: close\r\n\r\nread until eof",
+    "/dropped": b"HTTP/1.1 200 OK\r\nContent-Length: 7\r\n\r\ndropped",
+    "/truncated": b"HTTP/1.1 200 OK\r\nContent-Length: 100\r\n\r\nonly 10 by",
+    "/truncated-chunked": b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\na\r\nonly",
+}
+CLOSING = {"/close", "/until-eof", "/dropped", "/truncated", "/truncated-chunked"}
+
+TRANSPORTS = {
+    "asyncio": lambda: runtime.AsyncioTransport(),
+    "httpx": lambda: runtime.HttpxTransport(),
+}
+
+
+class Server:
+    def __init__(self):
+        self.connections = 0
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                path = head.split(b" ", 2)[1].decode()
+                writer.write(RESPONSES[path])
+                await writer.drain()
+                if path in CLOSING:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        writer.close()
+
+
+def run(name, main):
+    async def serve():
+        server = Server()
+        listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        client = sdk.ExampleClientAsync(f"http://127.0.0.1:{port}", transport=TRANSPORTS[name]())
+        try:
+            await main(client, server)
+        finally:
+            await client.aclose()
+            listener.close()
+
+    asyncio.run(serve())
+
+
+async def read(client, path):
+    response = await client.fetch("GET", path, stream=True)
+    return await response.read()
+
+
+@pytest.fixture(params=list(TRANSPORTS))
+def transport(request):
+    return request.param
+
+
+def test_chunked_body(transport):
+    async def main(client, server):
+        assert await read(client, "/chunked") == b"hello world"
+        # the whole chunked body was read, the connection goes back to the pool
+        assert await read(client, "/users/1") == USER
+        assert server.connections == 1
+
+    run(transport, main)
+
+
+def test_keep_alive_reuse(transport):
+    async def main(client, server):
+        for _ in range(3):
+            assert await read(client, "/users/1") == USER
+        assert server.connections == 1
+
+    run(transport, main)
+
+
+def test_connection_close(transport):
+    async def main(client, server):
+        assert await read(client, "/close") == b"close"
+        assert await read(client, "/users/1") == USER
+        assert server.connections == 2
+        assert await read(client, "/until-eof") == b"read until eof"
+        # the server closed a connection it did not announce as closing, the next request opens another one
+        assert await read(client, "/dropped") == b"dropped"
+        await asyncio.sleep(0.01)
+        assert await read(client, "/users/1") == USER
+        assert server.connections == 4
+
+    run(transport, main)
+
+
+@pytest.mark.parametrize("path", ["/truncated", "/truncated-chunked"])
+def test_truncated_body(transport, path):
+    async def main(client, server):
+        with pytest.raises(runtime.TransportError):
+            await read(client, path)
+        assert await read(client, "/users/1") == USER
+        assert server.connections == 2
+
+    run(transport, main)
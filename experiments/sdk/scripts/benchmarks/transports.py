@@ -0,0 +1,97 @@
+"""
+Runs the same generated ExampleClientAsync route through every transport and prints requests per second.
+
+    python scripts/benchmarks/transports.py --requests 5000 --concurrency 50
+    python scripts/benchmarks/transports.py --url https://api.example.com  # use a real server
+
+Without --url a local aiohttp server is started in a subprocess. httpx only negotiates HTTP/2
+over TLS, so httpx-http2 behaves like HTTP/1.1 against the local server.
+"""
+import argparse
+import asyncio
+import multiprocessing
+import time
+
+from boilerplate import load_runtime, load_sdk
+
+runtime = load_runtime()
+sdk = load_sdk()
+Types = sdk.Types
+
+
+class BenchmarkClient(sdk.ExampleClientAsync):
+    # GET /v1/liveness, same shape as the method generated for the unkey schema
+    async def liveness(self) -> Types.V1LivenessResponseBody:
+        response = await self.fetch(method="GET", path="/v1/liveness")
+        if response.status == 200:
+            return self.decode(Types.V1LivenessResponseBody, await response.json())
+        raise sdk.ExampleError(
+            error=f"Unexpected status code: {response.status}",
+            status=response.status,
+            data=await response.text(),
+        )
+
+
+def serve(port: int) -> None:
+    from aiohttp import web
+
+    async def liveness(request: web.Request) -> web.Response:
+        return web.json_response({"message": "OK", "$schema": "https://example.com/schema.json"})
+
+    app = web.Application()
+    app.router.add_get("/v1/liveness", liveness)
+    web.run_app(app, host="127.0.0.1", port=port, print=None, access_log=None)
+
+
+TRANSPORTS = {
+    "aiohttp": lambda: runtime.AiohttpTransport(),
+    "httpx-http1": lambda: runtime.HttpxTransport(),
+    "httpx-http2": lambda: runtime.HttpxTransport(http2=True),
+    "asyncio": lambda: runtime.AsyncioTransport(),
+}
+
+
+async def run(name: str, url: str, requests: int, concurrency: int) -> None:
+    async with BenchmarkClient(url, transport=TRANSPORTS[name]()) as client:
+        await client.liveness()  # warm up the pool
+        remaining = requests
+
+        async def worker() -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                await client.liveness()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    print(f"{name:<12} {requests / elapsed:>10.0f} req/s  {elapsed / requests * 1e6:>8.1f} us/req")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url")
+    parser.add_argument("--port", type=int, default=7755)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--transports", default=",".join(TRANSPORTS))
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        server = multiprocessing.Process(target=serve, args=(args.port,), daemon=True)
+        server.start()
+        time.sleep(1)
+        url = f"http://127.0.0.1:{args.port}"
+
+    try:
+        for name in args.transports.split(","):
+            asyncio.run(run(name, url, args.requests, args.concurrency))
+    finally:
+        if server is not None:
+            server.terminate()
+
+
+if __name__ == "__main__":
+    main()
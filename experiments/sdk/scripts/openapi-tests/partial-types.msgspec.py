@@ -0,0 +1,703 @@
+import msgspec
+from typing import Optional, List, Any, Callable, Dict, Tuple, Type, TypeVar
+from enum import Enum
+
+
+class LinkGeoTargeting(msgspec.Struct, kw_only=True, omit_defaults=True):
+  """Geo targeting information for the short link in JSON format `{[COUNTRY]:
+  https://example.com }`.
+  """
+  ad: Optional[str] = msgspec.field(default=None, name="AD")
+  ae: Optional[str] = msgspec.field(default=None, name="AE")
+  af: Optional[str] = msgspec.field(default=None, name="AF")
+  ag: Optional[str] = msgspec.field(default=None, name="AG")
+  ai: Optional[str] = msgspec.field(default=None, name="AI")
+  al: Optional[str] = msgspec.field(default=None, name="AL")
+  am: Optional[str] = msgspec.field(default=None, name="AM")
+  ao: Optional[str] = msgspec.field(default=None, name="AO")
+  aq: Optional[str] = msgspec.field(default=None, name="AQ")
+  ar: Optional[str] = msgspec.field(default=None, name="AR")
+  link_geo_targeting_as: Optional[str] = msgspec.field(default=None, name="AS")
+  at: Optional[str] = msgspec.field(default=None, name="AT")
+  au: Optional[str] = msgspec.field(default=None, name="AU")
+  aw: Optional[str] = msgspec.field(default=None, name="AW")
+  ax: Optional[str] = msgspec.field(default=None, name="AX")
+  az: Optional[str] = msgspec.field(default=None, name="AZ")
+  ba: Optional[str] = msgspec.field(default=None, name="BA")
+  bb: Optional[str] = msgspec.field(default=None, name="BB")
+  bd: Optional[str] = msgspec.field(default=None, name="BD")
+  be: Optional[str] = msgspec.field(default=None, name="BE")
+  bf: Optional[str] = msgspec.field(default=None, name="BF")
+  bg: Optional[str] = msgspec.field(default=None, name="BG")
+  bh: Optional[str] = msgspec.field(default=None, name="BH")
+  bi: Optional[str] = msgspec.field(default=None, name="BI")
+  bj: Optional[str] = msgspec.field(default=None, name="BJ")
+  bl: Optional[str] = msgspec.field(default=None, name="BL")
+  bm: Optional[str] = msgspec.field(default=None, name="BM")
+  bn: Optional[str] = msgspec.field(default=None, name="BN")
+  bo: Optional[str] = msgspec.field(default=None, name="BO")
+  bq: Optional[str] = msgspec.field(default=None, name="BQ")
+  br: Optional[str] = msgspec.field(default=None, name="BR")
+  bs: Optional[str] = msgspec.field(default=None, name="BS")
+  bt: Optional[str] = msgspec.field(default=None, name="BT")
+  bv: Optional[str] = msgspec.field(default=None, name="BV")
+  bw: Optional[str] = msgspec.field(default=None, name="BW")
+  by: Optional[str] = msgspec.field(default=None, name="BY")
+  bz: Optional[str] = msgspec.field(default=None, name="BZ")
+  ca: Optional[str] = msgspec.field(default=None, name="CA")
+  cc: Optional[str] = msgspec.field(default=None, name="CC")
+  cd: Optional[str] = msgspec.field(default=None, name="CD")
+  cf: Optional[str] = msgspec.field(default=None, name="CF")
+  cg: Optional[str] = msgspec.field(default=None, name="CG")
+  ch: Optional[str] = msgspec.field(default=None, name="CH")
+  ci: Optional[str] = msgspec.field(default=None, name="CI")
+  ck: Optional[str] = msgspec.field(default=None, name="CK")
+  cl: Optional[str] = msgspec.field(default=None, name="CL")
+  cm: Optional[str] = msgspec.field(default=None, name="CM")
+  cn: Optional[str] = msgspec.field(default=None, name="CN")
+  co: Optional[str] = msgspec.field(default=None, name="CO")
+  cr: Optional[str] = msgspec.field(default=None, name="CR")
+  cu: Optional[str] = msgspec.field(default=None, name="CU")
+  cv: Optional[str] = msgspec.field(default=None, name="CV")
+  cw: Optional[str] = msgspec.field(default=None, name="CW")
+  cx: Optional[str] = msgspec.field(default=None, name="CX")
+  cy: Optional[str] = msgspec.field(default=None, name="CY")
+  cz: Optional[str] = msgspec.field(default=None, name="CZ")
+  de: Optional[str] = msgspec.field(default=None, name="DE")
+  dj: Optional[str] = msgspec.field(default=None, name="DJ")
+  dk: Optional[str] = msgspec.field(default=None, name="DK")
+  dm: Optional[str] = msgspec.field(default=None, name="DM")
+  do: Optional[str] = msgspec.field(default=None, name="DO")
+  dz: Optional[str] = msgspec.field(default=None, name="DZ")
+  ec: Optional[str] = msgspec.field(default=None, name="EC")
+  ee: Optional[str] = msgspec.field(default=None, name="EE")
+  eg: Optional[str] = msgspec.field(default=None, name="EG")
+  eh: Optional[str] = msgspec.field(default=None, name="EH")
+  er: Optional[str] = msgspec.field(default=None, name="ER")
+  es: Optional[str] = msgspec.field(default=None, name="ES")
+  et: Optional[str] = msgspec.field(default=None, name="ET")
+  fi: Optional[str] = msgspec.field(default=None, name="FI")
+  fj: Optional[str] = msgspec.field(default=None, name="FJ")
+  fk: Optional[str] = msgspec.field(default=None, name="FK")
+  fm: Optional[str] = msgspec.field(default=None, name="FM")
+  fo: Optional[str] = msgspec.field(default=None, name="FO")
+  fr: Optional[str] = msgspec.field(default=None, name="FR")
+  ga: Optional[str] = msgspec.field(default=None, name="GA")
+  gb: Optional[str] = msgspec.field(default=None, name="GB")
+  gd: Optional[str] = msgspec.field(default=None, name="GD")
+  ge: Optional[str] = msgspec.field(default=None, name="GE")
+  gf: Optional[str] = msgspec.field(default=None, name="GF")
+  gg: Optional[str] = msgspec.field(default=None, name="GG")
+  gh: Optional[str] = msgspec.field(default=None, name="GH")
+  gi: Optional[str] = msgspec.field(default=None, name="GI")
+  gl: Optional[str] = msgspec.field(default=None, name="GL")
+  gm: Optional[str] = msgspec.field(default=None, name="GM")
+  gn: Optional[str] = msgspec.field(default=None, name="GN")
+  gp: Optional[str] = msgspec.field(default=None, name="GP")
+  gq: Optional[str] = msgspec.field(default=None, name="GQ")
+  gr: Optional[str] = msgspec.field(default=None, name="GR")
+  gs: Optional[str] = msgspec.field(default=None, name="GS")
+  gt: Optional[str] = msgspec.field(default=None, name="GT")
+  gu: Optional[str] = msgspec.field(default=None, name="GU")
+  gw: Optional[str] = msgspec.field(default=None, name="GW")
+  gy: Optional[str] = msgspec.field(default=None, name="GY")
+  hk: Optional[str] = msgspec.field(default=None, name="HK")
+  hm: Optional[str] = msgspec.field(default=None, name="HM")
+  hn: Optional[str] = msgspec.field(default=None, name="HN")
+  hr: Optional[str] = msgspec.field(default=None, name="HR")
+  ht: Optional[str] = msgspec.field(default=None, name="HT")
+  hu: Optional[str] = msgspec.field(default=None, name="HU")
+  id: Optional[str] = msgspec.field(default=None, name="ID")
+  ie: Optional[str] = msgspec.field(default=None, name="IE")
+  il: Optional[str] = msgspec.field(default=None, name="IL")
+  im: Optional[str] = msgspec.field(default=None, name="IM")
+  link_geo_targeting_in: Optional[str] = msgspec.field(default=None, name="IN")
+  io: Optional[str] = msgspec.field(default=None, name="IO")
+  iq: Optional[str] = msgspec.field(default=None, name="IQ")
+  ir: Optional[str] = msgspec.field(default=None, name="IR")
+  link_geo_targeting_is: Optional[str] = msgspec.field(default=None, name="IS")
+  it: Optional[str] = msgspec.field(default=None, name="IT")
+  je: Optional[str] = msgspec.field(default=None, name="JE")
+  jm: Optional[str] = msgspec.field(default=None, name="JM")
+  jo: Optional[str] = msgspec.field(default=None, name="JO")
+  jp: Optional[str] = msgspec.field(default=None, name="JP")
+  ke: Optional[str] = msgspec.field(default=None, name="KE")
+  kg: Optional[str] = msgspec.field(default=None, name="KG")
+  kh: Optional[str] = msgspec.field(default=None, name="KH")
+  ki: Optional[str] = msgspec.field(default=None, name="KI")
+  km: Optional[str] = msgspec.field(default=None, name="KM")
+  kn: Optional[str] = msgspec.field(default=None, name="KN")
+  kp: Optional[str] = msgspec.field(default=None, name="KP")
+  kr: Optional[str] = msgspec.field(default=None, name="KR")
+  kw: Optional[str] = msgspec.field(default=None, name="KW")
+  ky: Optional[str] = msgspec.field(default=None, name="KY")
+  kz: Optional[str] = msgspec.field(default=None, name="KZ")
+  la: Optional[str] = msgspec.field(default=None, name="LA")
+  lb: Optional[str] = msgspec.field(default=None, name="LB")
+  lc: Optional[str] = msgspec.field(default=None, name="LC")
+  li: Optional[str] = msgspec.field(default=None, name="LI")
+  lk: Optional[str] = msgspec.field(default=None, name="LK")
+  lr: Optional[str] = msgspec.field(default=None, name="LR")
+  ls: Optional[str] = msgspec.field(default=None, name="LS")
+  lt: Optional[str] = msgspec.field(default=None, name="LT")
+  lu: Optional[str] = msgspec.field(default=None, name="LU")
+  lv: Optional[str] = msgspec.field(default=None, name="LV")
+  ly: Optional[str] = msgspec.field(default=None, name="LY")
+  ma: Optional[str] = msgspec.field(default=None, name="MA")
+  mc: Optional[str] = msgspec.field(default=None, name="MC")
+  md: Optional[str] = msgspec.field(default=None, name="MD")
+  me: Optional[str] = msgspec.field(default=None, name="ME")
+  mf: Optional[str] = msgspec.field(default=None, name="MF")
+  mg: Optional[str] = msgspec.field(default=None, name="MG")
+  mh: Optional[str] = msgspec.field(default=None, name="MH")
+  mk: Optional[str] = msgspec.field(default=None, name="MK")
+  ml: Optional[str] = msgspec.field(default=None, name="ML")
+  mm: Optional[str] = msgspec.field(default=None, name="MM")
+  mn: Optional[str] = msgspec.field(default=None, name="MN")
+  mo: Optional[str] = msgspec.field(default=None, name="MO")
+  mp: Optional[str] = msgspec.field(default=None, name="MP")
+  mq: Optional[str] = msgspec.field(default=None, name="MQ")
+  mr: Optional[str] = msgspec.field(default=None, name="MR")
+  ms: Optional[str] = msgspec.field(default=None, name="MS")
+  mt: Optional[str] = msgspec.field(default=None, name="MT")
+  mu: Optional[str] = msgspec.field(default=None, name="MU")
+  mv: Optional[str] = msgspec.field(default=None, name="MV")
+  mw: Optional[str] = msgspec.field(default=None, name="MW")
+  mx: Optional[str] = msgspec.field(default=None, name="MX")
+  my: Optional[str] = msgspec.field(default=None, name="MY")
+  mz: Optional[str] = msgspec.field(default=None, name="MZ")
+  na: Optional[str] = msgspec.field(default=None, name="NA")
+  nc: Optional[str] = msgspec.field(default=None, name="NC")
+  ne: Optional[str] = msgspec.field(default=None, name="NE")
+  nf: Optional[str] = msgspec.field(default=None, name="NF")
+  ng: Optional[str] = msgspec.field(default=None, name="NG")
+  ni: Optional[str] = msgspec.field(default=None, name="NI")
+  nl: Optional[str] = msgspec.field(default=None, name="NL")
+  no: Optional[str] = msgspec.field(default=None, name="NO")
+  np: Optional[str] = msgspec.field(default=None, name="NP")
+  nr: Optional[str] = msgspec.field(default=None, name="NR")
+  nu: Optional[str] = msgspec.field(default=None, name="NU")
+  nz: Optional[str] = msgspec.field(default=None, name="NZ")
+  om: Optional[str] = msgspec.field(default=None, name="OM")
+  pa: Optional[str] = msgspec.field(default=None, name="PA")
+  pe: Optional[str] = msgspec.field(default=None, name="PE")
+  pf: Optional[str] = msgspec.field(default=None, name="PF")
+  pg: Optional[str] = msgspec.field(default=None, name="PG")
+  ph: Optional[str] = msgspec.field(default=None, name="PH")
+  pk: Optional[str] = msgspec.field(default=None, name="PK")
+  pl: Optional[str] = msgspec.field(default=None, name="PL")
+  pm: Optional[str] = msgspec.field(default=None, name="PM")
+  pn: Optional[str] = msgspec.field(default=None, name="PN")
+  pr: Optional[str] = msgspec.field(default=None, name="PR")
+  ps: Optional[str] = msgspec.field(default=None, name="PS")
+  pt: Optional[str] = msgspec.field(default=None, name="PT")
+  pw: Optional[str] = msgspec.field(default=None, name="PW")
+  py: Optional[str] = msgspec.field(default=None, name="PY")
+  qa: Optional[str] = msgspec.field(default=None, name="QA")
+  re: Optional[str] = msgspec.field(default=None, name="RE")
+  ro: Optional[str] = msgspec.field(default=None, name="RO")
+  rs: Optional[str] = msgspec.field(default=None, name="RS")
+  ru: Optional[str] = msgspec.field(default=None, name="RU")
+  rw: Optional[str] = msgspec.field(default=None, name="RW")
+  sa: Optional[str] = msgspec.field(default=None, name="SA")
+  sb: Optional[str] = msgspec.field(default=None, name="SB")
+  sc: Optional[str] = msgspec.field(default=None, name="SC")
+  sd: Optional[str] = msgspec.field(default=None, name="SD")
+  se: Optional[str] = msgspec.field(default=None, name="SE")
+  sg: Optional[str] = msgspec.field(default=None, name="SG")
+  sh: Optional[str] = msgspec.field(default=None, name="SH")
+  si: Optional[str] = msgspec.field(default=None, name="SI")
+  sj: Optional[str] = msgspec.field(default=None, name="SJ")
+  sk: Optional[str] = msgspec.field(default=None, name="SK")
+  sl: Optional[str] = msgspec.field(default=None, name="SL")
+  sm: Optional[str] = msgspec.field(default=None, name="SM")
+  sn: Optional[str] = msgspec.field(default=None, name="SN")
+  so: Optional[str] = msgspec.field(default=None, name="SO")
+  sr: Optional[str] = msgspec.field(default=None, name="SR")
+  ss: Optional[str] = msgspec.field(default=None, name="SS")
+  st: Optional[str] = msgspec.field(default=None, name="ST")
+  sv: Optional[str] = msgspec.field(default=None, name="SV")
+  sx: Optional[str] = msgspec.field(default=None, name="SX")
+  sy: Optional[str] = msgspec.field(default=None, name="SY")
+  sz: Optional[str] = msgspec.field(default=None, name="SZ")
+  tc: Optional[str] = msgspec.field(default=None, name="TC")
+  td: Optional[str] = msgspec.field(default=None, name="TD")
+  tf: Optional[str] = msgspec.field(default=None, name="TF")
+  tg: Optional[str] = msgspec.field(default=None, name="TG")
+  th: Optional[str] = msgspec.field(default=None, name="TH")
+  tj: Optional[str] = msgspec.field(default=None, name="TJ")
+  tk: Optional[str] = msgspec.field(default=None, name="TK")
+  tl: Optional[str] = msgspec.field(default=None, name="TL")
+  tm: Optional[str] = msgspec.field(default=None, name="TM")
+  tn: Optional[str] = msgspec.field(default=None, name="TN")
+  to: Optional[str] = msgspec.field(default=None, name="TO")
+  tr: Optional[str] = msgspec.field(default=None, name="TR")
+  tt: Optional[str] = msgspec.field(default=None, name="TT")
+  tv: Optional[str] = msgspec.field(default=None, name="TV")
+  tw: Optional[str] = msgspec.field(default=None, name="TW")
+  tz: Optional[str] = msgspec.field(default=None, name="TZ")
+  ua: Optional[str] = msgspec.field(default=None, name="UA")
+  ug: Optional[str] = msgspec.field(default=None, name="UG")
+  um: Optional[str] = msgspec.field(default=None, name="UM")
+  us: Optional[str] = msgspec.field(default=None, name="US")
+  uy: Optional[str] = msgspec.field(default=None, name="UY")
+  uz: Optional[str] = msgspec.field(default=None, name="UZ")
+  va: Optional[str] = msgspec.field(default=None, name="VA")
+  vc: Optional[str] = msgspec.field(default=None, name="VC")
+  ve: Optional[str] = msgspec.field(default=None, name="VE")
+  vg: Optional[str] = msgspec.field(default=None, name="VG")
+  vi: Optional[str] = msgspec.field(default=None, name="VI")
+  vn: Optional[str] = msgspec.field(default=None, name="VN")
+  vu: Optional[str] = msgspec.field(default=None, name="VU")
+  wf: Optional[str] = msgspec.field(default=None, name="WF")
+  ws: Optional[str] = msgspec.field(default=None, name="WS")
+  xk: Optional[str] = msgspec.field(default=None, name="XK")
+  ye: Optional[str] = msgspec.field(default=None, name="YE")
+  yt: Optional[str] = msgspec.field(default=None, name="YT")
+  za: Optional[str] = msgspec.field(default=None, name="ZA")
+  zm: Optional[str] = msgspec.field(default=None, name="ZM")
+  zw: Optional[str] = msgspec.field(default=None, name="ZW")
+
+
+class Geo(msgspec.Struct, kw_only=True, omit_defaults=True):
+  """Geo targeting information for the short link in JSON format `{[COUNTRY]:
+  https://example.com }`. Learn more: https://d.to/geo
+  """
+  ad: Optional[str] = msgspec.field(default=None, name="AD")
+  ae: Optional[str] = msgspec.field(default=None, name="AE")
+  af: Optional[str] = msgspec.field(default=None, name="AF")
+  ag: Optional[str] = msgspec.field(default=None, name="AG")
+  ai: Optional[str] = msgspec.field(default=None, name="AI")
+  al: Optional[str] = msgspec.field(default=None, name="AL")
+  am: Optional[str] = msgspec.field(default=None, name="AM")
+  ao: Optional[str] = msgspec.field(default=None, name="AO")
+  aq: Optional[str] = msgspec.field(default=None, name="AQ")
+  ar: Optional[str] = msgspec.field(default=None, name="AR")
+  geo_as: Optional[str] = msgspec.field(default=None, name="AS")
+  at: Optional[str] = msgspec.field(default=None, name="AT")
+  au: Optional[str] = msgspec.field(default=None, name="AU")
+  aw: Optional[str] = msgspec.field(default=None, name="AW")
+  ax: Optional[str] = msgspec.field(default=None, name="AX")
+  az: Optional[str] = msgspec.field(default=None, name="AZ")
+  ba: Optional[str] = msgspec.field(default=None, name="BA")
+  bb: Optional[str] = msgspec.field(default=None, name="BB")
+  bd: Optional[str] = msgspec.field(default=None, name="BD")
+  be: Optional[str] = msgspec.field(default=None, name="BE")
+  bf: Optional[str] = msgspec.field(default=None, name="BF")
+  bg: Optional[str] = msgspec.field(default=None, name="BG")
+  bh: Optional[str] = msgspec.field(default=None, name="BH")
+  bi: Optional[str] = msgspec.field(default=None, name="BI")
+  bj: Optional[str] = msgspec.field(default=None, name="BJ")
+  bl: Optional[str] = msgspec.field(default=None, name="BL")
+  bm: Optional[str] = msgspec.field(default=None, name="BM")
+  bn: Optional[str] = msgspec.field(default=None, name="BN")
+  bo: Optional[str] = msgspec.field(default=None, name="BO")
+  bq: Optional[str] = msgspec.field(default=None, name="BQ")
+  br: Optional[str] = msgspec.field(default=None, name="BR")
+  bs: Optional[str] = msgspec.field(default=None, name="BS")
+  bt: Optional[str] = msgspec.field(default=None, name="BT")
+  bv: Optional[str] = msgspec.field(default=None, name="BV")
+  bw: Optional[str] = msgspec.field(default=None, name="BW")
+  by: Optional[str] = msgspec.field(default=None, name="BY")
+  bz: Optional[str] = msgspec.field(default=None, name="BZ")
+  ca: Optional[str] = msgspec.field(default=None, name="CA")
+  cc: Optional[str] = msgspec.field(default=None, name="CC")
+  cd: Optional[str] = msgspec.field(default=None, name="CD")
+  cf: Optional[str] = msgspec.field(default=None, name="CF")
+  cg: Optional[str] = msgspec.field(default=None, name="CG")
+  ch: Optional[str] = msgspec.field(default=None, name="CH")
+  ci: Optional[str] = msgspec.field(default=None, name="CI")
+  ck: Optional[str] = msgspec.field(default=None, name="CK")
+  cl: Optional[str] = msgspec.field(default=None, name="CL")
+  cm: Optional[str] = msgspec.field(default=None, name="CM")
+  cn: Optional[str] = msgspec.field(default=None, name="CN")
+  co: Optional[str] = msgspec.field(default=None, name="CO")
+  cr: Optional[str] = msgspec.field(default=None, name="CR")
+  cu: Optional[str] = msgspec.field(default=None, name="CU")
+  cv: Optional[str] = msgspec.field(default=None, name="CV")
+  cw: Optional[str] = msgspec.field(default=None, name="CW")
+  cx: Optional[str] = msgspec.field(default=None, name="CX")
+  cy: Optional[str] = msgspec.field(default=None, name="CY")
+  cz: Optional[str] = msgspec.field(default=None, name="CZ")
+  de: Optional[str] = msgspec.field(default=None, name="DE")
+  dj: Optional[str] = msgspec.field(default=None, name="DJ")
+  dk: Optional[str] = msgspec.field(default=None, name="DK")
+  dm: Optional[str] = msgspec.field(default=None, name="DM")
+  do: Optional[str] = msgspec.field(default=None, name="DO")
+  dz: Optional[str] = msgspec.field(default=None, name="DZ")
+  ec: Optional[str] = msgspec.field(default=None, name="EC")
+  ee: Optional[str] = msgspec.field(default=None, name="EE")
+  eg: Optional[str] = msgspec.field(default=None, name="EG")
+  eh: Optional[str] = msgspec.field(default=None, name="EH")
+  er: Optional[str] = msgspec.field(default=None, name="ER")
+  es: Optional[str] = msgspec.field(default=None, name="ES")
+  et: Optional[str] = msgspec.field(default=None, name="ET")
+  fi: Optional[str] = msgspec.field(default=None, name="FI")
+  fj: Optional[str] = msgspec.field(default=None, name="FJ")
+  fk: Optional[str] = msgspec.field(default=None, name="FK")
+  fm: Optional[str] = msgspec.field(default=None, name="FM")
+  fo: Optional[str] = msgspec.field(default=None, name="FO")
+  fr: Optional[str] = msgspec.field(default=None, name="FR")
+  ga: Optional[str] = msgspec.field(default=None, name="GA")
+  gb: Optional[str] = msgspec.field(default=None, name="GB")
+  gd: Optional[str] = msgspec.field(default=None, name="GD")
+  ge: Optional[str] = msgspec.field(default=None, name="GE")
+  gf: Optional[str] = msgspec.field(default=None, name="GF")
+  gg: Optional[str] = msgspec.field(default=None, name="GG")
+  gh: Optional[str] = msgspec.field(default=None, name="GH")
+  gi: Optional[str] = msgspec.field(default=None, name="GI")
+  gl: Optional[str] = msgspec.field(default=None, name="GL")
+  gm: Optional[str] = msgspec.field(default=None, name="GM")
+  gn: Optional[str] = msgspec.field(default=None, name="GN")
+  gp: Optional[str] = msgspec.field(default=None, name="GP")
+  gq: Optional[str] = msgspec.field(default=None, name="GQ")
+  gr: Optional[str] = msgspec.field(default=None, name="GR")
+  gs: Optional[str] = msgspec.field(default=None, name="GS")
+  gt: Optional[str] = msgspec.field(default=None, name="GT")
+  gu: Optional[str] = msgspec.field(default=None, name="GU")
+  gw: Optional[str] = msgspec.field(default=None, name="GW")
+  gy: Optional[str] = msgspec.field(default=None, name="GY")
+  hk: Optional[str] = msgspec.field(default=None, name="HK")
+  hm: Optional[str] = msgspec.field(default=None, name="HM")
+  hn: Optional[str] = msgspec.field(default=None, name="HN")
+  hr: Optional[str] = msgspec.field(default=None, name="HR")
+  ht: Optional[str] = msgspec.field(default=None, name="HT")
+  hu: Optional[str] = msgspec.field(default=None, name="HU")
+  id: Optional[str] = msgspec.field(default=None, name="ID")
+  ie: Optional[str] = msgspec.field(default=None, name="IE")
+  il: Optional[str] = msgspec.field(default=None, name="IL")
+  im: Optional[str] = msgspec.field(default=None, name="IM")
+  geo_in: Optional[str] = msgspec.field(default=None, name="IN")
+  io: Optional[str] = msgspec.field(default=None, name="IO")
+  iq: Optional[str] = msgspec.field(default=None, name="IQ")
+  ir: Optional[str] = msgspec.field(default=None, name="IR")
+  geo_is: Optional[str] = msgspec.field(default=None, name="IS")
+  it: Optional[str] = msgspec.field(default=None, name="IT")
+  je: Optional[str] = msgspec.field(default=None, name="JE")
+  jm: Optional[str] = msgspec.field(default=None, name="JM")
+  jo: Optional[str] = msgspec.field(default=None, name="JO")
+  jp: Optional[str] = msgspec.field(default=None, name="JP")
+  ke: Optional[str] = msgspec.field(default=None, name="KE")
+  kg: Optional[str] = msgspec.field(default=None, name="KG")
+  kh: Optional[str] = msgspec.field(default=None, name="KH")
+  ki: Optional[str] = msgspec.field(default=None, name="KI")
+  km: Optional[str] = msgspec.field(default=None, name="KM")
+  kn: Optional[str] = msgspec.field(default=None, name="KN")
+  kp: Optional[str] = msgspec.field(default=None, name="KP")
+  kr: Optional[str] = msgspec.field(default=None, name="KR")
+  kw: Optional[str] = msgspec.field(default=None, name="KW")
+  ky: Optional[str] = msgspec.field(default=None, name="KY")
+  kz: Optional[str] = msgspec.field(default=None, name="KZ")
+  la: Optional[str] = msgspec.field(default=None, name="LA")
+  lb: Optional[str] = msgspec.field(default=None, name="LB")
+  lc: Optional[str] = msgspec.field(default=None, name="LC")
+  li: Optional[str] = msgspec.field(default=None, name="LI")
+  lk: Optional[str] = msgspec.field(default=None, name="LK")
+  lr: Optional[str] = msgspec.field(default=None, name="LR")
+  ls: Optional[str] = msgspec.field(default=None, name="LS")
+  lt: Optional[str] = msgspec.field(default=None, name="LT")
+  lu: Optional[str] = msgspec.field(default=None, name="LU")
+  lv: Optional[str] = msgspec.field(default=None, name="LV")
+  ly: Optional[str] = msgspec.field(default=None, name="LY")
+  ma: Optional[str] = msgspec.field(default=None, name="MA")
+  mc: Optional[str] = msgspec.field(default=None, name="MC")
+  md: Optional[str] = msgspec.field(default=None, name="MD")
+  me: Optional[str] = msgspec.field(default=None, name="ME")
+  mf: Optional[str] = msgspec.field(default=None, name="MF")
+  mg: Optional[str] = msgspec.field(default=None, name="MG")
+  mh: Optional[str] = msgspec.field(default=None, name="MH")
+  mk: Optional[str] = msgspec.field(default=None, name="MK")
+  ml: Optional[str] = msgspec.field(default=None, name="ML")
+  mm: Optional[str] = msgspec.field(default=None, name="MM")
+  mn: Optional[str] = msgspec.field(default=None, name="MN")
+  mo: Optional[str] = msgspec.field(default=None, name="MO")
+  mp: Optional[str] = msgspec.field(default=None, name="MP")
+  mq: Optional[str] = msgspec.field(default=None, name="MQ")
+  mr: Optional[str] = msgspec.field(default=None, name="MR")
+  ms: Optional[str] = msgspec.field(default=None, name="MS")
+  mt: Optional[str] = msgspec.field(default=None, name="MT")
+  mu: Optional[str] = msgspec.field(default=None, name="MU")
+  mv: Optional[str] = msgspec.field(default=None, name="MV")
+  mw: Optional[str] = msgspec.field(default=None, name="MW")
+  mx: Optional[str] = msgspec.field(default=None, name="MX")
+  my: Optional[str] = msgspec.field(default=None, name="MY")
+  mz: Optional[str] = msgspec.field(default=None, name="MZ")
+  na: Optional[str] = msgspec.field(default=None, name="NA")
+  nc: Optional[str] = msgspec.field(default=None, name="NC")
+  ne: Optional[str] = msgspec.field(default=None, name="NE")
+  nf: Optional[str] = msgspec.field(default=None, name="NF")
+  ng: Optional[str] = msgspec.field(default=None, name="NG")
+  ni: Optional[str] = msgspec.field(default=None, name="NI")
+  nl: Optional[str] = msgspec.field(default=None, name="NL")
+  no: Optional[str] = msgspec.field(default=None, name="NO")
+  np: Optional[str] = msgspec.field(default=None, name="NP")
+  nr: Optional[str] = msgspec.field(default=None, name="NR")
+  nu: Optional[str] = msgspec.field(default=None, name="NU")
+  nz: Optional[str] = msgspec.field(default=None, name="NZ")
+  om: Optional[str] = msgspec.field(default=None, name="OM")
+  pa: Optional[str] = msgspec.field(default=None, name="PA")
+  pe: Optional[str] = msgspec.field(default=None, name="PE")
+  pf: Optional[str] = msgspec.field(default=None, name="PF")
+  pg: Optional[str] = msgspec.field(default=None, name="PG")
+  ph: Optional[str] = msgspec.field(default=None, name="PH")
+  pk: Optional[str] = msgspec.field(default=None, name="PK")
+  pl: Optional[str] = msgspec.field(default=None, name="PL")
+  pm: Optional[str] = msgspec.field(default=None, name="PM")
+  pn: Optional[str] = msgspec.field(default=None, name="PN")
+  pr: Optional[str] = msgspec.field(default=None, name="PR")
+  ps: Optional[str] = msgspec.field(default=None, name="PS")
+  pt: Optional[str] = msgspec.field(default=None, name="PT")
+  pw: Optional[str] = msgspec.field(default=None, name="PW")
+  py: Optional[str] = msgspec.field(default=None, name="PY")
+  qa: Optional[str] = msgspec.field(default=None, name="QA")
+  re: Optional[str] = msgspec.field(default=None, name="RE")
+  ro: Optional[str] = msgspec.field(default=None, name="RO")
+  rs: Optional[str] = msgspec.field(default=None, name="RS")
+  ru: Optional[str] = msgspec.field(default=None, name="RU")
+  rw: Optional[str] = msgspec.field(default=None, name="RW")
+  sa: Optional[str] = msgspec.field(default=None, name="SA")
+  sb: Optional[str] = msgspec.field(default=None, name="SB")
+  sc: Optional[str] = msgspec.field(default=None, name="SC")
+  sd: Optional[str] = msgspec.field(default=None, name="SD")
+  se: Optional[str] = msgspec.field(default=None, name="SE")
+  sg: Optional[str] = msgspec.field(default=None, name="SG")
+  sh: Optional[str] = msgspec.field(default=None, name="SH")
+  si: Optional[str] = msgspec.field(default=None, name="SI")
+  sj: Optional[str] = msgspec.field(default=None, name="SJ")
+  sk: Optional[str] = msgspec.field(default=None, name="SK")
+  sl: Optional[str] = msgspec.field(default=None, name="SL")
+  sm: Optional[str] = msgspec.field(default=None, name="SM")
+  sn: Optional[str] = msgspec.field(default=None, name="SN")
+  so: Optional[str] = msgspec.field(default=None, name="SO")
+  sr: Optional[str] = msgspec.field(default=None, name="SR")
+  ss: Optional[str] = msgspec.field(default=None, name="SS")
+  st: Optional[str] = msgspec.field(default=None, name="ST")
+  sv: Optional[str] = msgspec.field(default=None, name="SV")
+  sx: Optional[str] = msgspec.field(default=None, name="SX")
+  sy: Optional[str] = msgspec.field(default=None, name="SY")
+  sz: Optional[str] = msgspec.field(default=None, name="SZ")
+  tc: Optional[str] = msgspec.field(default=None, name="TC")
+  td: Optional[str] = msgspec.field(default=None, name="TD")
+  tf: Optional[str] = msgspec.field(default=None, name="TF")
+  tg: Optional[str] = msgspec.field(default=None, name="TG")
+  th: Optional[str] = msgspec.field(default=None, name="TH")
+  tj: Optional[str] = msgspec.field(default=None, name="TJ")
+  tk: Optional[str] = msgspec.field(default=None, name="TK")
+  tl: Optional[str] = msgspec.field(default=None, name="TL")
+  tm: Optional[str] = msgspec.field(default=None, name="TM")
+  tn: Optional[str] = msgspec.field(default=None, name="TN")
+  to: Optional[str] = msgspec.field(default=None, name="TO")
+  tr: Optional[str] = msgspec.field(default=None, name="TR")
+  tt: Optional[str] = msgspec.field(default=None, name="TT")
+  tv: Optional[str] = msgspec.field(default=None, name="TV")
+  tw: Optional[str] = msgspec.field(default=None, name="TW")
+  tz: Optional[str] = msgspec.field(default=None, name="TZ")
+  ua: Optional[str] = msgspec.field(default=None, name="UA")
+  ug: Optional[str] = msgspec.field(default=None, name="UG")
+  um: Optional[str] = msgspec.field(default=None, name="UM")
+  us: Optional[str] = msgspec.field(default=None, name="US")
+  uy: Optional[str] = msgspec.field(default=None, name="UY")
+  uz: Optional[str] = msgspec.field(default=None, name="UZ")
+  va: Optional[str] = msgspec.field(default=None, name="VA")
+  vc: Optional[str] = msgspec.field(default=None, name="VC")
+  ve: Optional[str] = msgspec.field(default=None, name="VE")
+  vg: Optional[str] = msgspec.field(default=None, name="VG")
+  vi: Optional[str] = msgspec.field(default=None, name="VI")
+  vn: Optional[str] = msgspec.field(default=None, name="VN")
+  vu: Optional[str] = msgspec.field(default=None, name="VU")
+  wf: Optional[str] = msgspec.field(default=None, name="WF")
+  ws: Optional[str] = msgspec.field(default=None, name="WS")
+  xk: Optional[str] = msgspec.field(default=None, name="XK")
+  ye: Optional[str] = msgspec.field(default=None, name="YE")
+  yt: Optional[str] = msgspec.field(default=None, name="YT")
+  za: Optional[str] = msgspec.field(default=None, name="ZA")
+  zm: Optional[str] = msgspec.field(default=None, name="ZM")
+  zw: Optional[str] = msgspec.field(default=None, name="ZW")
+
+
+class Color(Enum):
+  """The color of the tag."""
+
+  BLUE = "blue"
+  BROWN = "brown"
+  GREEN = "green"
+  PINK = "pink"
+  PURPLE = "purple"
+  RED = "red"
+  YELLOW = "yellow"
+
+
+class Tag(msgspec.Struct, kw_only=True, omit_defaults=True):
+  color: Optional[Color]
+  """The color of the tag."""
+
+  id: Optional[str]
+  """The unique ID of the tag."""
+
+  name: Optional[str]
+  """The name of the tag."""
+
+
+class Link(msgspec.Struct, kw_only=True, omit_defaults=True):
+  android: Optional[str]
+  """The Android destination URL for the short link for Android device targeting."""
+
+  archived: Optional[bool]
+  """Whether the short link is archived."""
+
+  clicks: Optional[float]
+  """The number of clicks on the short link."""
+
+  comments: Optional[str]
+  """The comments for the short link."""
+
+  created_at: Optional[str] = msgspec.field(name="createdAt")
+  """The date and time when the short link was created."""
+
+  description: Optional[str]
+  """The description of the short link generated via `api.dub.co/metatags`. Will be used for
+  Custom Social Media Cards if `proxy` is true.
+  """
+  do_index: Optional[bool] = msgspec.field(name="doIndex")
+  """Whether to allow search engines to index the short link."""
+
+  domain: Optional[str]
+  """The domain of the short link. If not provided, the primary domain for the workspace will
+  be used (or `dub.sh` if the workspace has no domains).
+  """
+  expired_url: Optional[str] = msgspec.field(name="expiredUrl")
+  """The URL to redirect to when the short link has expired."""
+
+  expires_at: Optional[str] = msgspec.field(name="expiresAt")
+  """The date and time when the short link will expire in ISO-8601 format."""
+
+  external_id: Optional[str] = msgspec.field(name="externalId")
+  """This is the ID of the link in your database that is unique across your workspace. If set,
+  it can be used to identify the link in future API requests. Must be prefixed with 'ext_'
+  when passed as a query parameter.
+  """
+  geo: Optional[Geo]
+  """Geo targeting information for the short link in JSON format `{[COUNTRY]:
+  https://example.com }`. Learn more: https://d.to/geo
+  """
+  id: Optional[str]
+  """The unique ID of the short link."""
+
+  image: Optional[str]
+  """The image of the short link generated via `api.dub.co/metatags`. Will be used for Custom
+  Social Media Cards if `proxy` is true.
+  """
+  ios: Optional[str]
+  """The iOS destination URL for the short link for iOS device targeting."""
+
+  key: Optional[str]
+  """The short link slug. If not provided, a random 7-character slug will be generated."""
+
+  last_clicked: Optional[str] = msgspec.field(name="lastClicked")
+  """The date and time when the short link was last clicked."""
+
+  leads: Optional[float]
+  """[BETA]: The number of leads the short links has generated."""
+
+  password: Optional[str]
+  """The password required to access the destination URL of the short link."""
+
+  program_id: Optional[str] = msgspec.field(name="programId")
+  """The ID of the program the short link is associated with."""
+
+  project_id: Optional[str] = msgspec.field(name="projectId")
+  """The project ID of the short link. This field is deprecated – use `workspaceId` instead."""
+
+  proxy: Optional[bool]
+  """Whether the short link uses Custom Social Media Cards feature."""
+
+  public_stats: Optional[bool] = msgspec.field(name="publicStats")
+  """Whether the short link's stats are publicly accessible."""
+
+  qr_code: Optional[str] = msgspec.field(name="qrCode")
+  """The full URL of the QR code for the short link (e.g.
+  `https://api.dub.co/qr?url=https://dub.sh/try`).
+  """
+  rewrite: Optional[bool]
+  """Whether the short link uses link cloaking."""
+
+  sale_amount: Optional[float] = msgspec.field(name="saleAmount")
+  """[BETA]: The total dollar amount of sales the short links has generated (in cents)."""
+
+  sales: Optional[float]
+  """[BETA]: The number of sales the short links has generated."""
+
+  short_link: Optional[str] = msgspec.field(name="shortLink")
+  """The full URL of the short link, including the https protocol (e.g. `https://dub.sh/try`)."""
+
+  tag_id: Optional[str] = msgspec.field(name="tagId")
+  """The unique ID of the tag assigned to the short link. This field is deprecated – use
+  `tags` instead.
+  """
+  tags: Optional[List[Tag]]
+  """The tags assigned to the short link."""
+
+  title: Optional[str]
+  """The title of the short link generated via `api.dub.co/metatags`. Will be used for Custom
+  Social Media Cards if `proxy` is true.
+  """
+  track_conversion: Optional[bool] = msgspec.field(name="trackConversion")
+  """[BETA] Whether to track conversions for the short link."""
+
+  updated_at: Optional[str] = msgspec.field(name="updatedAt")
+  """The date and time when the short link was last updated."""
+
+  url: Optional[str]
+  """The destination URL of the short link."""
+
+  user_id: Optional[str] = msgspec.field(name="userId")
+  """The user ID of the creator of the short link."""
+
+  utm_campaign: Optional[str]
+  """The UTM campaign of the short link."""
+
+  utm_content: Optional[str]
+  """The UTM content of the short link."""
+
+  utm_medium: Optional[str]
+  """The UTM medium of the short link."""
+
+  utm_source: Optional[str]
+  """The UTM source of the short link."""
+
+  utm_term: Optional[str]
+  """The UTM term of the short link."""
+
+  video: Optional[str]
+  """The custom link preview video (og:video). Will be used for Custom Social Media Cards if
+  `proxy` is true. Learn more: https://d.to/og
+  """
+  webhook_ids: Optional[List[str]] = msgspec.field(name="webhookIds")
+  """The IDs of the webhooks that the short link is associated with."""
+
+  workspace_id: Optional[str] = msgspec.field(name="workspaceId")
+  """The workspace ID of the short link."""
+
+
+class AllExportedTypes(msgspec.Struct, kw_only=True, omit_defaults=True):
+  link_schema: Optional[Link]
+  tag_schema: Optional[Tag]
+  link_geo_targeting: Optional[LinkGeoTargeting]
+
+
+T = TypeVar("T")
+
+
+def decode(cls: Type[T], data: Any) -> T:
+  """Builds a cls instance from decoded JSON, renaming wire keys and converting nested models."""
+  return msgspec.convert(data, cls)
+
+
+def encode(obj: Any) -> Any:
+  """Converts model instances, also in lists and dicts, to JSON values with wire keys and no None optionals."""
+  return msgspec.to_builtins(obj)
+
+
+def view(cls: Type[T], data: Any) -> T:
+  """Lazy stand-in for a cls instance over decoded JSON, only the fields that are read get converted."""
+  return msgspec.convert(data, cls)
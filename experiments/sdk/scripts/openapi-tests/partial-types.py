@@ -1,13 +1,60 @@
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, Any, Callable, Dict, FrozenSet, Tuple, Type, TypeVar
 from enum import Enum
 
 
-@dataclass
-class LinkGeoTargeting:
+class SparseModel:
+  """Base of wide models whose fields are mostly None, only the fields that are set are stored."""
+
+  __slots__ = ("_values",)
+  _fields: FrozenSet[str] = frozenset()
+
+  def __init_subclass__(cls, **kwargs: Any):
+    super().__init_subclass__(**kwargs)
+    cls._fields = frozenset(cls.__annotations__)
+
+  def __init__(self, **values: Any):
+    unknown = values.keys() - self._fields
+    if unknown:
+      raise TypeError(f"{type(self).__name__} got unexpected fields {', '.join(sorted(unknown))}")
+    self._values = {name: value for name, value in values.items() if value is not None}
+
+  @classmethod
+  def _from_values(cls, values: Dict[str, Any]) -> Any:
+    instance = cls.__new__(cls)
+    instance._values = values
+    return instance
+
+  def __getattr__(self, name: str) -> Any:
+    if name in self._fields:
+      return self._values.get(name)
+    raise AttributeError(f"{type(self).__name__} has no field {name}")
+
+  def __setattr__(self, name: str, value: Any) -> None:
+    if name not in self._fields:
+      object.__setattr__(self, name, value)
+    elif value is None:
+      self._values.pop(name, None)
+    else:
+      self._values[name] = value
+
+  def __copy__(self) -> Any:
+    return self._from_values(dict(self._values))
+
+  def __eq__(self, other: Any) -> bool:
+    return type(other) is type(self) and other._values == self._values
+
+  def __repr__(self) -> str:
+    fields = ", ".join(f"{name}={value!r}" for name, value in self._values.items())
+    return f"{type(self).__name__}({fields})"
+
+
+class LinkGeoTargeting(SparseModel):
   """Geo targeting information for the short link in JSON format `{[COUNTRY]:
   https://example.com }`.
   """
+  __slots__ = ()
+
   ad: Optional[str]
   ae: Optional[str]
   af: Optional[str]
@@ -260,11 +307,12 @@ class LinkGeoTargeting:
   zw: Optional[str]
 
 
-@dataclass
-class Geo:
+class Geo(SparseModel):
   """Geo targeting information for the short link in JSON format `{[COUNTRY]:
   https://example.com }`. Learn more: https://d.to/geo
   """
+  __slots__ = ()
+
   ad: Optional[str]
   ae: Optional[str]
   af: Optional[str]
@@ -688,3 +736,1304 @@ class AllExportedTypes:
   link_schema: Link
   tag_schema: Tag
   link_geo_targeting: LinkGeoTargeting
+
+
+T = TypeVar("T")
+
+
+_LinkGeoTargeting_attributes = {
+  "AD": "ad",
+  "AE": "ae",
+  "AF": "af",
+  "AG": "ag",
+  "AI": "ai",
+  "AL": "al",
+  "AM": "am",
+  "AO": "ao",
+  "AQ": "aq",
+  "AR": "ar",
+  "AS": "link_geo_targeting_as",
+  "AT": "at",
+  "AU": "au",
+  "AW": "aw",
+  "AX": "ax",
+  "AZ": "az",
+  "BA": "ba",
+  "BB": "bb",
+  "BD": "bd",
+  "BE": "be",
+  "BF": "bf",
+  "BG": "bg",
+  "BH": "bh",
+  "BI": "bi",
+  "BJ": "bj",
+  "BL": "bl",
+  "BM": "bm",
+  "BN": "bn",
+  "BO": "bo",
+  "BQ": "bq",
+  "BR": "br",
+  "BS": "bs",
+  "BT": "bt",
+  "BV": "bv",
+  "BW": "bw",
+  "BY": "by",
+  "BZ": "bz",
+  "CA": "ca",
+  "CC": "cc",
+  "CD": "cd",
+  "CF": "cf",
+  "CG": "cg",
+  "CH": "ch",
+  "CI": "ci",
+  "CK": "ck",
+  "CL": "cl",
+  "CM": "cm",
+  "CN": "cn",
+  "CO": "co",
+  "CR": "cr",
+  "CU": "cu",
+  "CV": "cv",
+  "CW": "cw",
+  "CX": "cx",
+  "CY": "cy",
+  "CZ": "cz",
+  "DE": "de",
+  "DJ": "dj",
+  "DK": "dk",
+  "DM": "dm",
+  "DO": "do",
+  "DZ": "dz",
+  "EC": "ec",
+  "EE": "ee",
+  "EG": "eg",
+  "EH": "eh",
+  "ER": "er",
+  "ES": "es",
+  "ET": "et",
+  "FI": "fi",
+  "FJ": "fj",
+  "FK": "fk",
+  "FM": "fm",
+  "FO": "fo",
+  "FR": "fr",
+  "GA": "ga",
+  "GB": "gb",
+  "GD": "gd",
+  "GE": "ge",
+  "GF": "gf",
+  "GG": "gg",
+  "GH": "gh",
+  "GI": "gi",
+  "GL": "gl",
+  "GM": "gm",
+  "GN": "gn",
+  "GP": "gp",
+  "GQ": "gq",
+  "GR": "gr",
+  "GS": "gs",
+  "GT": "gt",
+  "GU": "gu",
+  "GW": "gw",
+  "GY": "gy",
+  "HK": "hk",
+  "HM": "hm",
+  "HN": "hn",
+  "HR": "hr",
+  "HT": "ht",
+  "HU": "hu",
+  "ID": "id",
+  "IE": "ie",
+  "IL": "il",
+  "IM": "im",
+  "IN": "link_geo_targeting_in",
+  "IO": "io",
+  "IQ": "iq",
+  "IR": "ir",
+  "IS": "link_geo_targeting_is",
+  "IT": "it",
+  "JE": "je",
+  "JM": "jm",
+  "JO": "jo",
+  "JP": "jp",
+  "KE": "ke",
+  "KG": "kg",
+  "KH": "kh",
+  "KI": "ki",
+  "KM": "km",
+  "KN": "kn",
+  "KP": "kp",
+  "KR": "kr",
+  "KW": "kw",
+  "KY": "ky",
+  "KZ": "kz",
+  "LA": "la",
+  "LB": "lb",
+  "LC": "lc",
+  "LI": "li",
+  "LK": "lk",
+  "LR": "lr",
+  "LS": "ls",
+  "LT": "lt",
+  "LU": "lu",
+  "LV": "lv",
+  "LY": "ly",
+  "MA": "ma",
+  "MC": "mc",
+  "MD": "md",
+  "ME": "me",
+  "MF": "mf",
+  "MG": "mg",
+  "MH": "mh",
+  "MK": "mk",
+  "ML": "ml",
+  "MM": "mm",
+  "MN": "mn",
+  "MO": "mo",
+  "MP": "mp",
+  "MQ": "mq",
+  "MR": "mr",
+  "MS": "ms",
+  "MT": "mt",
+  "MU": "mu",
+  "MV": "mv",
+  "MW": "mw",
+  "MX": "mx",
+  "MY": "my",
+  "MZ": "mz",
+  "NA": "na",
+  "NC": "nc",
+  "NE": "ne",
+  "NF": "nf",
+  "NG": "ng",
+  "NI": "ni",
+  "NL": "nl",
+  "NO": "no",
+  "NP": "np",
+  "NR": "nr",
+  "NU": "nu",
+  "NZ": "nz",
+  "OM": "om",
+  "PA": "pa",
+  "PE": "pe",
+  "PF": "pf",
+  "PG": "pg",
+  "PH": "ph",
+  "PK": "pk",
+  "PL": "pl",
+  "PM": "pm",
+  "PN": "pn",
+  "PR": "pr",
+  "PS": "ps",
+  "PT": "pt",
+  "PW": "pw",
+  "PY": "py",
+  "QA": "qa",
+  "RE": "re",
+  "RO": "ro",
+  "RS": "rs",
+  "RU": "ru",
+  "RW": "rw",
+  "SA": "sa",
+  "SB": "sb",
+  "SC": "sc",
+  "SD": "sd",
+  "SE": "se",
+  "SG": "sg",
+  "SH": "sh",
+  "SI": "si",
+  "SJ": "sj",
+  "SK": "sk",
+  "SL": "sl",
+  "SM": "sm",
+  "SN": "sn",
+  "SO": "so",
+  "SR": "sr",
+  "SS": "ss",
+  "ST": "st",
+  "SV": "sv",
+  "SX": "sx",
+  "SY": "sy",
+  "SZ": "sz",
+  "TC": "tc",
+  "TD": "td",
+  "TF": "tf",
+  "TG": "tg",
+  "TH": "th",
+  "TJ": "tj",
+  "TK": "tk",
+  "TL": "tl",
+  "TM": "tm",
+  "TN": "tn",
+  "TO": "to",
+  "TR": "tr",
+  "TT": "tt",
+  "TV": "tv",
+  "TW": "tw",
+  "TZ": "tz",
+  "UA": "ua",
+  "UG": "ug",
+  "UM": "um",
+  "US": "us",
+  "UY": "uy",
+  "UZ": "uz",
+  "VA": "va",
+  "VC": "vc",
+  "VE": "ve",
+  "VG": "vg",
+  "VI": "vi",
+  "VN": "vn",
+  "VU": "vu",
+  "WF": "wf",
+  "WS": "ws",
+  "XK": "xk",
+  "YE": "ye",
+  "YT": "yt",
+  "ZA": "za",
+  "ZM": "zm",
+  "ZW": "zw",
+}
+_LinkGeoTargeting_wire_names = {name: key for key, name in _LinkGeoTargeting_attributes.items()}
+
+
+def _decode_LinkGeoTargeting(data: Dict[str, Any]) -> LinkGeoTargeting:
+  attributes = _LinkGeoTargeting_attributes
+  return LinkGeoTargeting._from_values(
+    {attributes[key]: value for key, value in data.items() if value is not None and key in attributes}
+  )
+
+
+_Geo_attributes = {
+  "AD": "ad",
+  "AE": "ae",
+  "AF": "af",
+  "AG": "ag",
+  "AI": "ai",
+  "AL": "al",
+  "AM": "am",
+  "AO": "ao",
+  "AQ": "aq",
+  "AR": "ar",
+  "AS": "geo_as",
+  "AT": "at",
+  "AU": "au",
+  "AW": "aw",
+  "AX": "ax",
+  "AZ": "az",
+  "BA": "ba",
+  "BB": "bb",
+  "BD": "bd",
+  "BE": "be",
+  "BF": "bf",
+  "BG": "bg",
+  "BH": "bh",
+  "BI": "bi",
+  "BJ": "bj",
+  "BL": "bl",
+  "BM": "bm",
+  "BN": "bn",
+  "BO": "bo",
+  "BQ": "bq",
+  "BR": "br",
+  "BS": "bs",
+  "BT": "bt",
+  "BV": "bv",
+  "BW": "bw",
+  "BY": "by",
+  "BZ": "bz",
+  "CA": "ca",
+  "CC": "cc",
+  "CD": "cd",
+  "CF": "cf",
+  "CG": "cg",
+  "CH": "ch",
+  "CI": "ci",
+  "CK": "ck",
+  "CL": "cl",
+  "CM": "cm",
+  "CN": "cn",
+  "CO": "co",
+  "CR": "cr",
+  "CU": "cu",
+  "CV": "cv",
+  "CW": "cw",
+  "CX": "cx",
+  "CY": "cy",
+  "CZ": "cz",
+  "DE": "de",
+  "DJ": "dj",
+  "DK": "dk",
+  "DM": "dm",
+  "DO": "do",
+  "DZ": "dz",
+  "EC": "ec",
+  "EE": "ee",
+  "EG": "eg",
+  "EH": "eh",
+  "ER": "er",
+  "ES": "es",
+  "ET": "et",
+  "FI": "fi",
+  "FJ": "fj",
+  "FK": "fk",
+  "FM": "fm",
+  "FO": "fo",
+  "FR": "fr",
+  "GA": "ga",
+  "GB": "gb",
+  "GD": "gd",
+  "GE": "ge",
+  "GF": "gf",
+  "GG": "gg",
+  "GH": "gh",
+  "GI": "gi",
+  "GL": "gl",
+  "GM": "gm",
+  "GN": "gn",
+  "GP": "gp",
+  "GQ": "gq",
+  "GR": "gr",
+  "GS": "gs",
+  "GT": "gt",
+  "GU": "gu",
+  "GW": "gw",
+  "GY": "gy",
+  "HK": "hk",
+  "HM": "hm",
+  "HN": "hn",
+  "HR": "hr",
+  "HT": "ht",
+  "HU": "hu",
+  "ID": "id",
+  "IE": "ie",
+  "IL": "il",
+  "IM": "im",
+  "IN": "geo_in",
+  "IO": "io",
+  "IQ": "iq",
+  "IR": "ir",
+  "IS": "geo_is",
+  "IT": "it",
+  "JE": "je",
+  "JM": "jm",
+  "JO": "jo",
+  "JP": "jp",
+  "KE": "ke",
+  "KG": "kg",
+  "KH": "kh",
+  "KI": "ki",
+  "KM": "km",
+  "KN": "kn",
+  "KP": "kp",
+  "KR": "kr",
+  "KW": "kw",
+  "KY": "ky",
+  "KZ": "kz",
+  "LA": "la",
+  "LB": "lb",
+  "LC": "lc",
+  "LI": "li",
+  "LK": "lk",
+  "LR": "lr",
+  "LS": "ls",
+  "LT": "lt",
+  "LU": "lu",
+  "LV": "lv",
+  "LY": "ly",
+  "MA": "ma",
+  "MC": "mc",
+  "MD": "md",
+  "ME": "me",
+  "MF": "mf",
+  "MG": "mg",
+  "MH": "mh",
+  "MK": "mk",
+  "ML": "ml",
+  "MM": "mm",
+  "MN": "mn",
+  "MO": "mo",
+  "MP": "mp",
+  "MQ": "mq",
+  "MR": "mr",
+  "MS": "ms",
+  "MT": "mt",
+  "MU": "mu",
+  "MV": "mv",
+  "MW": "mw",
+  "MX": "mx",
+  "MY": "my",
+  "MZ": "mz",
+  "NA": "na",
+  "NC": "nc",
+  "NE": "ne",
+  "NF": "nf",
+  "NG": "ng",
+  "NI": "ni",
+  "NL": "nl",
+  "NO": "no",
+  "NP": "np",
+  "NR": "nr",
+  "NU": "nu",
+  "NZ": "nz",
+  "OM": "om",
+  "PA": "pa",
+  "PE": "pe",
+  "PF": "pf",
+  "PG": "pg",
+  "PH": "ph",
+  "PK": "pk",
+  "PL": "pl",
+  "PM": "pm",
+  "PN": "pn",
+  "PR": "pr",
+  "PS": "ps",
+  "PT": "pt",
+  "PW": "pw",
+  "PY": "py",
+  "QA": "qa",
+  "RE": "re",
+  "RO": "ro",
+  "RS": "rs",
+  "RU": "ru",
+  "RW": "rw",
+  "SA": "sa",
+  "SB": "sb",
+  "SC": "sc",
+  "SD": "sd",
+  "SE": "se",
+  "SG": "sg",
+  "SH": "sh",
+  "SI": "si",
+  "SJ": "sj",
+  "SK": "sk",
+  "SL": "sl",
+  "SM": "sm",
+  "SN": "sn",
+  "SO": "so",
+  "SR": "sr",
+  "SS": "ss",
+  "ST": "st",
+  "SV": "sv",
+  "SX": "sx",
+  "SY": "sy",
+  "SZ": "sz",
+  "TC": "tc",
+  "TD": "td",
+  "TF": "tf",
+  "TG": "tg",
+  "TH": "th",
+  "TJ": "tj",
+  "TK": "tk",
+  "TL": "tl",
+  "TM": "tm",
+  "TN": "tn",
+  "TO": "to",
+  "TR": "tr",
+  "TT": "tt",
+  "TV": "tv",
+  "TW": "tw",
+  "TZ": "tz",
+  "UA": "ua",
+  "UG": "ug",
+  "UM": "um",
+  "US": "us",
+  "UY": "uy",
+  "UZ": "uz",
+  "VA": "va",
+  "VC": "vc",
+  "VE": "ve",
+  "VG": "vg",
+  "VI": "vi",
+  "VN": "vn",
+  "VU": "vu",
+  "WF": "wf",
+  "WS": "ws",
+  "XK": "xk",
+  "YE": "ye",
+  "YT": "yt",
+  "ZA": "za",
+  "ZM": "zm",
+  "ZW": "zw",
+}
+_Geo_wire_names = {name: key for key, name in _Geo_attributes.items()}
+
+
+def _decode_Geo(data: Dict[str, Any]) -> Geo:
+  attributes = _Geo_attributes
+  return Geo._from_values(
+    {attributes[key]: value for key, value in data.items() if value is not None and key in attributes}
+  )
+
+
+def _decode_Tag(data: Dict[str, Any]) -> Tag:
+  return Tag(
+    color=None if data["color"] is None else Color(data["color"]),
+    id=data["id"],
+    name=data["name"],
+  )
+
+
+def _decode_Link(data: Dict[str, Any]) -> Link:
+  return Link(
+    android=data["android"],
+    archived=data["archived"],
+    clicks=data["clicks"],
+    comments=data["comments"],
+    created_at=data["createdAt"],
+    description=data["description"],
+    do_index=data["doIndex"],
+    domain=data["domain"],
+    expired_url=data["expiredUrl"],
+    expires_at=data["expiresAt"],
+    external_id=data["externalId"],
+    geo=None if data["geo"] is None else _decode_Geo(data["geo"]),
+    id=data["id"],
+    image=data["image"],
+    ios=data["ios"],
+    key=data["key"],
+    last_clicked=data["lastClicked"],
+    leads=data["leads"],
+    password=data["password"],
+    program_id=data["programId"],
+    project_id=data["projectId"],
+    proxy=data["proxy"],
+    public_stats=data["publicStats"],
+    qr_code=data["qrCode"],
+    rewrite=data["rewrite"],
+    sale_amount=data["saleAmount"],
+    sales=data["sales"],
+    short_link=data["shortLink"],
+    tag_id=data["tagId"],
+    tags=None if data["tags"] is None else [_decode_Tag(item1) for item1 in data["tags"]],
+    title=data["title"],
+    track_conversion=data["trackConversion"],
+    updated_at=data["updatedAt"],
+    url=data["url"],
+    user_id=data["userId"],
+    utm_campaign=data["utm_campaign"],
+    utm_content=data["utm_content"],
+    utm_medium=data["utm_medium"],
+    utm_source=data["utm_source"],
+    utm_term=data["utm_term"],
+    video=data["video"],
+    webhook_ids=data["webhookIds"],
+    workspace_id=data["workspaceId"],
+  )
+
+
+def _decode_AllExportedTypes(data: Dict[str, Any]) -> AllExportedTypes:
+  return AllExportedTypes(
+    link_schema=None if data["link_schema"] is None else _decode_Link(data["link_schema"]),
+    tag_schema=None if data["tag_schema"] is None else _decode_Tag(data["tag_schema"]),
+    link_geo_targeting=None if data["link_geo_targeting"] is None else _decode_LinkGeoTargeting(data["link_geo_targeting"]),
+  )
+
+
+DECODERS: Dict[type, Callable[[Dict[str, Any]], Any]] = {
+  LinkGeoTargeting: _decode_LinkGeoTargeting,
+  Geo: _decode_Geo,
+  Tag: _decode_Tag,
+  Link: _decode_Link,
+  AllExportedTypes: _decode_AllExportedTypes,
+}
+
+
+def decode(cls: Type[T], data: Any) -> T:
+  """Builds a cls instance from decoded JSON, renaming wire keys and converting nested models."""
+  return DECODERS[cls](data)
+
+
+def _encode_LinkGeoTargeting(obj: LinkGeoTargeting) -> Dict[str, Any]:
+  wire_names = _LinkGeoTargeting_wire_names
+  return {wire_names[name]: value for name, value in obj._values.items()}
+
+
+def _encode_Geo(obj: Geo) -> Dict[str, Any]:
+  wire_names = _Geo_wire_names
+  return {wire_names[name]: value for name, value in obj._values.items()}
+
+
+def _encode_Tag(obj: Tag) -> Dict[str, Any]:
+  return {
+    "color": None if obj.color is None else obj.color.value,
+    "id": obj.id,
+    "name": obj.name,
+  }
+
+
+def _encode_Link(obj: Link) -> Dict[str, Any]:
+  return {
+    "android": obj.android,
+    "archived": obj.archived,
+    "clicks": obj.clicks,
+    "comments": obj.comments,
+    "createdAt": obj.created_at,
+    "description": obj.description,
+    "doIndex": obj.do_index,
+    "domain": obj.domain,
+    "expiredUrl": obj.expired_url,
+    "expiresAt": obj.expires_at,
+    "externalId": obj.external_id,
+    "geo": None if obj.geo is None else _encode_Geo(obj.geo),
+    "id": obj.id,
+    "image": obj.image,
+    "ios": obj.ios,
+    "key": obj.key,
+    "lastClicked": obj.last_clicked,
+    "leads": obj.leads,
+    "password": obj.password,
+    "programId": obj.program_id,
+    "projectId": obj.project_id,
+    "proxy": obj.proxy,
+    "publicStats": obj.public_stats,
+    "qrCode": obj.qr_code,
+    "rewrite": obj.rewrite,
+    "saleAmount": obj.sale_amount,
+    "sales": obj.sales,
+    "shortLink": obj.short_link,
+    "tagId": obj.tag_id,
+    "tags": None if obj.tags is None else [_encode_Tag(item1) for item1 in obj.tags],
+    "title": obj.title,
+    "trackConversion": obj.track_conversion,
+    "updatedAt": obj.updated_at,
+    "url": obj.url,
+    "userId": obj.user_id,
+    "utm_campaign": obj.utm_campaign,
+    "utm_content": obj.utm_content,
+    "utm_medium": obj.utm_medium,
+    "utm_source": obj.utm_source,
+    "utm_term": obj.utm_term,
+    "video": obj.video,
+    "webhookIds": obj.webhook_ids,
+    "workspaceId": obj.workspace_id,
+  }
+
+
+def _encode_AllExportedTypes(obj: AllExportedTypes) -> Dict[str, Any]:
+  return {
+    "link_schema": None if obj.link_schema is None else _encode_Link(obj.link_schema),
+    "tag_schema": None if obj.tag_schema is None else _encode_Tag(obj.tag_schema),
+    "link_geo_targeting": None if obj.link_geo_targeting is None else _encode_LinkGeoTargeting(obj.link_geo_targeting),
+  }
+
+
+ENCODERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+  LinkGeoTargeting: _encode_LinkGeoTargeting,
+  Geo: _encode_Geo,
+  Tag: _encode_Tag,
+  Link: _encode_Link,
+  AllExportedTypes: _encode_AllExportedTypes,
+}
+
+
+def encode(obj: Any) -> Any:
+  """Converts model instances, also in lists and dicts, to JSON values with wire keys and no None optionals."""
+  encoder = ENCODERS.get(type(obj))
+  if encoder is not None:
+    return encoder(obj)
+  if isinstance(obj, list):
+    return [encode(item) for item in obj]
+  if isinstance(obj, dict):
+    return {key: encode(value) for key, value in obj.items()}
+  if isinstance(obj, View):
+    return obj._data
+  return obj
+
+
+class View:
+  """Read only model over its decoded JSON, each field is converted on first access and cached."""
+
+  __slots__ = ("__dict__", "_data", "_fields", "_model")
+
+  def __init__(self, model: type, data: Dict[str, Any]):
+    self._model = model
+    self._data = data
+    self._fields = VIEW_FIELDS[model]
+
+  def __getattr__(self, name: str) -> Any:
+    if name.startswith("_"):
+      raise AttributeError(name)
+    try:
+      key, convert = self._fields[name]
+    except KeyError:
+      raise AttributeError(f"{self._model.__name__} has no field {name}") from None
+    value = self._data.get(key)
+    if value is not None and convert is not None:
+      value = convert(value)
+    self.__dict__[name] = value
+    return value
+
+  def __repr__(self) -> str:
+    return f"View({self._model.__name__}, {self._data!r})"
+
+  def to_model(self) -> Any:
+    """Decodes all fields into the real model instance."""
+    return DECODERS[self._model](self._data)
+
+
+VIEW_FIELDS: Dict[type, Dict[str, Tuple[str, Optional[Callable[[Any], Any]]]]] = {
+  LinkGeoTargeting: {
+    "ad": ("AD", None),
+    "ae": ("AE", None),
+    "af": ("AF", None),
+    "ag": ("AG", None),
+    "ai": ("AI", None),
+    "al": ("AL", None),
+    "am": ("AM", None),
+    "ao": ("AO", None),
+    "aq": ("AQ", None),
+    "ar": ("AR", None),
+    "link_geo_targeting_as": ("AS", None),
+    "at": ("AT", None),
+    "au": ("AU", None),
+    "aw": ("AW", None),
+    "ax": ("AX", None),
+    "az": ("AZ", None),
+    "ba": ("BA", None),
+    "bb": ("BB", None),
+    "bd": ("BD", None),
+    "be": ("BE", None),
+    "bf": ("BF", None),
+    "bg": ("BG", None),
+    "bh": ("BH", None),
+    "bi": ("BI", None),
+    "bj": ("BJ", None),
+    "bl": ("BL", None),
+    "bm": ("BM", None),
+    "bn": ("BN", None),
+    "bo": ("BO", None),
+    "bq": ("BQ", None),
+    "br": ("BR", None),
+    "bs": ("BS", None),
+    "bt": ("BT", None),
+    "bv": ("BV", None),
+    "bw": ("BW", None),
+    "by": ("BY", None),
+    "bz": ("BZ", None),
+    "ca": ("CA", None),
+    "cc": ("CC", None),
+    "cd": ("CD", None),
+    "cf": ("CF", None),
+    "cg": ("CG", None),
+    "ch": ("CH", None),
+    "ci": ("CI", None),
+    "ck": ("CK", None),
+    "cl": ("CL", None),
+    "cm": ("CM", None),
+    "cn": ("CN", None),
+    "co": ("CO", None),
+    "cr": ("CR", None),
+    "cu": ("CU", None),
+    "cv": ("CV", None),
+    "cw": ("CW", None),
+    "cx": ("CX", None),
+    "cy": ("CY", None),
+    "cz": ("CZ", None),
+    "de": ("DE", None),
+    "dj": ("DJ", None),
+    "dk": ("DK", None),
+    "dm": ("DM", None),
+    "do": ("DO", None),
+    "dz": ("DZ", None),
+    "ec": ("EC", None),
+    "ee": ("EE", None),
+    "eg": ("EG", None),
+    "eh": ("EH", None),
+    "er": ("ER", None),
+    "es": ("ES", None),
+    "et": ("ET", None),
+    "fi": ("FI", None),
+    "fj": ("FJ", None),
+    "fk": ("FK", None),
+    "fm": ("FM", None),
+    "fo": ("FO", None),
+    "fr": ("FR", None),
+    "ga": ("GA", None),
+    "gb": ("GB", None),
+    "gd": ("GD", None),
+    "ge": ("GE", None),
+    "gf": ("GF", None),
+    "gg": ("GG", None),
+    "gh": ("GH", None),
+    "gi": ("GI", None),
+    "gl": ("GL", None),
+    "gm": ("GM", None),
+    "gn": ("GN", None),
+    "gp": ("GP", None),
+    "gq": ("GQ", None),
+    "gr": ("GR", None),
+    "gs": ("GS", None),
+    "gt": ("GT", None),
+    "gu": ("GU", None),
+    "gw": ("GW", None),
+    "gy": ("GY", None),
+    "hk": ("HK", None),
+    "hm": ("HM", None),
+    "hn": ("HN", None),
+    "hr": ("HR", None),
+    "ht": ("HT", None),
+    "hu": ("HU", None),
+    "id": ("ID", None),
+    "ie": ("IE", None),
+    "il": ("IL", None),
+    "im": ("IM", None),
+    "link_geo_targeting_in": ("IN", None),
+    "io": ("IO", None),
+    "iq": ("IQ", None),
+    "ir": ("IR", None),
+    "link_geo_targeting_is": ("IS", None),
+    "it": ("IT", None),
+    "je": ("JE", None),
+    "jm": ("JM", None),
+    "jo": ("JO", None),
+    "jp": ("JP", None),
+    "ke": ("KE", None),
+    "kg": ("KG", None),
+    "kh": ("KH", None),
+    "ki": ("KI", None),
+    "km": ("KM", None),
+    "kn": ("KN", None),
+    "kp": ("KP", None),
+    "kr": ("KR", None),
+    "kw": ("KW", None),
+    "ky": ("KY", None),
+    "kz": ("KZ", None),
+    "la": ("LA", None),
+    "lb": ("LB", None),
+    "lc": ("LC", None),
+    "li": ("LI", None),
+    "lk": ("LK", None),
+    "lr": ("LR", None),
+    "ls": ("LS", None),
+    "lt": ("LT", None),
+    "lu": ("LU", None),
+    "lv": ("LV", None),
+    "ly": ("LY", None),
+    "ma": ("MA", None),
+    "mc": ("MC", None),
+    "md": ("MD", None),
+    "me": ("ME", None),
+    "mf": ("MF", None),
+    "mg": ("MG", None),
+    "mh": ("MH", None),
+    "mk": ("MK", None),
+    "ml": ("ML", None),
+    "mm": ("MM", None),
+    "mn": ("MN", None),
+    "mo": ("MO", None),
+    "mp": ("MP", None),
+    "mq": ("MQ", None),
+    "mr": ("MR", None),
+    "ms": ("MS", None),
+    "mt": ("MT", None),
+    "mu": ("MU", None),
+    "mv": ("MV", None),
+    "mw": ("MW", None),
+    "mx": ("MX", None),
+    "my": ("MY", None),
+    "mz": ("MZ", None),
+    "na": ("NA", None),
+    "nc": ("NC", None),
+    "ne": ("NE", None),
+    "nf": ("NF", None),
+    "ng": ("NG", None),
+    "ni": ("NI", None),
+    "nl": ("NL", None),
+    "no": ("NO", None),
+    "np": ("NP", None),
+    "nr": ("NR", None),
+    "nu": ("NU", None),
+    "nz": ("NZ", None),
+    "om": ("OM", None),
+    "pa": ("PA", None),
+    "pe": ("PE", None),
+    "pf": ("PF", None),
+    "pg": ("PG", None),
+    "ph": ("PH", None),
+    "pk": ("PK", None),
+    "pl": ("PL", None),
+    "pm": ("PM", None),
+    "pn": ("PN", None),
+    "pr": ("PR", None),
+    "ps": ("PS", None),
+    "pt": ("PT", None),
+    "pw": ("PW", None),
+    "py": ("PY", None),
+    "qa": ("QA", None),
+    "re": ("RE", None),
+    "ro": ("RO", None),
+    "rs": ("RS", None),
+    "ru": ("RU", None),
+    "rw": ("RW", None),
+    "sa": ("SA", None),
+    "sb": ("SB", None),
+    "sc": ("SC", None),
+    "sd": ("SD", None),
+    "se": ("SE", None),
+    "sg": ("SG", None),
+    "sh": ("SH", None),
+    "si": ("SI", None),
+    "sj": ("SJ", None),
+    "sk": ("SK", None),
+    "sl": ("SL", None),
+    "sm": ("SM", None),
+    "sn": ("SN", None),
+    "so": ("SO", None),
+    "sr": ("SR", None),
+    "ss": ("SS", None),
+    "st": ("ST", None),
+    "sv": ("SV", None),
+    "sx": ("SX", None),
+    "sy": ("SY", None),
+    "sz": ("SZ", None),
+    "tc": ("TC", None),
+    "td": ("TD", None),
+    "tf": ("TF", None),
+    "tg": ("TG", None),
+    "th": ("TH", None),
+    "tj": ("TJ", None),
+    "tk": ("TK", None),
+    "tl": ("TL", None),
+    "tm": ("TM", None),
+    "tn": ("TN", None),
+    "to": ("TO", None),
+    "tr": ("TR", None),
+    "tt": ("TT", None),
+    "tv": ("TV", None),
+    "tw": ("TW", None),
+    "tz": ("TZ", None),
+    "ua": ("UA", None),
+    "ug": ("UG", None),
+    "um": ("UM", None),
+    "us": ("US", None),
+    "uy": ("UY", None),
+    "uz": ("UZ", None),
+    "va": ("VA", None),
+    "vc": ("VC", None),
+    "ve": ("VE", None),
+    "vg": ("VG", None),
+    "vi": ("VI", None),
+    "vn": ("VN", None),
+    "vu": ("VU", None),
+    "wf": ("WF", None),
+    "ws": ("WS", None),
+    "xk": ("XK", None),
+    "ye": ("YE", None),
+    "yt": ("YT", None),
+    "za": ("ZA", None),
+    "zm": ("ZM", None),
+    "zw": ("ZW", None),
+  },
+  Geo: {
+    "ad": ("AD", None),
+    "ae": ("AE", None),
+    "af": ("AF", None),
+    "ag": ("AG", None),
+    "ai": ("AI", None),
+    "al": ("AL", None),
+    "am": ("AM", None),
+    "ao": ("AO", None),
+    "aq": ("AQ", None),
+    "ar": ("AR", None),
+    "geo_as": ("AS", None),
+    "at": ("AT", None),
+    "au": ("AU", None),
+    "aw": ("AW", None),
+    "ax": ("AX", None),
+    "az": ("AZ", None),
+    "ba": ("BA", None),
+    "bb": ("BB", None),
+    "bd": ("BD", None),
+    "be": ("BE", None),
+    "bf": ("BF", None),
+    "bg": ("BG", None),
+    "bh": ("BH", None),
+    "bi": ("BI", None),
+    "bj": ("BJ", None),
+    "bl": ("BL", None),
+    "bm": ("BM", None),
+    "bn": ("BN", None),
+    "bo": ("BO", None),
+    "bq": ("BQ", None),
+    "br": ("BR", None),
+    "bs": ("BS", None),
+    "bt": ("BT", None),
+    "bv": ("BV", None),
+    "bw": ("BW", None),
+    "by": ("BY", None),
+    "bz": ("BZ", None),
+    "ca": ("CA", None),
+    "cc": ("CC", None),
+    "cd": ("CD", None),
+    "cf": ("CF", None),
+    "cg": ("CG", None),
+    "ch": ("CH", None),
+    "ci": ("CI", None),
+    "ck": ("CK", None),
+    "cl": ("CL", None),
+    "cm": ("CM", None),
+    "cn": ("CN", None),
+    "co": ("CO", None),
+    "cr": ("CR", None),
+    "cu": ("CU", None),
+    "cv": ("CV", None),
+    "cw": ("CW", None),
+    "cx": ("CX", None),
+    "cy": ("CY", None),
+    "cz": ("CZ", None),
+    "de": ("DE", None),
+    "dj": ("DJ", None),
+    "dk": ("DK", None),
+    "dm": ("DM", None),
+    "do": ("DO", None),
+    "dz": ("DZ", None),
+    "ec": ("EC", None),
+    "ee": ("EE", None),
+    "eg": ("EG", None),
+    "eh": ("EH", None),
+    "er": ("ER", None),
+    "es": ("ES", None),
+    "et": ("ET", None),
+    "fi": ("FI", None),
+    "fj": ("FJ", None),
+    "fk": ("FK", None),
+    "fm": ("FM", None),
+    "fo": ("FO", None),
+    "fr": ("FR", None),
+    "ga": ("GA", None),
+    "gb": ("GB", None),
+    "gd": ("GD", None),
+    "ge": ("GE", None),
+    "gf": ("GF", None),
+    "gg": ("GG", None),
+    "gh": ("GH", None),
+    "gi": ("GI", None),
+    "gl": ("GL", None),
+    "gm": ("GM", None),
+    "gn": ("GN", None),
+    "gp": ("GP", None),
+    "gq": ("GQ", None),
+    "gr": ("GR", None),
+    "gs": ("GS", None),
+    "gt": ("GT", None),
+    "gu": ("GU", None),
+    "gw": ("GW", None),
+    "gy": ("GY", None),
+    "hk": ("HK", None),
+    "hm": ("HM", None),
+    "hn": ("HN", None),
+    "hr": ("HR", None),
+    "ht": ("HT", None),
+    "hu": ("HU", None),
+    "id": ("ID", None),
+    "ie": ("IE", None),
+    "il": ("IL", None),
+    "im": ("IM", None),
+    "geo_in": ("IN", None),
+    "io": ("IO", None),
+    "iq": ("IQ", None),
+    "ir": ("IR", None),
+    "geo_is": ("IS", None),
+    "it": ("IT", None),
+    "je": ("JE", None),
+    "jm": ("JM", None),
+    "jo": ("JO", None),
+    "jp": ("JP", None),
+    "ke": ("KE", None),
+    "kg": ("KG", None),
+    "kh": ("KH", None),
+    "ki": ("KI", None),
+    "km": ("KM", None),
+    "kn": ("KN", None),
+    "kp": ("KP", None),
+    "kr": ("KR", None),
+    "kw": ("KW", None),
+    "ky": ("KY", None),
+    "kz": ("KZ", None),
+    "la": ("LA", None),
+    "lb": ("LB", None),
+    "lc": ("LC", None),
+    "li": ("LI", None),
+    "lk": ("LK", None),
+    "lr": ("LR", None),
+    "ls": ("LS", None),
+    "lt": ("LT", None),
+    "lu": ("LU", None),
+    "lv": ("LV", None),
+    "ly": ("LY", None),
+    "ma": ("MA", None),
+    "mc": ("MC", None),
+    "md": ("MD", None),
+    "me": ("ME", None),
+    "mf": ("MF", None),
+    "mg": ("MG", None),
+    "mh": ("MH", None),
+    "mk": ("MK", None),
+    "ml": ("ML", None),
+    "mm": ("MM", None),
+    "mn": ("MN", None),
+    "mo": ("MO", None),
+    "mp": ("MP", None),
+    "mq": ("MQ", None),
+    "mr": ("MR", None),
+    "ms": ("MS", None),
+    "mt": ("MT", None),
+    "mu": ("MU", None),
+    "mv": ("MV", None),
+    "mw": ("MW", None),
+    "mx": ("MX", None),
+    "my": ("MY", None),
+    "mz": ("MZ", None),
+    "na": ("NA", None),
+    "nc": ("NC", None),
+    "ne": ("NE", None),
+    "nf": ("NF", None),
+    "ng": ("NG", None),
+    "ni": ("NI", None),
+    "nl": ("NL", None),
+    "no": ("NO", None),
+    "np": ("NP", None),
+    "nr": ("NR", None),
+    "nu": ("NU", None),
+    "nz": ("NZ", None),
+    "om": ("OM", None),
+    "pa": ("PA", None),
+    "pe": ("PE", None),
+    "pf": ("PF", None),
+    "pg": ("PG", None),
+    "ph": ("PH", None),
+    "pk": ("PK", None),
+    "pl": ("PL", None),
+    "pm": ("PM", None),
+    "pn": ("PN", None),
+    "pr": ("PR", None),
+    "ps": ("PS", None),
+    "pt": ("PT", None),
+    "pw": ("PW", None),
+    "py": ("PY", None),
+    "qa": ("QA", None),
+    "re": ("RE", None),
+    "ro": ("RO", None),
+    "rs": ("RS", None),
+    "ru": ("RU", None),
+    "rw": ("RW", None),
+    "sa": ("SA", None),
+    "sb": ("SB", None),
+    "sc": ("SC", None),
+    "sd": ("SD", None),
+    "se": ("SE", None),
+    "sg": ("SG", None),
+    "sh": ("SH", None),
+    "si": ("SI", None),
+    "sj": ("SJ", None),
+    "sk": ("SK", None),
+    "sl": ("SL", None),
+    "sm": ("SM", None),
+    "sn": ("SN", None),
+    "so": ("SO", None),
+    "sr": ("SR", None),
+    "ss": ("SS", None),
+    "st": ("ST", None),
+    "sv": ("SV", None),
+    "sx": ("SX", None),
+    "sy": ("SY", None),
+    "sz": ("SZ", None),
+    "tc": ("TC", None),
+    "td": ("TD", None),
+    "tf": ("TF", None),
+    "tg": ("TG", None),
+    "th": ("TH", None),
+    "tj": ("TJ", None),
+    "tk": ("TK", None),
+    "tl": ("TL", None),
+    "tm": ("TM", None),
+    "tn": ("TN", None),
+    "to": ("TO", None),
+    "tr": ("TR", None),
+    "tt": ("TT", None),
+    "tv": ("TV", None),
+    "tw": ("TW", None),
+    "tz": ("TZ", None),
+    "ua": ("UA", None),
+    "ug": ("UG", None),
+    "um": ("UM", None),
+    "us": ("US", None),
+    "uy": ("UY", None),
+    "uz": ("UZ", None),
+    "va": ("VA", None),
+    "vc": ("VC", None),
+    "ve": ("VE", None),
+    "vg": ("VG", None),
+    "vi": ("VI", None),
+    "vn": ("VN", None),
+    "vu": ("VU", None),
+    "wf": ("WF", None),
+    "ws": ("WS", None),
+    "xk": ("XK", None),
+    "ye": ("YE", None),
+    "yt": ("YT", None),
+    "za": ("ZA", None),
+    "zm": ("ZM", None),
+    "zw": ("ZW", None),
+  },
+  Tag: {
+    "color": ("color", Color),
+    "id": ("id", None),
+    "name": ("name", None),
+  },
+  Link: {
+    "android": ("android", None),
+    "archived": ("archived", None),
+    "clicks": ("clicks", None),
+    "comments": ("comments", None),
+    "created_at": ("createdAt", None),
+    "description": ("description", None),
+    "do_index": ("doIndex", None),
+    "domain": ("domain", None),
+    "expired_url": ("expiredUrl", None),
+    "expires_at": ("expiresAt", None),
+    "external_id": ("externalId", None),
+    "geo": ("geo", lambda value: View(Geo, value)),
+    "id": ("id", None),
+    "image": ("image", None),
+    "ios": ("ios", None),
+    "key": ("key", None),
+    "last_clicked": ("lastClicked", None),
+    "leads": ("leads", None),
+    "password": ("password", None),
+    "program_id": ("programId", None),
+    "project_id": ("projectId", None),
+    "proxy": ("proxy", None),
+    "public_stats": ("publicStats", None),
+    "qr_code": ("qrCode", None),
+    "rewrite": ("rewrite", None),
+    "sale_amount": ("saleAmount", None),
+    "sales": ("sales", None),
+    "short_link": ("shortLink", None),
+    "tag_id": ("tagId", None),
+    "tags": ("tags", lambda value: [View(Tag, item) for item in value]),
+    "title": ("title", None),
+    "track_conversion": ("trackConversion", None),
+    "updated_at": ("updatedAt", None),
+    "url": ("url", None),
+    "user_id": ("userId", None),
+    "utm_campaign": ("utm_campaign", None),
+    "utm_content": ("utm_content", None),
+    "utm_medium": ("utm_medium", None),
+    "utm_source": ("utm_source", None),
+    "utm_term": ("utm_term", None),
+    "video": ("video", None),
+    "webhook_ids": ("webhookIds", None),
+    "workspace_id": ("workspaceId", None),
+  },
+  AllExportedTypes: {
+    "link_schema": ("link_schema", lambda value: View(Link, value)),
+    "tag_schema": ("tag_schema", lambda value: View(Tag, value)),
+    "link_geo_targeting": ("link_geo_targeting", lambda value: View(LinkGeoTargeting, value)),
+  },
+}
+
+
+def view(cls: Type[T], data: Any) -> T:
+  """Lazy stand-in for a cls instance over decoded JSON, only the fields that are read get converted."""
+  return View(cls, data)  # type: ignore
@@ -0,0 +1,2089 @@
+from dataclasses import dataclass
+from typing import Optional, List, Any, Callable, Dict, FrozenSet, Tuple, Type, TypeVar
+from enum import Enum
+
+
+class SparseModel:
+  """Base of wide models whose fields are mostly None, only the fields that are set are stored."""
+
+  __slots__ = ("_values",)
+  _fields: FrozenSet[str] = frozenset()
+
+  def __init_subclass__(cls, **kwargs: Any):
+    super().__init_subclass__(**kwargs)
+    cls._fields = frozenset(cls.__annotations__)
+
+  def __init__(self, **values: Any):
+    unknown = values.keys() - self._fields
+    if unknown:
+      raise TypeError(f"{type(self).__name__} got unexpected fields {', '.join(sorted(unknown))}")
+    self._values = {name: value for name, value in values.items() if value is not None}
+
+  @classmethod
+  def _from_values(cls, values: Dict[str, Any]) -> Any:
+    instance = cls.__new__(cls)
+    instance._values = values
+    return instance
+
+  def __getattr__(self, name: str) -> Any:
+    if name in self._fields:
+      return self._values.get(name)
+    raise AttributeError(f"{type(self).__name__} has no field {name}")
+
+  def __setattr__(self, name: str, value: Any) -> None:
+    if name not in self._fields:
+      object.__setattr__(self, name, value)
+    elif value is None:
+      self._values.pop(name, None)
+    else:
+      self._values[name] = value
+
+  def __copy__(self) -> Any:
+    return self._from_values(dict(self._values))
+
+  def __eq__(self, other: Any) -> bool:
+    return type(other) is type(self) and other._values == self._values
+
+  def __repr__(self) -> str:
+    fields = ", ".join(f"{name}={value!r}" for name, value in self._values.items())
+    return f"{type(self).__name__}({fields})"
+
+
+class LinkGeoTargeting(SparseModel):
+  """Geo targeting information for the short link in JSON format `{[COUNTRY]:
+  https://example.com }`.
+  """
+  __slots__ = ()
+
+  ad: Optional[str]
+  ae: Optional[str]
+  af: Optional[str]
+  ag: Optional[str]
+  ai: Optional[str]
+  al: Optional[str]
+  am: Optional[str]
+  ao: Optional[str]
+  aq: Optional[str]
+  ar: Optional[str]
+  link_geo_targeting_as: Optional[str]
+  at: Optional[str]
+  au: Optional[str]
+  aw: Optional[str]
+  ax: Optional[str]
+  az: Optional[str]
+  ba: Optional[str]
+  bb: Optional[str]
+  bd: Optional[str]
+  be: Optional[str]
+  bf: Optional[str]
+  bg: Optional[str]
+  bh: Optional[str]
+  bi: Optional[str]
+  bj: Optional[str]
+  bl: Optional[str]
+  bm: Optional[str]
+  bn: Optional[str]
+  bo: Optional[str]
+  bq: Optional[str]
+  br: Optional[str]
+  bs: Optional[str]
+  bt: Optional[str]
+  bv: Optional[str]
+  bw: Optional[str]
+  by: Optional[str]
+  bz: Optional[str]
+  ca: Optional[str]
+  cc: Optional[str]
+  cd: Optional[str]
+  cf: Optional[str]
+  cg: Optional[str]
+  ch: Optional[str]
+  ci: Optional[str]
+  ck: Optional[str]
+  cl: Optional[str]
+  cm: Optional[str]
+  cn: Optional[str]
+  co: Optional[str]
+  cr: Optional[str]
+  cu: Optional[str]
+  cv: Optional[str]
+  cw: Optional[str]
+  cx: Optional[str]
+  cy: Optional[str]
+  cz: Optional[str]
+  de: Optional[str]
+  dj: Optional[str]
+  dk: Optional[str]
+  dm: Optional[str]
+  do: Optional[str]
+  dz: Optional[str]
+  ec: Optional[str]
+  ee: Optional[str]
+  eg: Optional[str]
+  eh: Optional[str]
+  er: Optional[str]
+  es: Optional[str]
+  et: Optional[str]
+  fi: Optional[str]
+  fj: Optional[str]
+  fk: Optional[str]
+  fm: Optional[str]
+  fo: Optional[str]
+  fr: Optional[str]
+  ga: Optional[str]
+  gb: Optional[str]
+  gd: Optional[str]
+  ge: Optional[str]
+  gf: Optional[str]
+  gg: Optional[str]
+  gh: Optional[str]
+  gi: Optional[str]
+  gl: Optional[str]
+  gm: Optional[str]
+  gn: Optional[str]
+  gp: Optional[str]
+  gq: Optional[str]
+  gr: Optional[str]
+  gs: Optional[str]
+  gt: Optional[str]
+  gu: Optional[str]
+  gw: Optional[str]
+  gy: Optional[str]
+  hk: Optional[str]
+  hm: Optional[str]
+  hn: Optional[str]
+  hr: Optional[str]
+  ht: Optional[str]
+  hu: Optional[str]
+  id: Optional[str]
+  ie: Optional[str]
+  il: Optional[str]
+  im: Optional[str]
+  link_geo_targeting_in: Optional[str]
+  io: Optional[str]
+  iq: Optional[str]
+  ir: Optional[str]
+  link_geo_targeting_is: Optional[str]
+  it: Optional[str]
+  je: Optional[str]
+  jm: Optional[str]
+  jo: Optional[str]
+  jp: Optional[str]
+  ke: Optional[str]
+  kg: Optional[str]
+  kh: Optional[str]
+  ki: Optional[str]
+  km: Optional[str]
+  kn: Optional[str]
+  kp: Optional[str]
+  kr: Optional[str]
+  kw: Optional[str]
+  ky: Optional[str]
+  kz: Optional[str]
+  la: Optional[str]
+  lb: Optional[str]
+  lc: Optional[str]
+  li: Optional[str]
+  lk: Optional[str]
+  lr: Optional[str]
+  ls: Optional[str]
+  lt: Optional[str]
+  lu: Optional[str]
+  lv: Optional[str]
+  ly: Optional[str]
+  ma: Optional[str]
+  mc: Optional[str]
+  md: Optional[str]
+  me: Optional[str]
+  mf: Optional[str]
+  mg: Optional[str]
+  mh: Optional[str]
+  mk: Optional[str]
+  ml: Optional[str]
+  mm: Optional[str]
+  mn: Optional[str]
+  mo: Optional[str]
+  mp: Optional[str]
+  mq: Optional[str]
+  mr: Optional[str]
+  ms: Optional[str]
+  mt: Optional[str]
+  mu: Optional[str]
+  mv: Optional[str]
+  mw: Optional[str]
+  mx: Optional[str]
+  my: Optional[str]
+  mz: Optional[str]
+  na: Optional[str]
+  nc: Optional[str]
+  ne: Optional[str]
+  nf: Optional[str]
+  ng: Optional[str]
+  ni: Optional[str]
+  nl: Optional[str]
+  no: Optional[str]
+  np: Optional[str]
+  nr: Optional[str]
+  nu: Optional[str]
+  nz: Optional[str]
+  om: Optional[str]
+  pa: Optional[str]
+  pe: Optional[str]
+  pf: Optional[str]
+  pg: Optional[str]
+  ph: Optional[str]
+  pk: Optional[str]
+  pl: Optional[str]
+  pm: Optional[str]
+  pn: Optional[str]
+  pr: Optional[str]
+  ps: Optional[str]
+  pt: Optional[str]
+  pw: Optional[str]
+  py: Optional[str]
+  qa: Optional[str]
+  re: Optional[str]
+  ro: Optional[str]
+  rs: Optional[str]
+  ru: Optional[str]
+  rw: Optional[str]
+  sa: Optional[str]
+  sb: Optional[str]
+  sc: Optional[str]
+  sd: Optional[str]
+  se: Optional[str]
+  sg: Optional[str]
+  sh: Optional[str]
+  si: Optional[str]
+  sj: Optional[str]
+  sk: Optional[str]
+  sl: Optional[str]
+  sm: Optional[str]
+  sn: Optional[str]
+  so: Optional[str]
+  sr: Optional[str]
+  ss: Optional[str]
+  st: Optional[str]
+  sv: Optional[str]
+  sx: Optional[str]
+  sy: Optional[str]
+  sz: Optional[str]
+  tc: Optional[str]
+  td: Optional[str]
+  tf: Optional[str]
+  tg: Optional[str]
+  th: Optional[str]
+  tj: Optional[str]
+  tk: Optional[str]
+  tl: Optional[str]
+  tm: Optional[str]
+  tn: Optional[str]
+  to: Optional[str]
+  tr: Optional[str]
+  tt: Optional[str]
+  tv: Optional[str]
+  tw: Optional[str]
+  tz: Optional[str]
+  ua: Optional[str]
+  ug: Optional[str]
+  um: Optional[str]
+  us: Optional[str]
+  uy: Optional[str]
+  uz: Optional[str]
+  va: Optional[str]
+  vc: Optional[str]
+  ve: Optional[str]
+  vg: Optional[str]
+  vi: Optional[str]
+  vn: Optional[str]
+  vu: Optional[str]
+  wf: Optional[str]
+  ws: Optional[str]
+  xk: Optional[str]
+  ye: Optional[str]
+  yt: Optional[str]
+  za: Optional[str]
+  zm: Optional[str]
+  zw: Optional[str]
+
+
+class Geo(SparseModel):
+  """Geo targeting information for the short link in JSON format `{[COUNTRY]:
+  https://example.com }`. Learn more: https://d.to/geo
+  """
+  __slots__ = ()
+
+  ad: Optional[str]
+  ae: Optional[str]
+  af: Optional[str]
+  ag: Optional[str]
+  ai: Optional[str]
+  al: Optional[str]
+  am: Optional[str]
+  ao: Optional[str]
+  aq: Optional[str]
+  ar: Optional[str]
+  geo_as: Optional[str]
+  at: Optional[str]
+  au: Optional[str]
+  aw: Optional[str]
+  ax: Optional[str]
+  az: Optional[str]
+  ba: Optional[str]
+  bb: Optional[str]
+  bd: Optional[str]
+  be: Optional[str]
+  bf: Optional[str]
+  bg: Optional[str]
+  bh: Optional[str]
+  bi: Optional[str]
+  bj: Optional[str]
+  bl: Optional[str]
+  bm: Optional[str]
+  bn: Optional[str]
+  bo: Optional[str]
+  bq: Optional[str]
+  br: Optional[str]
+  bs: Optional[str]
+  bt: Optional[str]
+  bv: Optional[str]
+  bw: Optional[str]
+  by: Optional[str]
+  bz: Optional[str]
+  ca: Optional[str]
+  cc: Optional[str]
+  cd: Optional[str]
+  cf: Optional[str]
+  cg: Optional[str]
+  ch: Optional[str]
+  ci: Optional[str]
+  ck: Optional[str]
+  cl: Optional[str]
+  cm: Optional[str]
+  cn: Optional[str]
+  co: Optional[str]
+  cr: Optional[str]
+  cu: Optional[str]
+  cv: Optional[str]
+  cw: Optional[str]
+  cx: Optional[str]
+  cy: Optional[str]
+  cz: Optional[str]
+  de: Optional[str]
+  dj: Optional[str]
+  dk: Optional[str]
+  dm: Optional[str]
+  do: Optional[str]
+  dz: Optional[str]
+  ec: Optional[str]
+  ee: Optional[str]
+  eg: Optional[str]
+  eh: Optional[str]
+  er: Optional[str]
+  es: Optional[str]
+  et: Optional[str]
+  fi: Optional[str]
+  fj: Optional[str]
+  fk: Optional[str]
+  fm: Optional[str]
+  fo: Optional[str]
+  fr: Optional[str]
+  ga: Optional[str]
+  gb: Optional[str]
+  gd: Optional[str]
+  ge: Optional[str]
+  gf: Optional[str]
+  gg: Optional[str]
+  gh: Optional[str]
+  gi: Optional[str]
+  gl: Optional[str]
+  gm: Optional[str]
+  gn: Optional[str]
+  gp: Optional[str]
+  gq: Optional[str]
+  gr: Optional[str]
+  gs: Optional[str]
+  gt: Optional[str]
+  gu: Optional[str]
+  gw: Optional[str]
+  gy: Optional[str]
+  hk: Optional[str]
+  hm: Optional[str]
+  hn: Optional[str]
+  hr: Optional[str]
+  ht: Optional[str]
+  hu: Optional[str]
+  id: Optional[str]
+  ie: Optional[str]
+  il: Optional[str]
+  im: Optional[str]
+  geo_in: Optional[str]
+  io: Optional[str]
+  iq: Optional[str]
+  ir: Optional[str]
+  geo_is: Optional[str]
+  it: Optional[str]
+  je: Optional[str]
+  jm: Optional[str]
+  jo: Optional[str]
+  jp: Optional[str]
+  ke: Optional[str]
+  kg: Optional[str]
+  kh: Optional[str]
+  ki: Optional[str]
+  km: Optional[str]
+  kn: Optional[str]
+  kp: Optional[str]
+  kr: Optional[str]
+  kw: Optional[str]
+  ky: Optional[str]
+  kz: Optional[str]
+  la: Optional[str]
+  lb: Optional[str]
+  lc: Optional[str]
+  li: Optional[str]
+  lk: Optional[str]
+  lr: Optional[str]
+  ls: Optional[str]
+  lt: Optional[str]
+  lu: Optional[str]
+  lv: Optional[str]
+  ly: Optional[str]
+  ma: Optional[str]
+  mc: Optional[str]
+  md: Optional[str]
+  me: Optional[str]
+  mf: Optional[str]
+  mg: Optional[str]
+  mh: Optional[str]
+  mk: Optional[str]
+  ml: Optional[str]
+  mm: Optional[str]
+  mn: Optional[str]
+  mo: Optional[str]
+  mp: Optional[str]
+  mq: Optional[str]
+  mr: Optional[str]
+  ms: Optional[str]
+  mt: Optional[str]
+  mu: Optional[str]
+  mv: Optional[str]
+  mw: Optional[str]
+  mx: Optional[str]
+  my: Optional[str]
+  mz: Optional[str]
+  na: Optional[str]
+  nc: Optional[str]
+  ne: Optional[str]
+  nf: Optional[str]
+  ng: Optional[str]
+  ni: Optional[str]
+  nl: Optional[str]
+  no: Optional[str]
+  np: Optional[str]
+  nr: Optional[str]
+  nu: Optional[str]
+  nz: Optional[str]
+  om: Optional[str]
+  pa: Optional[str]
+  pe: Optional[str]
+  pf: Optional[str]
+  pg: Optional[str]
+  ph: Optional[str]
+  pk: Optional[str]
+  pl: Optional[str]
+  pm: Optional[str]
+  pn: Optional[str]
+  pr: Optional[str]
+  ps: Optional[str]
+  pt: Optional[str]
+  pw: Optional[str]
+  py: Optional[str]
+  qa: Optional[str]
+  re: Optional[str]
+  ro: Optional[str]
+  rs: Optional[str]
+  ru: Optional[str]
+  rw: Optional[str]
+  sa: Optional[str]
+  sb: Optional[str]
+  sc: Optional[str]
+  sd: Optional[str]
+  se: Optional[str]
+  sg: Optional[str]
+  sh: Optional[str]
+  si: Optional[str]
+  sj: Optional[str]
+  sk: Optional[str]
+  sl: Optional[str]
+  sm: Optional[str]
+  sn: Optional[str]
+  so: Optional[str]
+  sr: Optional[str]
+  ss: Optional[str]
+  st: Optional[str]
+  sv: Optional[str]
+  sx: Optional[str]
+  sy: Optional[str]
+  sz: Optional[str]
+  tc: Optional[str]
+  td: Optional[str]
+  tf: Optional[str]
+  tg: Optional[str]
+  th: Optional[str]
+  tj: Optional[str]
+  tk: Optional[str]
+  tl: Optional[str]
+  tm: Optional[str]
+  tn: Optional[str]
+  to: Optional[str]
+  tr: Optional[str]
+  tt: Optional[str]
+  tv: Optional[str]
+  tw: Optional[str]
+  tz: Optional[str]
+  ua: Optional[str]
+  ug: Optional[str]
+  um: Optional[str]
+  us: Optional[str]
+  uy: Optional[str]
+  uz: Optional[str]
+  va: Optional[str]
+  vc: Optional[str]
+  ve: Optional[str]
+  vg: Optional[str]
+  vi: Optional[str]
+  vn: Optional[str]
+  vu: Optional[str]
+  wf: Optional[str]
+  ws: Optional[str]
+  xk: Optional[str]
+  ye: Optional[str]
+  yt: Optional[str]
+  za: Optional[str]
+  zm: Optional[str]
+  zw: Optional[str]
+
+
+class Color(Enum):
+  """The color of the tag."""
+
+  BLUE = "blue"
+  BROWN = "brown"
+  GREEN = "green"
+  PINK = "pink"
+  PURPLE = "purple"
+  RED = "red"
+  YELLOW = "yellow"
+
+
+@dataclass
+class Tag:
+  __slots__ = ("color", "id", "name")
+
+  color: Color
+  """The color of the tag."""
+
+  id: str
+  """The unique ID of the tag."""
+
+  name: str
+  """The name of the tag."""
+
+
+@dataclass
+class Link:
+  __slots__ = (
+    "android",
+    "archived",
+    "clicks",
+    "comments",
+    "created_at",
+    "description",
+    "do_index",
+    "domain",
+    "expired_url",
+    "expires_at",
+    "external_id",
+    "geo",
+    "id",
+    "image",
+    "ios",
+    "key",
+    "last_clicked",
+    "leads",
+    "password",
+    "program_id",
+    "project_id",
+    "proxy",
+    "public_stats",
+    "qr_code",
+    "rewrite",
+    "sale_amount",
+    "sales",
+    "short_link",
+    "tag_id",
+    "tags",
+    "title",
+    "track_conversion",
+    "updated_at",
+    "url",
+    "user_id",
+    "utm_campaign",
+    "utm_content",
+    "utm_medium",
+    "utm_source",
+    "utm_term",
+    "video",
+    "webhook_ids",
+    "workspace_id",
+  )
+
+  android: str
+  """The Android destination URL for the short link for Android device targeting."""
+
+  archived: bool
+  """Whether the short link is archived."""
+
+  clicks: float
+  """The number of clicks on the short link."""
+
+  comments: str
+  """The comments for the short link."""
+
+  created_at: str
+  """The date and time when the short link was created."""
+
+  description: str
+  """The description of the short link generated via `api.dub.co/metatags`. Will be used for
+  Custom Social Media Cards if `proxy` is true.
+  """
+  do_index: bool
+  """Whether to allow search engines to index the short link."""
+
+  domain: str
+  """The domain of the short link. If not provided, the primary domain for the workspace will
+  be used (or `dub.sh` if the workspace has no domains).
+  """
+  expired_url: str
+  """The URL to redirect to when the short link has expired."""
+
+  expires_at: str
+  """The date and time when the short link will expire in ISO-8601 format."""
+
+  external_id: str
+  """This is the ID of the link in your database that is unique across your workspace. If set,
+  it can be used to identify the link in future API requests. Must be prefixed with 'ext_'
+  when passed as a query parameter.
+  """
+  geo: Geo
+  """Geo targeting information for the short link in JSON format `{[COUNTRY]:
+  https://example.com }`. Learn more: https://d.to/geo
+  """
+  id: str
+  """The unique ID of the short link."""
+
+  image: str
+  """The image of the short link generated via `api.dub.co/metatags`. Will be used for Custom
+  Social Media Cards if `proxy` is true.
+  """
+  ios: str
+  """The iOS destination URL for the short link for iOS device targeting."""
+
+  key: str
+  """The short link slug. If not provided, a random 7-character slug will be generated."""
+
+  last_clicked: str
+  """The date and time when the short link was last clicked."""
+
+  leads: float
+  """[BETA]: The number of leads the short links has generated."""
+
+  password: str
+  """The password required to access the destination URL of the short link."""
+
+  program_id: str
+  """The ID of the program the short link is associated with."""
+
+  project_id: str
+  """The project ID of the short link. This field is deprecated – use `workspaceId` instead."""
+
+  proxy: bool
+  """Whether the short link uses Custom Social Media Cards feature."""
+
+  public_stats: bool
+  """Whether the short link's stats are publicly accessible."""
+
+  qr_code: str
+  """The full URL of the QR code for the short link (e.g.
+  `https://api.dub.co/qr?url=https://dub.sh/try`).
+  """
+  rewrite: bool
+  """Whether the short link uses link cloaking."""
+
+  sale_amount: float
+  """[BETA]: The total dollar amount of sales the short links has generated (in cents)."""
+
+  sales: float
+  """[BETA]: The number of sales the short links has generated."""
+
+  short_link: str
+  """The full URL of the short link, including the https protocol (e.g. `https://dub.sh/try`)."""
+
+  tag_id: str
+  """The unique ID of the tag assigned to the short link. This field is deprecated – use
+  `tags` instead.
+  """
+  tags: List[Tag]
+  """The tags assigned to the short link."""
+
+  title: str
+  """The title of the short link generated via `api.dub.co/metatags`. Will be used for Custom
+  Social Media Cards if `proxy` is true.
+  """
+  track_conversion: bool
+  """[BETA] Whether to track conversions for the short link."""
+
+  updated_at: str
+  """The date and time when the short link was last updated."""
+
+  url: str
+  """The destination URL of the short link."""
+
+  user_id: str
+  """The user ID of the creator of the short link."""
+
+  utm_campaign: str
+  """The UTM campaign of the short link."""
+
+  utm_content: str
+  """The UTM content of the short link."""
+
+  utm_medium: str
+  """The UTM medium of the short link."""
+
+  utm_source: str
+  """The UTM source of the short link."""
+
+  utm_term: str
+  """The UTM term of the short link."""
+
+  video: str
+  """The custom link preview video (og:video). Will be used for Custom Social Media Cards if
+  `proxy` is true. Learn more: https://d.to/og
+  """
+  webhook_ids: List[str]
+  """The IDs of the webhooks that the short link is associated with."""
+
+  workspace_id: str
+  """The workspace ID of the short link."""
+
+
+@dataclass
+class AllExportedTypes:
+  __slots__ = ("link_schema", "tag_schema", "link_geo_targeting")
+
+  link_schema: Link
+  tag_schema: Tag
+  link_geo_targeting: LinkGeoTargeting
+
+
+T = TypeVar("T")
+
+
+_LinkGeoTargeting_attributes = {
+  "AD": "ad",
+  "AE": "ae",
+  "AF": "af",
+  "AG": "ag",
+  "AI": "ai",
+  "AL": "al",
+  "AM": "am",
+  "AO": "ao",
+  "AQ": "aq",
+  "AR": "ar",
+  "AS": "link_geo_targeting_as",
+  "AT": "at",
+  "AU": "au",
+  "AW": "aw",
+  "AX": "ax",
+  "AZ": "az",
+  "BA": "ba",
+  "BB": "bb",
+  "BD": "bd",
+  "BE": "be",
+  "BF": "bf",
+  "BG": "bg",
+  "BH": "bh",
+  "BI": "bi",
+  "BJ": "bj",
+  "BL": "bl",
+  "BM": "bm",
+  "BN": "bn",
+  "BO": "bo",
+  "BQ": "bq",
+  "BR": "br",
+  "BS": "bs",
+  "BT": "bt",
+  "BV": "bv",
+  "BW": "bw",
+  "BY": "by",
+  "BZ": "bz",
+  "CA": "ca",
+  "CC": "cc",
+  "CD": "cd",
+  "CF": "cf",
+  "CG": "cg",
+  "CH": "ch",
+  "CI": "ci",
+  "CK": "ck",
+  "CL": "cl",
+  "CM": "cm",
+  "CN": "cn",
+  "CO": "co",
+  "CR": "cr",
+  "CU": "cu",
+  "CV": "cv",
+  "CW": "cw",
+  "CX": "cx",
+  "CY": "cy",
+  "CZ": "cz",
+  "DE": "de",
+  "DJ": "dj",
+  "DK": "dk",
+  "DM": "dm",
+  "DO": "do",
+  "DZ": "dz",
+  "EC": "ec",
+  "EE": "ee",
+  "EG": "eg",
+  "EH": "eh",
+  "ER": "er",
+  "ES": "es",
+  "ET": "et",
+  "FI": "fi",
+  "FJ": "fj",
+  "FK": "fk",
+  "FM": "fm",
+  "FO": "fo",
+  "FR": "fr",
+  "GA": "ga",
+  "GB": "gb",
+  "GD": "gd",
+  "GE": "ge",
+  "GF": "gf",
+  "GG": "gg",
+  "GH": "gh",
+  "GI": "gi",
+  "GL": "gl",
+  "GM": "gm",
+  "GN": "gn",
+  "GP": "gp",
+  "GQ": "gq",
+  "GR": "gr",
+  "GS": "gs",
+  "GT": "gt",
+  "GU": "gu",
+  "GW": "gw",
+  "GY": "gy",
+  "HK": "hk",
+  "HM": "hm",
+  "HN": "hn",
+  "HR": "hr",
+  "HT": "ht",
+  "HU": "hu",
+  "ID": "id",
+  "IE": "ie",
+  "IL": "il",
+  "IM": "im",
+  "IN": "link_geo_targeting_in",
+  "IO": "io",
+  "IQ": "iq",
+  "IR": "ir",
+  "IS": "link_geo_targeting_is",
+  "IT": "it",
+  "JE": "je",
+  "JM": "jm",
+  "JO": "jo",
+  "JP": "jp",
+  "KE": "ke",
+  "KG": "kg",
+  "KH": "kh",
+  "KI": "ki",
+  "KM": "km",
+  "KN": "kn",
+  "KP": "kp",
+  "KR": "kr",
+  "KW": "kw",
+  "KY": "ky",
+  "KZ": "kz",
+  "LA": "la",
+  "LB": "lb",
+  "LC": "lc",
+  "LI": "li",
+  "LK": "lk",
+  "LR": "lr",
+  "LS": "ls",
+  "LT": "lt",
+  "LU": "lu",
+  "LV": "lv",
+  "LY": "ly",
+  "MA": "ma",
+  "MC": "mc",
+  "MD": "md",
+  "ME": "me",
+  "MF": "mf",
+  "MG": "mg",
+  "MH": "mh",
+  "MK": "mk",
+  "ML": "ml",
+  "MM": "mm",
+  "MN": "mn",
+  "MO": "mo",
+  "MP": "mp",
+  "MQ": "mq",
+  "MR": "mr",
+  "MS": "ms",
+  "MT": "mt",
+  "MU": "mu",
+  "MV": "mv",
+  "MW": "mw",
+  "MX": "mx",
+  "MY": "my",
+  "MZ": "mz",
+  "NA": "na",
+  "NC": "nc",
+  "NE": "ne",
+  "NF": "nf",
+  "NG": "ng",
+  "NI": "ni",
+  "NL": "nl",
+  "NO": "no",
+  "NP": "np",
+  "NR": "nr",
+  "NU": "nu",
+  "NZ": "nz",
+  "OM": "om",
+  "PA": "pa",
+  "PE": "pe",
+  "PF": "pf",
+  "PG": "pg",
+  "PH": "ph",
+  "PK": "pk",
+  "PL": "pl",
+  "PM": "pm",
+  "PN": "pn",
+  "PR": "pr",
+  "PS": "ps",
+  "PT": "pt",
+  "PW": "pw",
+  "PY": "py",
+  "QA": "qa",
+  "RE": "re",
+  "RO": "ro",
+  "RS": "rs",
+  "RU": "ru",
+  "RW": "rw",
+  "SA": "sa",
+  "SB": "sb",
+  "SC": "sc",
+  "SD": "sd",
+  "SE": "se",
+  "SG": "sg",
+  "SH": "sh",
+  "SI": "si",
+  "SJ": "sj",
+  "SK": "sk",
+  "SL": "sl",
+  "SM": "sm",
+  "SN": "sn",
+  "SO": "so",
+  "SR": "sr",
+  "SS": "ss",
+  "ST": "st",
+  "SV": "sv",
+  "SX": "sx",
+  "SY": "sy",
+  "SZ": "sz",
+  "TC": "tc",
+  "TD": "td",
+  "TF": "tf",
+  "TG": "tg",
+  "TH": "th",
+  "TJ": "tj",
+  "TK": "tk",
+  "TL": "tl",
+  "TM": "tm",
+  "TN": "tn",
+  "TO": "to",
+  "TR": "tr",
+  "TT": "tt",
+  "TV": "tv",
+  "TW": "tw",
+  "TZ": "tz",
+  "UA": "ua",
+  "UG": "ug",
+  "UM": "um",
+  "US": "us",
+  "UY": "uy",
+  "UZ": "uz",
+  "VA": "va",
+  "VC": "vc",
+  "VE": "ve",
+  "VG": "vg",
+  "VI": "vi",
+  "VN": "vn",
+  "VU": "vu",
+  "WF": "wf",
+  "WS": "ws",
+  "XK": "xk",
+  "YE": "ye",
+  "YT": "yt",
+  "ZA": "za",
+  "ZM": "zm",
+  "ZW": "zw",
+}
+_LinkGeoTargeting_wire_names = {name: key for key, name in _LinkGeoTargeting_attributes.items()}
+
+
+def _decode_LinkGeoTargeting(data: Dict[str, Any]) -> LinkGeoTargeting:
+  attributes = _LinkGeoTargeting_attributes
+  return LinkGeoTargeting._from_values(
+    {attributes[key]: value for key, value in data.items() if value is not None and key in attributes}
+  )
+
+
+_Geo_attributes = {
+  "AD": "ad",
+  "AE": "ae",
+  "AF": "af",
+  "AG": "ag",
+  "AI": "ai",
+  "AL": "al",
+  "AM": "am",
+  "AO": "ao",
+  "AQ": "aq",
+  "AR": "ar",
+  "AS": "geo_as",
+  "AT": "at",
+  "AU": "au",
+  "AW": "aw",
+  "AX": "ax",
+  "AZ": "az",
+  "BA": "ba",
+  "BB": "bb",
+  "BD": "bd",
+  "BE": "be",
+  "BF": "bf",
+  "BG": "bg",
+  "BH": "bh",
+  "BI": "bi",
+  "BJ": "bj",
+  "BL": "bl",
+  "BM": "bm",
+  "BN": "bn",
+  "BO": "bo",
+  "BQ": "bq",
+  "BR": "br",
+  "BS": "bs",
+  "BT": "bt",
+  "BV": "bv",
+  "BW": "bw",
+  "BY": "by",
+  "BZ": "bz",
+  "CA": "ca",
+  "CC": "cc",
+  "CD": "cd",
+  "CF": "cf",
+  "CG": "cg",
+  "CH": "ch",
+  "CI": "ci",
+  "CK": "ck",
+  "CL": "cl",
+  "CM": "cm",
+  "CN": "cn",
+  "CO": "co",
+  "CR": "cr",
+  "CU": "cu",
+  "CV": "cv",
+  "CW": "cw",
+  "CX": "cx",
+  "CY": "cy",
+  "CZ": "cz",
+  "DE": "de",
+  "DJ": "dj",
+  "DK": "dk",
+  "DM": "dm",
+  "DO": "do",
+  "DZ": "dz",
+  "EC": "ec",
+  "EE": "ee",
+  "EG": "eg",
+  "EH": "eh",
+  "ER": "er",
+  "ES": "es",
+  "ET": "et",
+  "FI": "fi",
+  "FJ": "fj",
+  "FK": "fk",
+  "FM": "fm",
+  "FO": "fo",
+  "FR": "fr",
+  "GA": "ga",
+  "GB": "gb",
+  "GD": "gd",
+  "GE": "ge",
+  "GF": "gf",
+  "GG": "gg",
+  "GH": "gh",
+  "GI": "gi",
+  "GL": "gl",
+  "GM": "gm",
+  "GN": "gn",
+  "GP": "gp",
+  "GQ": "gq",
+  "GR": "gr",
+  "GS": "gs",
+  "GT": "gt",
+  "GU": "gu",
+  "GW": "gw",
+  "GY": "gy",
+  "HK": "hk",
+  "HM": "hm",
+  "HN": "hn",
+  "HR": "hr",
+  "HT": "ht",
+  "HU": "hu",
+  "ID": "id",
+  "IE": "ie",
+  "IL": "il",
+  "IM": "im",
+  "IN": "geo_in",
+  "IO": "io",
+  "IQ": "iq",
+  "IR": "ir",
+  "IS": "geo_is",
+  "IT": "it",
+  "JE": "je",
+  "JM": "jm",
+  "JO": "jo",
+  "JP": "jp",
+  "KE": "ke",
+  "KG": "kg",
+  "KH": "kh",
+  "KI": "ki",
+  "KM": "km",
+  "KN": "kn",
+  "KP": "kp",
+  "KR": "kr",
+  "KW": "kw",
+  "KY": "ky",
+  "KZ": "kz",
+  "LA": "la",
+  "LB": "lb",
+  "LC": "lc",
+  "LI": "li",
+  "LK": "lk",
+  "LR": "lr",
+  "LS": "ls",
+  "LT": "lt",
+  "LU": "lu",
+  "LV": "lv",
+  "LY": "ly",
+  "MA": "ma",
+  "MC": "mc",
+  "MD": "md",
+  "ME": "me",
+  "MF": "mf",
+  "MG": "mg",
+  "MH": "mh",
+  "MK": "mk",
+  "ML": "ml",
+  "MM": "mm",
+  "MN": "mn",
+  "MO": "mo",
+  "MP": "mp",
+  "MQ": "mq",
+  "MR": "mr",
+  "MS": "ms",
+  "MT": "mt",
+  "MU": "mu",
+  "MV": "mv",
+  "MW": "mw",
+  "MX": "mx",
+  "MY": "my",
+  "MZ": "mz",
+  "NA": "na",
+  "NC": "nc",
+  "NE": "ne",
+  "NF": "nf",
+  "NG": "ng",
+  "NI": "ni",
+  "NL": "nl",
+  "NO": "no",
+  "NP": "np",
+  "NR": "nr",
+  "NU": "nu",
+  "NZ": "nz",
+  "OM": "om",
+  "PA": "pa",
+  "PE": "pe",
+  "PF": "pf",
+  "PG": "pg",
+  "PH": "ph",
+  "PK": "pk",
+  "PL": "pl",
+  "PM": "pm",
+  "PN": "pn",
+  "PR": "pr",
+  "PS": "ps",
+  "PT": "pt",
+  "PW": "pw",
+  "PY": "py",
+  "QA": "qa",
+  "RE": "re",
+  "RO": "ro",
+  "RS": "rs",
+  "RU": "ru",
+  "RW": "rw",
+  "SA": "sa",
+  "SB": "sb",
+  "SC": "sc",
+  "SD": "sd",
+  "SE": "se",
+  "SG": "sg",
+  "SH": "sh",
+  "SI": "si",
+  "SJ": "sj",
+  "SK": "sk",
+  "SL": "sl",
+  "SM": "sm",
+  "SN": "sn",
+  "SO": "so",
+  "SR": "sr",
+  "SS": "ss",
+  "ST": "st",
+  "SV": "sv",
+  "SX": "sx",
+  "SY": "sy",
+  "SZ": "sz",
+  "TC": "tc",
+  "TD": "td",
+  "TF": "tf",
+  "TG": "tg",
+  "TH": "th",
+  "TJ": "tj",
+  "TK": "tk",
+  "TL": "tl",
+  "TM": "tm",
+  "TN": "tn",
+  "TO": "to",
+  "TR": "tr",
+  "TT": "tt",
+  "TV": "tv",
+  "TW": "tw",
+  "TZ": "tz",
+  "UA": "ua",
+  "UG": "ug",
+  "UM": "um",
+  "US": "us",
+  "UY": "uy",
+  "UZ": "uz",
+  "VA": "va",
+  "VC": "vc",
+  "VE": "ve",
+  "VG": "vg",
+  "VI": "vi",
+  "VN": "vn",
+  "VU": "vu",
+  "WF": "wf",
+  "WS": "ws",
+  "XK": "xk",
+  "YE": "ye",
+  "YT": "yt",
+  "ZA": "za",
+  "ZM": "zm",
+  "ZW": "zw",
+}
+_Geo_wire_names = {name: key for key, name in _Geo_attributes.items()}
+
+
+def _decode_Geo(data: Dict[str, Any]) -> Geo:
+  attributes = _Geo_attributes
+  return Geo._from_values(
+    {attributes[key]: value for key, value in data.items() if value is not None and key in attributes}
+  )
+
+
+def _decode_Tag(data: Dict[str, Any]) -> Tag:
+  return Tag(
+    color=None if data["color"] is None else Color(data["color"]),
+    id=data["id"],
+    name=data["name"],
+  )
+
+
+def _decode_Link(data: Dict[str, Any]) -> Link:
+  return Link(
+    android=data["android"],
+    archived=data["archived"],
+    clicks=data["clicks"],
+    comments=data["comments"],
+    created_at=data["createdAt"],
+    description=data["description"],
+    do_index=data["doIndex"],
+    domain=data["domain"],
+    expired_url=data["expiredUrl"],
+    expires_at=data["expiresAt"],
+    external_id=data["externalId"],
+    geo=None if data["geo"] is None else _decode_Geo(data["geo"]),
+    id=data["id"],
+    image=data["image"],
+    ios=data["ios"],
+    key=data["key"],
+    last_clicked=data["lastClicked"],
+    leads=data["leads"],
+    password=data["password"],
+    program_id=data["programId"],
+    project_id=data["projectId"],
+    proxy=data["proxy"],
+    public_stats=data["publicStats"],
+    qr_code=data["qrCode"],
+    rewrite=data["rewrite"],
+    sale_amount=data["saleAmount"],
+    sales=data["sales"],
+    short_link=data["shortLink"],
+    tag_id=data["tagId"],
+    tags=None if data["tags"] is None else [_decode_Tag(item1) for item1 in data["tags"]],
+    title=data["title"],
+    track_conversion=data["trackConversion"],
+    updated_at=data["updatedAt"],
+    url=data["url"],
+    user_id=data["userId"],
+    utm_campaign=data["utm_campaign"],
+    utm_content=data["utm_content"],
+    utm_medium=data["utm_medium"],
+    utm_source=data["utm_source"],
+    utm_term=data["utm_term"],
+    video=data["video"],
+    webhook_ids=data["webhookIds"],
+    workspace_id=data["workspaceId"],
+  )
+
+
+def _decode_AllExportedTypes(data: Dict[str, Any]) -> AllExportedTypes:
+  return AllExportedTypes(
+    link_schema=None if data["link_schema"] is None else _decode_Link(data["link_schema"]),
+    tag_schema=None if data["tag_schema"] is None else _decode_Tag(data["tag_schema"]),
+    link_geo_targeting=None if data["link_geo_targeting"] is None else _decode_LinkGeoTargeting(data["link_geo_targeting"]),
+  )
+
+
+DECODERS: Dict[type, Callable[[Dict[str, Any]], Any]] = {
+  LinkGeoTargeting: _decode_LinkGeoTargeting,
+  Geo: _decode_Geo,
+  Tag: _decode_Tag,
+  Link: _decode_Link,
+  AllExportedTypes: _decode_AllExportedTypes,
+}
+
+
+def decode(cls: Type[T], data: Any) -> T:
+  """Builds a cls instance from decoded JSON, renaming wire keys and converting nested models."""
+  return DECODERS[cls](data)
+
+
+def _encode_LinkGeoTargeting(obj: LinkGeoTargeting) -> Dict[str, Any]:
+  wire_names = _LinkGeoTargeting_wire_names
+  return {wire_names[name]: value for name, value in obj._values.items()}
+
+
+def _encode_Geo(obj: Geo) -> Dict[str, Any]:
+  wire_names = _Geo_wire_names
+  return {wire_names[name]: value for name, value in obj._values.items()}
+
+
+def _encode_Tag(obj: Tag) -> Dict[str, Any]:
+  return {
+    "color": None if obj.color is None else obj.color.value,
+    "id": obj.id,
+    "name": obj.name,
+  }
+
+
+def _encode_Link(obj: Link) -> Dict[str, Any]:
+  return {
+    "android": obj.android,
+    "archived": obj.archived,
+    "clicks": obj.clicks,
+    "comments": obj.comments,
+    "createdAt": obj.created_at,
+    "description": obj.description,
+    "doIndex": obj.do_index,
+    "domain": obj.domain,
+    "expiredUrl": obj.expired_url,
+    "expiresAt": obj.expires_at,
+    "externalId": obj.external_id,
+    "geo": None if obj.geo is None else _encode_Geo(obj.geo),
+    "id": obj.id,
+    "image": obj.image,
+    "ios": obj.ios,
+    "key": obj.key,
+    "lastClicked": obj.last_clicked,
+    "leads": obj.leads,
+    "password": obj.password,
+    "programId": obj.program_id,
+    "projectId": obj.project_id,
+    "proxy": obj.proxy,
+    "publicStats": obj.public_stats,
+    "qrCode": obj.qr_code,
+    "rewrite": obj.rewrite,
+    "saleAmount": obj.sale_amount,
+    "sales": obj.sales,
+    "shortLink": obj.short_link,
+    "tagId": obj.tag_id,
+    "tags": None if obj.tags is None else [_encode_Tag(item1) for item1 in obj.tags],
+    "title": obj.title,
+    "trackConversion": obj.track_conversion,
+    "updatedAt": obj.updated_at,
+    "url": obj.url,
+    "userId": obj.user_id,
+    "utm_campaign": obj.utm_campaign,
+    "utm_content": obj.utm_content,
+    "utm_medium": obj.utm_medium,
+    "utm_source": obj.utm_source,
+    "utm_term": obj.utm_term,
+    "video": obj.video,
+    "webhookIds": obj.webhook_ids,
+    "workspaceId": obj.workspace_id,
+  }
+
+
+def _encode_AllExportedTypes(obj: AllExportedTypes) -> Dict[str, Any]:
+  return {
+    "link_schema": None if obj.link_schema is None else _encode_Link(obj.link_schema),
+    "tag_schema": None if obj.tag_schema is None else _encode_Tag(obj.tag_schema),
+    "link_geo_targeting": None if obj.link_geo_targeting is None else _encode_LinkGeoTargeting(obj.link_geo_targeting),
+  }
+
+
+ENCODERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+  LinkGeoTargeting: _encode_LinkGeoTargeting,
+  Geo: _encode_Geo,
+  Tag: _encode_Tag,
+  Link: _encode_Link,
+  AllExportedTypes: _encode_AllExportedTypes,
+}
+
+
+def encode(obj: Any) -> Any:
+  """Converts model instances, also in lists and dicts, to JSON values with wire keys and no None optionals."""
+  encoder = ENCODERS.get(type(obj))
+  if encoder is not None:
+    return encoder(obj)
+  if isinstance(obj, list):
+    return [encode(item) for item in obj]
+  if isinstance(obj, dict):
+    return {key: encode(value) for key, value in obj.items()}
+  if isinstance(obj, View):
+    return obj._data
+  return obj
+
+
+class View:
+  """Read only model over its decoded JSON, each field is converted on first access and cached."""
+
+  __slots__ = ("__dict__", "_data", "_fields", "_model")
+
+  def __init__(self, model: type, data: Dict[str, Any]):
+    self._model = model
+    self._data = data
+    self._fields = VIEW_FIELDS[model]
+
+  def __getattr__(self, name: str) -> Any:
+    if name.startswith("_"):
+      raise AttributeError(name)
+    try:
+      key, convert = self._fields[name]
+    except KeyError:
+      raise AttributeError(f"{self._model.__name__} has no field {name}") from None
+    value = self._data.get(key)
+    if value is not None and convert is not None:
+      value = convert(value)
+    self.__dict__[name] = value
+    return value
+
+  def __repr__(self) -> str:
+    return f"View({self._model.__name__}, {self._data!r})"
+
+  def to_model(self) -> Any:
+    """Decodes all fields into the real model instance."""
+    return DECODERS[self._model](self._data)
+
+
+VIEW_FIELDS: Dict[type, Dict[str, Tuple[str, Optional[Callable[[Any], Any]]]]] = {
+  LinkGeoTargeting: {
+    "ad": ("AD", None),
+    "ae": ("AE", None),
+    "af": ("AF", None),
+    "ag": ("AG", None),
+    "ai": ("AI", None),
+    "al": ("AL", None),
+    "am": ("AM", None),
+    "ao": ("AO", None),
+    "aq": ("AQ", None),
+    "ar": ("AR", None),
+    "link_geo_targeting_as": ("AS", None),
+    "at": ("AT", None),
+    "au": ("AU", None),
+    "aw": ("AW", None),
+    "ax": ("AX", None),
+    "az": ("AZ", None),
+    "ba": ("BA", None),
+    "bb": ("BB", None),
+    "bd": ("BD", None),
+    "be": ("BE", None),
+    "bf": ("BF", None),
+    "bg": ("BG", None),
+    "bh": ("BH", None),
+    "bi": ("BI", None),
+    "bj": ("BJ", None),
+    "bl": ("BL", None),
+    "bm": ("BM", None),
+    "bn": ("BN", None),
+    "bo": ("BO", None),
+    "bq": ("BQ", None),
+    "br": ("BR", None),
+    "bs": ("BS", None),
+    "bt": ("BT", None),
+    "bv": ("BV", None),
+    "bw": ("BW", None),
+    "by": ("BY", None),
+    "bz": ("BZ", None),
+    "ca": ("CA", None),
+    "cc": ("CC", None),
+    "cd": ("CD", None),
+    "cf": ("CF", None),
+    "cg": ("CG", None),
+    "ch": ("CH", None),
+    "ci": ("CI", None),
+    "ck": ("CK", None),
+    "cl": ("CL", None),
+    "cm": ("CM", None),
+    "cn": ("CN", None),
+    "co": ("CO", None),
+    "cr": ("CR", None),
+    "cu": ("CU", None),
+    "cv": ("CV", None),
+    "cw": ("CW", None),
+    "cx": ("CX", None),
+    "cy": ("CY", None),
+    "cz": ("CZ", None),
+    "de": ("DE", None),
+    "dj": ("DJ", None),
+    "dk": ("DK", None),
+    "dm": ("DM", None),
+    "do": ("DO", None),
+    "dz": ("DZ", None),
+    "ec": ("EC", None),
+    "ee": ("EE", None),
+    "eg": ("EG", None),
+    "eh": ("EH", None),
+    "er": ("ER", None),
+    "es": ("ES", None),
+    "et": ("ET", None),
+    "fi": ("FI", None),
+    "fj": ("FJ", None),
+    "fk": ("FK", None),
+    "fm": ("FM", None),
+    "fo": ("FO", None),
+    "fr": ("FR", None),
+    "ga": ("GA", None),
+    "gb": ("GB", None),
+    "gd": ("GD", None),
+    "ge": ("GE", None),
+    "gf": ("GF", None),
+    "gg": ("GG", None),
+    "gh": ("GH", None),
+    "gi": ("GI", None),
+    "gl": ("GL", None),
+    "gm": ("GM", None),
+    "gn": ("GN", None),
+    "gp": ("GP", None),
+    "gq": ("GQ", None),
+    "gr": ("GR", None),
+    "gs": ("GS", None),
+    "gt": ("GT", None),
+    "gu": ("GU", None),
+    "gw": ("GW", None),
+    "gy": ("GY", None),
+    "hk": ("HK", None),
+    "hm": ("HM", None),
+    "hn": ("HN", None),
+    "hr": ("HR", None),
+    "ht": ("HT", None),
+    "hu": ("HU", None),
+    "id": ("ID", None),
+    "ie": ("IE", None),
+    "il": ("IL", None),
+    "im": ("IM", None),
+    "link_geo_targeting_in": ("IN", None),
+    "io": ("IO", None),
+    "iq": ("IQ", None),
+    "ir": ("IR", None),
+    "link_geo_targeting_is": ("IS", None),
+    "it": ("IT", None),
+    "je": ("JE", None),
+    "jm": ("JM", None),
+    "jo": ("JO", None),
+    "jp": ("JP", None),
+    "ke": ("KE", None),
+    "kg": ("KG", None),
+    "kh": ("KH", None),
+    "ki": ("KI", None),
+    "km": ("KM", None),
+    "kn": ("KN", None),
+    "kp": ("KP", None),
+    "kr": ("KR", None),
+    "kw": ("KW", None),
+    "ky": ("KY", None),
+    "kz": ("KZ", None),
+    "la": ("LA", None),
+    "lb": ("LB", None),
+    "lc": ("LC", None),
+    "li": ("LI", None),
+    "lk": ("LK", None),
+    "lr": ("LR", None),
+    "ls": ("LS", None),
+    "lt": ("LT", None),
+    "lu": ("LU", None),
+    "lv": ("LV", None),
+    "ly": ("LY", None),
+    "ma": ("MA", None),
+    "mc": ("MC", None),
+    "md": ("MD", None),
+    "me": ("ME", None),
+    "mf": ("MF", None),
+    "mg": ("MG", None),
+    "mh": ("MH", None),
+    "mk": ("MK", None),
+    "ml": ("ML", None),
+    "mm": ("MM", None),
+    "mn": ("MN", None),
+    "mo": ("MO", None),
+    "mp": ("MP", None),
+    "mq": ("MQ", None),
+    "mr": ("MR", None),
+    "ms": ("MS", None),
+    "mt": ("MT", None),
+    "mu": ("MU", None),
+    "mv": ("MV", None),
+    "mw": ("MW", None),
+    "mx": ("MX", None),
+    "my": ("MY", None),
+    "mz": ("MZ", None),
+    "na": ("NA", None),
+    "nc": ("NC", None),
+    "ne": ("NE", None),
+    "nf": ("NF", None),
+    "ng": ("NG", None),
+    "ni": ("NI", None),
+    "nl": ("NL", None),
+    "no": ("NO", None),
+    "np": ("NP", None),
+    "nr": ("NR", None),
+    "nu": ("NU", None),
+    "nz": ("NZ", None),
+    "om": ("OM", None),
+    "pa": ("PA", None),
+    "pe": ("PE", None),
+    "pf": ("PF", None),
+    "pg": ("PG", None),
+    "ph": ("PH", None),
+    "pk": ("PK", None),
+    "pl": ("PL", None),
+    "pm": ("PM", None),
+    "pn": ("PN", None),
+    "pr": ("PR", None),
+    "ps": ("PS", None),
+    "pt": ("PT", None),
+    "pw": ("PW", None),
+    "py": ("PY", None),
+    "qa": ("QA", None),
+    "re": ("RE", None),
+    "ro": ("RO", None),
+    "rs": ("RS", None),
+    "ru": ("RU", None),
+    "rw": ("RW", None),
+    "sa": ("SA", None),
+    "sb": ("SB", None),
+    "sc": ("SC", None),
+    "sd": ("SD", None),
+    "se": ("SE", None),
+    "sg": ("SG", None),
+    "sh": ("SH", None),
+    "si": ("SI", None),
+    "sj": ("SJ", None),
+    "sk": ("SK", None),
+    "sl": ("SL", None),
+    "sm": ("SM", None),
+    "sn": ("SN", None),
+    "so": ("SO", None),
+    "sr": ("SR", None),
+    "ss": ("SS", None),
+    "st": ("ST", None),
+    "sv": ("SV", None),
+    "sx": ("SX", None),
+    "sy": ("SY", None),
+    "sz": ("SZ", None),
+    "tc": ("TC", None),
+    "td": ("TD", None),
+    "tf": ("TF", None),
+    "tg": ("TG", None),
+    "th": ("TH", None),
+    "tj": ("TJ", None),
+    "tk": ("TK", None),
+    "tl": ("TL", None),
+    "tm": ("TM", None),
+    "tn": ("TN", None),
+    "to": ("TO", None),
+    "tr": ("TR", None),
+    "tt": ("TT", None),
+    "tv": ("TV", None),
+    "tw": ("TW", None),
+    "tz": ("TZ", None),
+    "ua": ("UA", None),
+    "ug": ("UG", None),
+    "um": ("UM", None),
+    "us": ("US", None),
+    "uy": ("UY", None),
+    "uz": ("UZ", None),
+    "va": ("VA", None),
+    "vc": ("VC", None),
+    "ve": ("VE", None),
+    "vg": ("VG", None),
+    "vi": ("VI", None),
+    "vn": ("VN", None),
+    "vu": ("VU", None),
+    "wf": ("WF", None),
+    "ws": ("WS", None),
+    "xk": ("XK", None),
+    "ye": ("YE", None),
+    "yt": ("YT", None),
+    "za": ("ZA", None),
+    "zm": ("ZM", None),
+    "zw": ("ZW", None),
+  },
+  Geo: {
+    "ad": ("AD", None),
+    "ae": ("AE", None),
+    "af": ("AF", None),
+    "ag": ("AG", None),
+    "ai": ("AI", None),
+    "al": ("AL", None),
+    "am": ("AM", None),
+    "ao": ("AO", None),
+    "aq": ("AQ", None),
+    "ar": ("AR", None),
+    "geo_as": ("AS", None),
+    "at": ("AT", None),
+    "au": ("AU", None),
+    "aw": ("AW", None),
+    "ax": ("AX", None),
+    "az": ("AZ", None),
+    "ba": ("BA", None),
+    "bb": ("BB", None),
+    "bd": ("BD", None),
+    "be": ("BE", None),
+    "bf": ("BF", None),
+    "bg": ("BG", None),
+    "bh": ("BH", None),
+    "bi": ("BI", None),
+    "bj": ("BJ", None),
+    "bl": ("BL", None),
+    "bm": ("BM", None),
+    "bn": ("BN", None),
+    "bo": ("BO", None),
+    "bq": ("BQ", None),
+    "br": ("BR", None),
+    "bs": ("BS", None),
+    "bt": ("BT", None),
+    "bv": ("BV", None),
+    "bw": ("BW", None),
+    "by": ("BY", None),
+    "bz": ("BZ", None),
+    "ca": ("CA", None),
+    "cc": ("CC", None),
+    "cd": ("CD", None),
+    "cf": ("CF", None),
+    "cg": ("CG", None),
+    "ch": ("CH", None),
+    "ci": ("CI", None),
+    "ck": ("CK", None),
+    "cl": ("CL", None),
+    "cm": ("CM", None),
+    "cn": ("CN", None),
+    "co": ("CO", None),
+    "cr": ("CR", None),
+    "cu": ("CU", None),
+    "cv": ("CV", None),
+    "cw": ("CW", None),
+    "cx": ("CX", None),
+    "cy": ("CY", None),
+    "cz": ("CZ", None),
+    "de": ("DE", None),
+    "dj": ("DJ", None),
+    "dk": ("DK", None),
+    "dm": ("DM", None),
+    "do": ("DO", None),
+    "dz": ("DZ", None),
+    "ec": ("EC", None),
+    "ee": ("EE", None),
+    "eg": ("EG", None),
+    "eh": ("EH", None),
+    "er": ("ER", None),
+    "es": ("ES", None),
+    "et": ("ET", None),
+    "fi": ("FI", None),
+    "fj": ("FJ", None),
+    "fk": ("FK", None),
+    "fm": ("FM", None),
+    "fo": ("FO", None),
+    "fr": ("FR", None),
+    "ga": ("GA", None),
+    "gb": ("GB", None),
+    "gd": ("GD", None),
+    "ge": ("GE", None),
+    "gf": ("GF", None),
+    "gg": ("GG", None),
+    "gh": ("GH", None),
+    "gi": ("GI", None),
+    "gl": ("GL", None),
+    "gm": ("GM", None),
+    "gn": ("GN", None),
+    "gp": ("GP", None),
+    "gq": ("GQ", None),
+    "gr": ("GR", None),
+    "gs": ("GS", None),
+    "gt": ("GT", None),
+    "gu": ("GU", None),
+    "gw": ("GW", None),
+    "gy": ("GY", None),
+    "hk": ("HK", None),
+    "hm": ("HM", None),
+    "hn": ("HN", None),
+    "hr": ("HR", None),
+    "ht": ("HT", None),
+    "hu": ("HU", None),
+    "id": ("ID", None),
+    "ie": ("IE", None),
+    "il": ("IL", None),
+    "im": ("IM", None),
+    "geo_in": ("IN", None),
+    "io": ("IO", None),
+    "iq": ("IQ", None),
+    "ir": ("IR", None),
+    "geo_is": ("IS", None),
+    "it": ("IT", None),
+    "je": ("JE", None),
+    "jm": ("JM", None),
+    "jo": ("JO", None),
+    "jp": ("JP", None),
+    "ke": ("KE", None),
+    "kg": ("KG", None),
+    "kh": ("KH", None),
+    "ki": ("KI", None),
+    "km": ("KM", None),
+    "kn": ("KN", None),
+    "kp": ("KP", None),
+    "kr": ("KR", None),
+    "kw": ("KW", None),
+    "ky": ("KY", None),
+    "kz": ("KZ", None),
+    "la": ("LA", None),
+    "lb": ("LB", None),
+    "lc": ("LC", None),
+    "li": ("LI", None),
+    "lk": ("LK", None),
+    "lr": ("LR", None),
+    "ls": ("LS", None),
+    "lt": ("LT", None),
+    "lu": ("LU", None),
+    "lv": ("LV", None),
+    "ly": ("LY", None),
+    "ma": ("MA", None),
+    "mc": ("MC", None),
+    "md": ("MD", None),
+    "me": ("ME", None),
+    "mf": ("MF", None),
+    "mg": ("MG", None),
+    "mh": ("MH", None),
+    "mk": ("MK", None),
+    "ml": ("ML", None),
+    "mm": ("MM", None),
+    "mn": ("MN", None),
+    "mo": ("MO", None),
+    "mp": ("MP", None),
+    "mq": ("MQ", None),
+    "mr": ("MR", None),
+    "ms": ("MS", None),
+    "mt": ("MT", None),
+    "mu": ("MU", None),
+    "mv": ("MV", None),
+    "mw": ("MW", None),
+    "mx": ("MX", None),
+    "my": ("MY", None),
+    "mz": ("MZ", None),
+    "na": ("NA", None),
+    "nc": ("NC", None),
+    "ne": ("NE", None),
+    "nf": ("NF", None),
+    "ng": ("NG", None),
+    "ni": ("NI", None),
+    "nl": ("NL", None),
+    "no": ("NO", None),
+    "np": ("NP", None),
+    "nr": ("NR", None),
+    "nu": ("NU", None),
+    "nz": ("NZ", None),
+    "om": ("OM", None),
+    "pa": ("PA", None),
+    "pe": ("PE", None),
+    "pf": ("PF", None),
+    "pg": ("PG", None),
+    "ph": ("PH", None),
+    "pk": ("PK", None),
+    "pl": ("PL", None),
+    "pm": ("PM", None),
+    "pn": ("PN", None),
+    "pr": ("PR", None),
+    "ps": ("PS", None),
+    "pt": ("PT", None),
+    "pw": ("PW", None),
+    "py": ("PY", None),
+    "qa": ("QA", None),
+    "re": ("RE", None),
+    "ro": ("RO", None),
+    "rs": ("RS", None),
+    "ru": ("RU", None),
+    "rw": ("RW", None),
+    "sa": ("SA", None),
+    "sb": ("SB", None),
+    "sc": ("SC", None),
+    "sd": ("SD", None),
+    "se": ("SE", None),
+    "sg": ("SG", None),
+    "sh": ("SH", None),
+    "si": ("SI", None),
+    "sj": ("SJ", None),
+    "sk": ("SK", None),
+    "sl": ("SL", None),
+    "sm": ("SM", None),
+    "sn": ("SN", None),
+    "so": ("SO", None),
+    "sr": ("SR", None),
+    "ss": ("SS", None),
+    "st": ("ST", None),
+    "sv": ("SV", None),
+    "sx": ("SX", None),
+    "sy": ("SY", None),
+    "sz": ("SZ", None),
+    "tc": ("TC", None),
+    "td": ("TD", None),
+    "tf": ("TF", None),
+    "tg": ("TG", None),
+    "th": ("TH", None),
+    "tj": ("TJ", None),
+    "tk": ("TK", None),
+    "tl": ("TL", None),
+    "tm": ("TM", None),
+    "tn": ("TN", None),
+    "to": ("TO", None),
+    "tr": ("TR", None),
+    "tt": ("TT", None),
+    "tv": ("TV", None),
+    "tw": ("TW", None),
+    "tz": ("TZ", None),
+    "ua": ("UA", None),
+    "ug": ("UG", None),
+    "um": ("UM", None),
+    "us": ("US", None),
+    "uy": ("UY", None),
+    "uz": ("UZ", None),
+    "va": ("VA", None),
+    "vc": ("VC", None),
+    "ve": ("VE", None),
+    "vg": ("VG", None),
+    "vi": ("VI", None),
+    "vn": ("VN", None),
+    "vu": ("VU", None),
+    "wf": ("WF", None),
+    "ws": ("WS", None),
+    "xk": ("XK", None),
+    "ye": ("YE", None),
+    "yt": ("YT", None),
+    "za": ("ZA", None),
+    "zm": ("ZM", None),
+    "zw": ("ZW", None),
+  },
+  Tag: {
+    "color": ("color", Color),
+    "id": ("id", None),
+    "name": ("name", None),
+  },
+  Link: {
+    "android": ("android", None),
+    "archived": ("archived", None),
+    "clicks": ("clicks", None),
+    "comments": ("comments", None),
+    "created_at": ("createdAt", None),
+    "description": ("description", None),
+    "do_index": ("doIndex", None),
+    "domain": ("domain", None),
+    "expired_url": ("expiredUrl", None),
+    "expires_at": ("expiresAt", None),
+    "external_id": ("externalId", None),
+    "geo": ("geo", lambda value: View(Geo, value)),
+    "id": ("id", None),
+    "image": ("image", None),
+    "ios": ("ios", None),
+    "key": ("key", None),
+    "last_clicked": ("lastClicked", None),
+    "leads": ("leads", None),
+    "password": ("password", None),
+    "program_id": ("programId", None),
+    "project_id": ("projectId", None),
+    "proxy": ("proxy", None),
+    "public_stats": ("publicStats", None),
+    "qr_code": ("qrCode", None),
+    "rewrite": ("rewrite", None),
+    "sale_amount": ("saleAmount", None),
+    "sales": ("sales", None),
+    "short_link": ("shortLink", None),
+    "tag_id": ("tagId", None),
+    "tags": ("tags", lambda value: [View(Tag, item) for item in value]),
+    "title": ("title", None),
+    "track_conversion": ("trackConversion", None),
+    "updated_at": ("updatedAt", None),
+    "url": ("url", None),
+    "user_id": ("userId", None),
+    "utm_campaign": ("utm_campaign", None),
+    "utm_content": ("utm_content", None),
+    "utm_medium": ("utm_medium", None),
+    "utm_source": ("utm_source", None),
+    "utm_term": ("utm_term", None),
+    "video": ("video", None),
+    "webhook_ids": ("webhookIds", None),
+    "workspace_id": ("workspaceId", None),
+  },
+  AllExportedTypes: {
+    "link_schema": ("link_schema", lambda value: View(Link, value)),
+    "tag_schema": ("tag_schema", lambda value: View(Tag, value)),
+    "link_geo_targeting": ("link_geo_targeting", lambda value: View(LinkGeoTargeting, value)),
+  },
+}
+
+
+def view(cls: Type[T], data: Any) -> T:
+  """Lazy stand-in for a cls instance over decoded JSON, only the fields that are read get converted."""
+  return View(cls, data)  # type: ignore
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, Any, Callable, Dict, Tuple, Type, TypeVar
 
 
 @dataclass
@@ -292,3 +292,672 @@ class AllExportedTypes:
   v1_ratelimit_ratelimit_response_body: V1RatelimitRatelimitResponseBody
   validation_error: ValidationError
   validation_error_detail: AllExportedType
+
+
+T = TypeVar("T")
+
+
+def _decode_BaseError(data: Dict[str, Any]) -> BaseError:
+  return BaseError(
+    detail=data["detail"],
+    instance=data["instance"],
+    request_id=data["requestId"],
+    status=data["status"],
+    title=data["title"],
+    type=data["type"],
+  )
+
+
+def _decode_Encrypted(data: Dict[str, Any]) -> Encrypted:
+  return Encrypted(
+    encrypted=data["encrypted"],
+    key_id=data["keyId"],
+  )
+
+
+def _decode_Item(data: Dict[str, Any]) -> Item:
+  return Item(
+    duration=data["duration"],
+    identifier=data["identifier"],
+    limit=data["limit"],
+    cost=data.get("cost"),
+  )
+
+
+def _decode_Lease(data: Dict[str, Any]) -> Lease:
+  return Lease(
+    cost=data["cost"],
+    timeout=data["timeout"],
+  )
+
+
+def _decode_SingleRatelimitResponse(data: Dict[str, Any]) -> SingleRatelimitResponse:
+  return SingleRatelimitResponse(
+    current=data["current"],
+    limit=data["limit"],
+    remaining=data["remaining"],
+    reset=data["reset"],
+    success=data["success"],
+  )
+
+
+def _decode_V0EventsResponseBody(data: Dict[str, Any]) -> V0EventsResponseBody:
+  return V0EventsResponseBody(
+    quarantined_rows=data["quarantined_rows"],
+    successful_rows=data["successful_rows"],
+    schema=data.get("$schema"),
+  )
+
+
+def _decode_V1DecryptRequestBody(data: Dict[str, Any]) -> V1DecryptRequestBody:
+  return V1DecryptRequestBody(
+    encrypted=data["encrypted"],
+    keyring=data["keyring"],
+    schema=data.get("$schema"),
+  )
+
+
+def _decode_V1DecryptResponseBody(data: Dict[str, Any]) -> V1DecryptResponseBody:
+  return V1DecryptResponseBody(
+    plaintext=data["plaintext"],
+    schema=data.get("$schema"),
+  )
+
+
+def _decode_V1EncryptBulkRequestBody(data: Dict[str, Any]) -> V1EncryptBulkRequestBody:
+  return V1EncryptBulkRequestBody(
+    data=data["data"],
+    keyring=data["keyring"],
+    schema=data.get("$schema"),
+  )
+
+
+def _decode_V1EncryptBulkResponseBody(data: Dict[str, Any]) -> V1EncryptBulkResponseBody:
+  return V1EncryptBulkResponseBody(
+    encrypted=None if data["encrypted"] is None else [_decode_Encrypted(item1) for item1 in data["encrypted"]],
+    schema=data.get("$schema"),
+  )
+
+
+def _decode_V1EncryptRequestBody(data: Dict[str, Any]) -> V1EncryptRequestBody:
+  return V1EncryptRequestBody(
+    data=data["data"],
+    keyring=data["keyring"],
+    schema=data.get("$schema"),
+  )
+
+
+def _decode_V1EncryptResponseBody(data: Dict[str, Any]) -> V1EncryptResponseBody:
+  return V1EncryptResponseBody(
+    encrypted=data["encrypted"],
+    key_id=data["keyId"],
+    schema=data.get("$schema"),
+  )
+
+
+def _decode_V1LivenessResponseBody(data: Dict[str, Any]) -> V1LivenessResponseBody:
+  return V1LivenessResponseBody(
+    message=data["message"],
+    schema=data.get("$schema"),
+  )
+
+
+def _decode_V1RatelimitCommitLeaseRequestBody(data: Dict[str, Any]) -> V1RatelimitCommitLeaseRequestBody:
+  return V1RatelimitCommitLeaseRequestBody(
+    cost=data["cost"],
+    lease=data["lease"],
+    schema=data.get("$schema"),
+  )
+
+
+def _decode_V1RatelimitMultiRatelimitRequestBody(data: Dict[str, Any]) -> V1RatelimitMultiRatelimitRequestBody:
+  return V1RatelimitMultiRatelimitRequestBody(
+    ratelimits=None if data["ratelimits"] is None else [_decode_Item(item1) for item1 in data["ratelimits"]],
+    schema=data.get("$schema"),
+  )
+
+
+def _decode_V1RatelimitMultiRatelimitResponseBody(data: Dict[str, Any]) -> V1RatelimitMultiRatelimitResponseBody:
+  return V1RatelimitMultiRatelimitResponseBody(
+    ratelimits=None if data["ratelimits"] is None else [_decode_SingleRatelimitResponse(item1) for item1 in data["ratelimits"]],
+    schema=data.get("$schema"),
+  )
+
+
+def _decode_V1RatelimitRatelimitRequestBody(data: Dict[str, Any]) -> V1RatelimitRatelimitRequestBody:
+  return V1RatelimitRatelimitRequestBody(
+    duration=data["duration"],
+    identifier=data["identifier"],
+    limit=data["limit"],
+    schema=data.get("$schema"),
+    cost=data.get("cost"),
+    lease=None if data.get("lease") is None else _decode_Lease(data.get("lease")),
+  )
+
+
+def _decode_V1RatelimitRatelimitResponseBody(data: Dict[str, Any]) -> V1RatelimitRatelimitResponseBody:
+  return V1RatelimitRatelimitResponseBody(
+    current=data["current"],
+    lease=data["lease"],
+    limit=data["limit"],
+    remaining=data["remaining"],
+    reset=data["reset"],
+    success=data["success"],
+    schema=data.get("$schema"),
+  )
+
+
+def _decode_AllExportedType(data: Dict[str, Any]) -> AllExportedType:
+  return AllExportedType(
+    location=data["location"],
+    message=data["message"],
+    fix=data.get("fix"),
+  )
+
+
+def _decode_ValidationError(data: Dict[str, Any]) -> ValidationError:
+  return ValidationError(
+    detail=data["detail"],
+    errors=None if data["errors"] is None else [_decode_AllExportedType(item1) for item1 in data["errors"]],
+    instance=data["instance"],
+    request_id=data["requestId"],
+    status=data["status"],
+    title=data["title"],
+    type=data["type"],
+  )
+
+
+def _decode_AllExportedTypes(data: Dict[str, Any]) -> AllExportedTypes:
+  return AllExportedTypes(
+    base_error=None if data["base_error"] is None else _decode_BaseError(data["base_error"]),
+    encrypted=None if data["encrypted"] is None else _decode_Encrypted(data["encrypted"]),
+    item=None if data["item"] is None else _decode_Item(data["item"]),
+    lease=None if data["lease"] is None else _decode_Lease(data["lease"]),
+    single_ratelimit_response=None if data["single_ratelimit_response"] is None else _decode_SingleRatelimitResponse(data["single_ratelimit_response"]),
+    v0_events_request_body=data["v0_events_request_body"],
+    v0_events_response_body=None if data["v0_events_response_body"] is None else _decode_V0EventsResponseBody(data["v0_events_response_body"]),
+    v1_decrypt_request_body=None if data["v1_decrypt_request_body"] is None else _decode_V1DecryptRequestBody(data["v1_decrypt_request_body"]),
+    v1_decrypt_response_body=None if data["v1_decrypt_response_body"] is None else _decode_V1DecryptResponseBody(data["v1_decrypt_response_body"]),
+    v1_encrypt_bulk_request_body=None if data["v1_encrypt_bulk_request_body"] is None else _decode_V1EncryptBulkRequestBody(data["v1_encrypt_bulk_request_body"]),
+    v1_encrypt_bulk_response_body=None if data["v1_encrypt_bulk_response_body"] is None else _decode_V1EncryptBulkResponseBody(data["v1_encrypt_bulk_response_body"]),
+    v1_encrypt_request_body=None if data["v1_encrypt_request_body"] is None else _decode_V1EncryptRequestBody(data["v1_encrypt_request_body"]),
+    v1_encrypt_response_body=None if data["v1_encrypt_response_body"] is None else _decode_V1EncryptResponseBody(data["v1_encrypt_response_body"]),
+    v1_liveness_response_body=None if data["v1_liveness_response_body"] is None else _decode_V1LivenessResponseBody(data["v1_liveness_response_body"]),
+    v1_ratelimit_commit_lease_request_body=None if data["v1_ratelimit_commit_lease_request_body"] is None else _decode_V1RatelimitCommitLeaseRequestBody(data["v1_ratelimit_commit_lease_request_body"]),
+    v1_ratelimit_multi_ratelimit_request_body=None if data["v1_ratelimit_multi_ratelimit_request_body"] is None else _decode_V1RatelimitMultiRatelimitRequestBody(data["v1_ratelimit_multi_ratelimit_request_body"]),
+    v1_ratelimit_multi_ratelimit_response_body=None if data["v1_ratelimit_multi_ratelimit_response_body"] is None else _decode_V1RatelimitMultiRatelimitResponseBody(data["v1_ratelimit_multi_ratelimit_response_body"]),
+    v1_ratelimit_ratelimit_request_body=None if data["v1_ratelimit_ratelimit_request_body"] is None else _decode_V1RatelimitRatelimitRequestBody(data["v1_ratelimit_ratelimit_request_body"]),
+    v1_ratelimit_ratelimit_response_body=None if data["v1_ratelimit_ratelimit_response_body"] is None else _decode_V1RatelimitRatelimitResponseBody(data["v1_ratelimit_ratelimit_response_body"]),
+    validation_error=None if data["validation_error"] is None else _decode_ValidationError(data["validation_error"]),
+    validation_error_detail=None if data["validation_error_detail"] is None else _decode_AllExportedType(data["validation_error_detail"]),
+  )
+
+
+DECODERS: Dict[type, Callable[[Dict[str, Any]], Any]] = {
+  BaseError: _decode_BaseError,
+  Encrypted: _decode_Encrypted,
+  Item: _decode_Item,
+  Lease: _decode_Lease,
+  SingleRatelimitResponse: _decode_SingleRatelimitResponse,
+  V0EventsResponseBody: _decode_V0EventsResponseBody,
+  V1DecryptRequestBody: _decode_V1DecryptRequestBody,
+  V1DecryptResponseBody: _decode_V1DecryptResponseBody,
+  V1EncryptBulkRequestBody: _decode_V1EncryptBulkRequestBody,
+  V1EncryptBulkResponseBody: _decode_V1EncryptBulkResponseBody,
+  V1EncryptRequestBody: _decode_V1EncryptRequestBody,
+  V1EncryptResponseBody: _decode_V1EncryptResponseBody,
+  V1LivenessResponseBody: _decode_V1LivenessResponseBody,
+  V1RatelimitCommitLeaseRequestBody: _decode_V1RatelimitCommitLeaseRequestBody,
+  V1RatelimitMultiRatelimitRequestBody: _decode_V1RatelimitMultiRatelimitRequestBody,
+  V1RatelimitMultiRatelimitResponseBody: _decode_V1RatelimitMultiRatelimitResponseBody,
+  V1RatelimitRatelimitRequestBody: _decode_V1RatelimitRatelimitRequestBody,
+  V1RatelimitRatelimitResponseBody: _decode_V1RatelimitRatelimitResponseBody,
+  AllExportedType: _decode_AllExportedType,
+  ValidationError: _decode_ValidationError,
+  AllExportedTypes: _decode_AllExportedTypes,
+}
+
+
+def decode(cls: Type[T], data: Any) -> T:
+  """Builds a cls instance from decoded JSON, renaming wire keys and converting nested models."""
+  return DECODERS[cls](data)
+
+
+def _encode_BaseError(obj: BaseError) -> Dict[str, Any]:
+  return {
+    "detail": obj.detail,
+    "instance": obj.instance,
+    "requestId": obj.request_id,
+    "status": obj.status,
+    "title": obj.title,
+    "type": obj.type,
+  }
+
+
+def _encode_Encrypted(obj: Encrypted) -> Dict[str, Any]:
+  return {
+    "encrypted": obj.encrypted,
+    "keyId": obj.key_id,
+  }
+
+
+def _encode_Item(obj: Item) -> Dict[str, Any]:
+  data = {
+    "duration": obj.duration,
+    "identifier": obj.identifier,
+    "limit": obj.limit,
+  }
+  if obj.cost is not None:
+    data["cost"] = obj.cost
+  return data
+
+
+def _encode_Lease(obj: Lease) -> Dict[str, Any]:
+  return {
+    "cost": obj.cost,
+    "timeout": obj.timeout,
+  }
+
+
+def _encode_SingleRatelimitResponse(obj: SingleRatelimitResponse) -> Dict[str, Any]:
+  return {
+    "current": obj.current,
+    "limit": obj.limit,
+    "remaining": obj.remaining,
+    "reset": obj.reset,
+    "success": obj.success,
+  }
+
+
+def _encode_V0EventsResponseBody(obj: V0EventsResponseBody) -> Dict[str, Any]:
+  data = {
+    "quarantined_rows": obj.quarantined_rows,
+    "successful_rows": obj.successful_rows,
+  }
+  if obj.schema is not None:
+    data["$schema"] = obj.schema
+  return data
+
+
+def _encode_V1DecryptRequestBody(obj: V1DecryptRequestBody) -> Dict[str, Any]:
+  data = {
+    "encrypted": obj.encrypted,
+    "keyring": obj.keyring,
+  }
+  if obj.schema is not None:
+    data["$schema"] = obj.schema
+  return data
+
+
+def _encode_V1DecryptResponseBody(obj: V1DecryptResponseBody) -> Dict[str, Any]:
+  data = {
+    "plaintext": obj.plaintext,
+  }
+  if obj.schema is not None:
+    data["$schema"] = obj.schema
+  return data
+
+
+def _encode_V1EncryptBulkRequestBody(obj: V1EncryptBulkRequestBody) -> Dict[str, Any]:
+  data = {
+    "data": obj.data,
+    "keyring": obj.keyring,
+  }
+  if obj.schema is not None:
+    data["$schema"] = obj.schema
+  return data
+
+
+def _encode_V1EncryptBulkResponseBody(obj: V1EncryptBulkResponseBody) -> Dict[str, Any]:
+  data = {
+    "encrypted": None if obj.encrypted is None else [_encode_Encrypted(item1) for item1 in obj.encrypted],
+  }
+  if obj.schema is not None:
+    data["$schema"] = obj.schema
+  return data
+
+
+def _encode_V1EncryptRequestBody(obj: V1EncryptRequestBody) -> Dict[str, Any]:
+  data = {
+    "data": obj.data,
+    "keyring": obj.keyring,
+  }
+  if obj.schema is not None:
+    data["$schema"] = obj.schema
+  return data
+
+
+def _encode_V1EncryptResponseBody(obj: V1EncryptResponseBody) -> Dict[str, Any]:
+  data = {
+    "encrypted": obj.encrypted,
+    "keyId": obj.key_id,
+  }
+  if obj.schema is not None:
+    data["$schema"] = obj.schema
+  return data
+
+
+def _encode_V1LivenessResponseBody(obj: V1LivenessResponseBody) -> Dict[str, Any]:
+  data = {
+    "message": obj.message,
+  }
+  if obj.schema is not None:
+    data["$schema"] = obj.schema
+  return data
+
+
+def _encode_V1RatelimitCommitLeaseRequestBody(obj: V1RatelimitCommitLeaseRequestBody) -> Dict[str, Any]:
+  data = {
+    "cost": obj.cost,
+    "lease": obj.lease,
+  }
+  if obj.schema is not None:
+    data["$schema"] = obj.schema
+  return data
+
+
+def _encode_V1RatelimitMultiRatelimitRequestBody(obj: V1RatelimitMultiRatelimitRequestBody) -> Dict[str, Any]:
+  data = {
+    "ratelimits": None if obj.ratelimits is None else [_encode_Item(item1) for item1 in obj.ratelimits],
+  }
+  if obj.schema is not None:
+    data["$schema"] = obj.schema
+  return data
+
+
+def _encode_V1RatelimitMultiRatelimitResponseBody(obj: V1RatelimitMultiRatelimitResponseBody) -> Dict[str, Any]:
+  data = {
+    "ratelimits": None if obj.ratelimits is None else [_encode_SingleRatelimitResponse(item1) for item1 in obj.ratelimits],
+  }
+  if obj.schema is not None:
+    data["$schema"] = obj.schema
+  return data
+
+
+def _encode_V1RatelimitRatelimitRequestBody(obj: V1RatelimitRatelimitRequestBody) -> Dict[str, Any]:
+  data = {
+    "duration": obj.duration,
+    "identifier": obj.identifier,
+    "limit": obj.limit,
+  }
+  if obj.schema is not None:
+    data["$schema"] = obj.schema
+  if obj.cost is not None:
+    data["cost"] = obj.cost
+  if obj.lease is not None:
+    data["lease"] = _encode_Lease(obj.lease)
+  return data
+
+
+def _encode_V1RatelimitRatelimitResponseBody(obj: V1RatelimitRatelimitResponseBody) -> Dict[str, Any]:
+  data = {
+    "current": obj.current,
+    "lease": obj.lease,
+    "limit": obj.limit,
+    "remaining": obj.remaining,
+    "reset": obj.reset,
+    "success": obj.success,
+  }
+  if obj.schema is not None:
+    data["$schema"] = obj.schema
+  return data
+
+
+def _encode_AllExportedType(obj: AllExportedType) -> Dict[str, Any]:
+  data = {
+    "location": obj.location,
+    "message": obj.message,
+  }
+  if obj.fix is not None:
+    data["fix"] = obj.fix
+  return data
+
+
+def _encode_ValidationError(obj: ValidationError) -> Dict[str, Any]:
+  return {
+    "detail": obj.detail,
+    "errors": None if obj.errors is None else [_encode_AllExportedType(item1) for item1 in obj.errors],
+    "instance": obj.instance,
+    "requestId": obj.request_id,
+    "status": obj.status,
+    "title": obj.title,
+    "type": obj.type,
+  }
+
+
+def _encode_AllExportedTypes(obj: AllExportedTypes) -> Dict[str, Any]:
+  return {
+    "base_error": None if obj.base_error is None else _encode_BaseError(obj.base_error),
+    "encrypted": None if obj.encrypted is None else _encode_Encrypted(obj.encrypted),
+    "item": None if obj.item is None else _encode_Item(obj.item),
+    "lease": None if obj.lease is None else _encode_Lease(obj.lease),
+    "single_ratelimit_response": None if obj.single_ratelimit_response is None else _encode_SingleRatelimitResponse(obj.single_ratelimit_response),
+    "v0_events_request_body": obj.v0_events_request_body,
+    "v0_events_response_body": None if obj.v0_events_response_body is None else _encode_V0EventsResponseBody(obj.v0_events_response_body),
+    "v1_decrypt_request_body": None if obj.v1_decrypt_request_body is None else _encode_V1DecryptRequestBody(obj.v1_decrypt_request_body),
+    "v1_decrypt_response_body": None if obj.v1_decrypt_response_body is None else _encode_V1DecryptResponseBody(obj.v1_decrypt_response_body),
+    "v1_encrypt_bulk_request_body": None if obj.v1_encrypt_bulk_request_body is None else _encode_V1EncryptBulkRequestBody(obj.v1_encrypt_bulk_request_body),
+    "v1_encrypt_bulk_response_body": None if obj.v1_encrypt_bulk_response_body is None else _encode_V1EncryptBulkResponseBody(obj.v1_encrypt_bulk_response_body),
+    "v1_encrypt_request_body": None if obj.v1_encrypt_request_body is None else _encode_V1EncryptRequestBody(obj.v1_encrypt_request_body),
+    "v1_encrypt_response_body": None if obj.v1_encrypt_response_body is None else _encode_V1EncryptResponseBody(obj.v1_encrypt_response_body),
+    "v1_liveness_response_body": None if obj.v1_liveness_response_body is None else _encode_V1LivenessResponseBody(obj.v1_liveness_response_body),
+    "v1_ratelimit_commit_lease_request_body": None if obj.v1_ratelimit_commit_lease_request_body is None else _encode_V1RatelimitCommitLeaseRequestBody(obj.v1_ratelimit_commit_lease_request_body),
+    "v1_ratelimit_multi_ratelimit_request_body": None if obj.v1_ratelimit_multi_ratelimit_request_body is None else _encode_V1RatelimitMultiRatelimitRequestBody(obj.v1_ratelimit_multi_ratelimit_request_body),
+    "v1_ratelimit_multi_ratelimit_response_body": None if obj.v1_ratelimit_multi_ratelimit_response_body is None else _encode_V1RatelimitMultiRatelimitResponseBody(obj.v1_ratelimit_multi_ratelimit_response_body),
+    "v1_ratelimit_ratelimit_request_body": None if obj.v1_ratelimit_ratelimit_request_body is None else _encode_V1RatelimitRatelimitRequestBody(obj.v1_ratelimit_ratelimit_request_body),
+    "v1_ratelimit_ratelimit_response_body": None if obj.v1_ratelimit_ratelimit_response_body is None else _encode_V1RatelimitRatelimitResponseBody(obj.v1_ratelimit_ratelimit_response_body),
+    "validation_error": None if obj.validation_error is None else _encode_ValidationError(obj.validation_error),
+    "validation_error_detail": None if obj.validation_error_detail is None else _encode_AllExportedType(obj.validation_error_detail),
+  }
+
+
+ENCODERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+  BaseError: _encode_BaseError,
+  Encrypted: _encode_Encrypted,
+  Item: _encode_Item,
+  Lease: _encode_Lease,
+  SingleRatelimitResponse: _encode_SingleRatelimitResponse,
+  V0EventsResponseBody: _encode_V0EventsResponseBody,
+  V1DecryptRequestBody: _encode_V1DecryptRequestBody,
+  V1DecryptResponseBody: _encode_V1DecryptResponseBody,
+  V1EncryptBulkRequestBody: _encode_V1EncryptBulkRequestBody,
+  V1EncryptBulkResponseBody: _encode_V1EncryptBulkResponseBody,
+  V1EncryptRequestBody: _encode_V1EncryptRequestBody,
+  V1EncryptResponseBody: _encode_V1EncryptResponseBody,
+  V1LivenessResponseBody: _encode_V1LivenessResponseBody,
+  V1RatelimitCommitLeaseRequestBody: _encode_V1RatelimitCommitLeaseRequestBody,
+  V1RatelimitMultiRatelimitRequestBody: _encode_V1RatelimitMultiRatelimitRequestBody,
+  V1RatelimitMultiRatelimitResponseBody: _encode_V1RatelimitMultiRatelimitResponseBody,
+  V1RatelimitRatelimitRequestBody: _encode_V1RatelimitRatelimitRequestBody,
+  V1RatelimitRatelimitResponseBody: _encode_V1RatelimitRatelimitResponseBody,
+  AllExportedType: _encode_AllExportedType,
+  ValidationError: _encode_ValidationError,
+  AllExportedTypes: _encode_AllExportedTypes,
+}
+
+
+def encode(obj: Any) -> Any:
+  """Converts model instances, also in lists and dicts, to JSON values with wire keys and no None optionals."""
+  encoder = ENCODERS.get(type(obj))
+  if encoder is not None:
+    return encoder(obj)
+  if isinstance(obj, list):
+    return [encode(item) for item in obj]
+  if isinstance(obj, dict):
+    return {key: encode(value) for key, value in obj.items()}
+  if isinstance(obj, View):
+    return obj._data
+  return obj
+
+
+class View:
+  """Read only model over its decoded JSON, each field is converted on first access and cached."""
+
+  __slots__ = ("__dict__", "_data", "_fields", "_model")
+
+  def __init__(self, model: type, data: Dict[str, Any]):
+    self._model = model
+    self._data = data
+    self._fields = VIEW_FIELDS[model]
+
+  def __getattr__(self, name: str) -> Any:
+    if name.startswith("_"):
+      raise AttributeError(name)
+    try:
+      key, convert = self._fields[name]
+    except KeyError:
+      raise AttributeError(f"{self._model.__name__} has no field {name}") from None
+    value = self._data.get(key)
+    if value is not None and convert is not None:
+      value = convert(value)
+    self.__dict__[name] = value
+    return value
+
+  def __repr__(self) -> str:
+    return f"View({self._model.__name__}, {self._data!r})"
+
+  def to_model(self) -> Any:
+    """Decodes all fields into the real model instance."""
+    return DECODERS[self._model](self._data)
+
+
+VIEW_FIELDS: Dict[type, Dict[str, Tuple[str, Optional[Callable[[Any], Any]]]]] = {
+  BaseError: {
+    "detail": ("detail", None),
+    "instance": ("instance", None),
+    "request_id": ("requestId", None),
+    "status": ("status", None),
+    "title": ("title", None),
+    "type": ("type", None),
+  },
+  Encrypted: {
+    "encrypted": ("encrypted", None),
+    "key_id": ("keyId", None),
+  },
+  Item: {
+    "duration": ("duration", None),
+    "identifier": ("identifier", None),
+    "limit": ("limit", None),
+    "cost": ("cost", None),
+  },
+  Lease: {
+    "cost": ("cost", None),
+    "timeout": ("timeout", None),
+  },
+  SingleRatelimitResponse: {
+    "current": ("current", None),
+    "limit": ("limit", None),
+    "remaining": ("remaining", None),
+    "reset": ("reset", None),
+    "success": ("success", None),
+  },
+  V0EventsResponseBody: {
+    "quarantined_rows": ("quarantined_rows", None),
+    "successful_rows": ("successful_rows", None),
+    "schema": ("$schema", None),
+  },
+  V1DecryptRequestBody: {
+    "encrypted": ("encrypted", None),
+    "keyring": ("keyring", None),
+    "schema": ("$schema", None),
+  },
+  V1DecryptResponseBody: {
+    "plaintext": ("plaintext", None),
+    "schema": ("$schema", None),
+  },
+  V1EncryptBulkRequestBody: {
+    "data": ("data", None),
+    "keyring": ("keyring", None),
+    "schema": ("$schema", None),
+  },
+  V1EncryptBulkResponseBody: {
+    "encrypted": ("encrypted", lambda value: [View(Encrypted, item) for item in value]),
+    "schema": ("$schema", None),
+  },
+  V1EncryptRequestBody: {
+    "data": ("data", None),
+    "keyring": ("keyring", None),
+    "schema": ("$schema", None),
+  },
+  V1EncryptResponseBody: {
+    "encrypted": ("encrypted", None),
+    "key_id": ("keyId", None),
+    "schema": ("$schema", None),
+  },
+  V1LivenessResponseBody: {
+    "message": ("message", None),
+    "schema": ("$schema", None),
+  },
+  V1RatelimitCommitLeaseRequestBody: {
+    "cost": ("cost", None),
+    "lease": ("lease", None),
+    "schema": ("$schema", None),
+  },
+  V1RatelimitMultiRatelimitRequestBody: {
+    "ratelimits": ("ratelimits", lambda value: [View(Item, item) for item in value]),
+    "schema": ("$schema", None),
+  },
+  V1RatelimitMultiRatelimitResponseBody: {
+    "ratelimits": ("ratelimits", lambda value: [View(SingleRatelimitResponse, item) for item in value]),
+    "schema": ("$schema", None),
+  },
+  V1RatelimitRatelimitRequestBody: {
+    "duration": ("duration", None),
+    "identifier": ("identifier", None),
+    "limit": ("limit", None),
+    "schema": ("$schema", None),
+    "cost": ("cost", None),
+    "lease": ("lease", lambda value: View(Lease, value)),
+  },
+  V1RatelimitRatelimitResponseBody: {
+    "current": ("current", None),
+    "lease": ("lease", None),
+    "limit": ("limit", None),
+    "remaining": ("remaining", None),
+    "reset": ("reset", None),
+    "success": ("success", None),
+    "schema": ("$schema", None),
+  },
+  AllExportedType: {
+    "location": ("location", None),
+    "message": ("message", None),
+    "fix": ("fix", None),
+  },
+  ValidationError: {
+    "detail": ("detail", None),
+    "errors": ("errors", lambda value: [View(AllExportedType, item) for item in value]),
+    "instance": ("instance", None),
+    "request_id": ("requestId", None),
+    "status": ("status", None),
+    "title": ("title", None),
+    "type": ("type", None),
+  },
+  AllExportedTypes: {
+    "base_error": ("base_error", lambda value: View(BaseError, value)),
+    "encrypted": ("encrypted", lambda value: View(Encrypted, value)),
+    "item": ("item", lambda value: View(Item, value)),
+    "lease": ("lease", lambda value: View(Lease, value)),
+    "single_ratelimit_response": ("single_ratelimit_response", lambda value: View(SingleRatelimitResponse, value)),
+    "v0_events_request_body": ("v0_events_request_body", None),
+    "v0_events_response_body": ("v0_events_response_body", lambda value: View(V0EventsResponseBody, value)),
+    "v1_decrypt_request_body": ("v1_decrypt_request_body", lambda value: View(V1DecryptRequestBody, value)),
+    "v1_decrypt_response_body": ("v1_decrypt_response_body", lambda value: View(V1DecryptResponseBody, value)),
+    "v1_encrypt_bulk_request_body": ("v1_encrypt_bulk_request_body", lambda value: View(V1EncryptBulkRequestBody, value)),
+    "v1_encrypt_bulk_response_body": ("v1_encrypt_bulk_response_body", lambda value: View(V1EncryptBulkResponseBody, value)),
+    "v1_encrypt_request_body": ("v1_encrypt_request_body", lambda value: View(V1EncryptRequestBody, value)),
+    "v1_encrypt_response_body": ("v1_encrypt_response_body", lambda value: View(V1EncryptResponseBody, value)),
+    "v1_liveness_response_body": ("v1_liveness_response_body", lambda value: View(V1LivenessResponseBody, value)),
+    "v1_ratelimit_commit_lease_request_body": ("v1_ratelimit_commit_lease_request_body", lambda value: View(V1RatelimitCommitLeaseRequestBody, value)),
+    "v1_ratelimit_multi_ratelimit_request_body": ("v1_ratelimit_multi_ratelimit_request_body", lambda value: View(V1RatelimitMultiRatelimitRequestBody, value)),
+    "v1_ratelimit_multi_ratelimit_response_body": ("v1_ratelimit_multi_ratelimit_response_body", lambda value: View(V1RatelimitMultiRatelimitResponseBody, value)),
+    "v1_ratelimit_ratelimit_request_body": ("v1_ratelimit_ratelimit_request_body", lambda value: View(V1RatelimitRatelimitRequestBody, value)),
+    "v1_ratelimit_ratelimit_response_body": ("v1_ratelimit_ratelimit_response_body", lambda value: View(V1RatelimitRatelimitResponseBody, value)),
+    "validation_error": ("validation_error", lambda value: View(ValidationError, value)),
+    "validation_error_detail": ("validation_error_detail", lambda value: View(AllExportedType, value)),
+  },
+}
+
+
+def view(cls: Type[T], data: Any) -> T:
+  """Lazy stand-in for a cls instance over decoded JSON, only the fields that are read get converted."""
+  return View(cls, data)  # type: ignore
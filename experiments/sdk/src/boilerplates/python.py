@@ -1,80 +1,35 @@
-import json
-import aiohttp
-import urllib.parse
-from typing import Any, AsyncGenerator, Dict, Optional, Union
-# types.py is in the same directory as this file
+from typing import Any, AsyncGenerator, AsyncIterable, AsyncIterator, BinaryIO, Dict, Iterable, List, Optional, Union
+# components.py is in the same directory as this file
 import components as Types
-
-
-
-class _replacedClientNameAsync:
-    def __init__(
-        self, base_url: str = "_replacedUrlDefault", token: Optional[str] = None
-    ):
-        self.base_url = base_url
-        self.token = token
-
-    async def fetch(
-        self,
-        method: str,
-        path: str,
-        query: Optional[Dict[str, Union[str, int, bool, None]]] = None,
-        body: Any = None,
-        headers: Optional[Dict[str, str]] = None,
-    ) -> Any:
-        url = urllib.parse.urljoin(self.base_url, path)
-
-        if query:
-            params = []
-            for key, value in query.items():
-                if value is not None:
-                    params.append(f"{key}={urllib.parse.quote(str(value))}")
-            if params:
-                url = f"{url}?{'&'.join(params)}"
-
-        request_headers = {"Content-Type": "application/json"}
-        if self.token:
-            request_headers["Authorization"] = f"Bearer {self.token}"
-        if headers:
-            request_headers.update(headers)
-
-        async with aiohttp.ClientSession() as session:
-            async with session.request(
-                method=method,
-                url=url,
-                headers=request_headers,
-                json=body if body is not None else None,
-            ) as response:
-                return response
-
-
-class _replacedErrorName(Exception):
-    def __init__(self, error: str, status: int, data: Any = None):
-        super().__init__(error)
-        self.status = status
-        self.data = data
-
-
-# this function should not be removed even if not used
-async def stream_sse_response(
-    response: aiohttp.ClientResponse,
-) -> AsyncGenerator[Any, None]:
-    if response.content is None:
-        return
-
-    async for line in response.content:
-        line = line.decode("utf-8")
-        if not line.startswith("data: "):
-            continue
-
-        data = line[6:].strip()
-        if not data:
-            continue
-
-        try:
-            event = json.loads(data)
-            if event.get("event") == "error":
-                raise _replacedErrorName(event["data"], status=500)
-            yield event
-        except json.JSONDecodeError:
-            continue
+# runtime.py is in the same directory as this file and can't be edited: fetch, retries, caching, timeouts,
+# transports and metrics live there, import any other name you need from it instead of redefining it
+from runtime import (
+    BaseClientAsync,
+    BaseClientSync,
+    FileSource,
+    JSONArrayStream,
+    NDJSONStream,
+    Response,
+    UploadFile,
+    _replacedErrorName,
+    add_sync_methods,
+    stream_sse_response,
+)
+
+
+class _replacedClientNameAsync(BaseClientAsync):
+    """
+    Route methods send requests with await self.fetch(method, path, query=, body=, headers=, multipart=,
+    route=) and build response models with self.decode(Types.Model, await response.json()).
+    """
+
+    DEFAULT_BASE_URL = "_replacedUrlDefault"
+
+
+class _replacedClientNameSync(BaseClientSync):
+    # every route method of the async client also exists here as a blocking method
+    client_class = _replacedClientNameAsync
+
+
+# this call should not be removed, it must stay after the client classes
+add_sync_methods(_replacedClientNameSync, _replacedClientNameAsync)
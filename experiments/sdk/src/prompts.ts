@@ -17,11 +17,17 @@ Generate a TypeScript SDK method for this OpenAPI route as a class method. The S
     `,
   python: `
 Generate a Python SDK method for this OpenAPI route as a class method. The SDK should:
-- Use aiohttp for making API calls
-- Be fully async/await compatible
+- Only add route methods to the client class: self.fetch, Response and the other helpers come from ./runtime.py, which cannot be edited, import any other runtime name you need instead of redefining it
+- Use self.fetch for making API calls, always pass the OpenAPI path template as route="/users/{id}" so traces and metrics group requests by route. It returns a Response with status, headers and async read(), text() and json() methods, json() raises ValueError for invalid JSON
+- Be fully async/await compatible, only await self.fetch and Response methods: the same methods also run on the generated sync client without an event loop
 - Include type hints using Python's typing system for better IDE autocompletion
 - Handle request/response serialization
-- Include error handling
+- Build response models with self.decode(Types.Model, await response.json()), never Types.Model(**data): decode renames camelCase wire keys, converts nested models and returns lazy views when the client has lazy_models=True. For arrays use [self.decode(Types.Model, item) for item in data]
+- For binary or very large responses (files, images, exports) accept an optional destination file or buffer and stream the body into it with await response.read_into(destination) instead of buffering it, passing stream=True to self.fetch
+- Accept JSON request bodies as the Types request model and pass the instance itself as self.fetch(..., body=model), never dataclasses.asdict(model) or vars(model): fetch encodes it with camelCase wire keys and without None optionals
+- For multipart/form-data uploads pass the form fields with self.fetch(..., multipart={...}) and type file fields as FileSource or UploadFile, never str: str values are sent as text fields. Never read or base64 encode files
+- For bulk endpoints (NDJSON bodies or arrays of records) accept an Iterable or AsyncIterable of records and pass body=NDJSONStream(records) or body=JSONArrayStream(records, fields={...}, key="...") so the body is encoded while it is sent
+- Include error handling, but never catch exceptions from self.fetch to turn them into fake status codes: fetch already retries transient network errors and 429/5xx responses and raises aiohttp.ClientError when the network keeps failing
 - Use Optional types where fields are not required
 - Add a comment above the method (ONLY METHODS) with the route path, method and tags
 - Always add global scope declarations like for types and functions at the end of the snippet
@@ -0,0 +1,806 @@
+import type { OpenAPIV3 } from 'openapi-types'
+
+// Post processing of the Python dataclasses emitted by quicktype: compact class styles, sparse wide models, compiled decoders and encoders and lazy views
+export type PythonStyle = 'dataclasses' | 'slots' | 'msgspec'
+
+export type PythonField = {
+  name: string
+  annotation: string
+  optional: boolean
+  // the key used in JSON, quicktype renames keys to snake_case and prefixes Python keywords with the class name
+  wireName: string
+  // the field line followed by its docstring and blank lines
+  lines: string[]
+}
+
+export type PythonBlock =
+  | {
+      kind: 'dataclass'
+      name: string
+      docLines: string[]
+      fields: PythonField[]
+    }
+  | { kind: 'enum'; name: string; lines: string[] }
+  | { kind: 'other'; lines: string[] }
+
+export type ParsedPythonTypes = {
+  imports: string[]
+  blocks: PythonBlock[]
+}
+
+const fieldRegex = /^  ([A-Za-z_][A-Za-z0-9_]*): (.+)$/
+
+export function parsePythonTypes(code: string): ParsedPythonTypes {
+  const lines = code.split('\n')
+  const isTopLevel = (line: string) => !!line && !line.startsWith(' ')
+
+  let index = 0
+  const imports: string[] = []
+  while (index < lines.length && !/^(@|class )/.test(lines[index])) {
+    if (lines[index].trim()) {
+      imports.push(lines[index])
+    }
+    index++
+  }
+
+  const blocks: PythonBlock[] = []
+  while (index < lines.length) {
+    const start = index
+    index++
+    while (
+      index < lines.length &&
+      !(isTopLevel(lines[index]) && !lines[index - 1].startsWith('@'))
+    ) {
+      index++
+    }
+    const blockLines = lines.slice(start, index)
+    while (blockLines.length && !blockLines[blockLines.length - 1].trim()) {
+      blockLines.pop()
+    }
+    blocks.push(parseBlock(blockLines))
+  }
+  return { imports, blocks }
+}
+
+function parseBlock(lines: string[]): PythonBlock {
+  const enumMatch = lines[0].match(/^class ([A-Za-z0-9_]+)\(Enum\):$/)
+  if (enumMatch) {
+    return { kind: 'enum', name: enumMatch[1], lines }
+  }
+  const classMatch = lines[1]?.match(/^class ([A-Za-z0-9_]+):$/)
+  if (lines[0] !== '@dataclass' || !classMatch) {
+    return { kind: 'other', lines }
+  }
+
+  const body = lines.slice(2)
+  let index = 0
+  const docLines: string[] = []
+  if (body[0]?.trim().startsWith('"""')) {
+    index = skipDocstring(body, 0)
+    while (index < body.length && !body[index].trim()) {
+      index++
+    }
+    docLines.push(...body.slice(0, index))
+  }
+
+  const fields: PythonField[] = []
+  while (index < body.length) {
+    const match = body[index].match(fieldRegex)
+    if (!match) {
+      // only docstrings and blank lines can follow a field
+      return { kind: 'other', lines }
+    }
+    const fieldLines = [body[index]]
+    index++
+    while (index < body.length && !fieldRegex.test(body[index])) {
+      if (body[index].trim().startsWith('"""')) {
+        const end = skipDocstring(body, index)
+        fieldLines.push(...body.slice(index, end))
+        index = end
+      } else {
+        fieldLines.push(body[index])
+        index++
+      }
+    }
+    const [, name, annotation] = match
+    fields.push({
+      name,
+      annotation,
+      optional: annotation.startsWith('Optional['),
+      wireName: name,
+      lines: fieldLines,
+    })
+  }
+  return { kind: 'dataclass', name: classMatch[1], docLines, fields }
+}
+
+// returns the index after the docstring starting at index
+function skipDocstring(lines: string[], index: number) {
+  const first = lines[index].trim()
+  if (first.length > 3 && first.endsWith('"""')) {
+    return index + 1
+  }
+  index++
+  while (index < lines.length && !lines[index].trim().endsWith('"""')) {
+    index++
+  }
+  return index + 1
+}
+
+const normalizeName = (name: string) =>
+  name.toLowerCase().replace(/[^a-z0-9]/g, '')
+
+function collectObjectKeys(openApiSchema: OpenAPIV3.Document) {
+  const keySets: string[][] = []
+  const seen = new Set<unknown>()
+  const visit = (schema: any) => {
+    if (!schema || typeof schema !== 'object' || seen.has(schema)) {
+      return
+    }
+    seen.add(schema)
+    if (schema.properties && typeof schema.properties === 'object') {
+      keySets.push(Object.keys(schema.properties))
+    }
+    for (const value of Object.values(schema)) {
+      visit(value)
+    }
+  }
+  visit(openApiSchema.components?.schemas)
+  return keySets
+}
+
+/**
+ * Finds the JSON key of every dataclass field.
+ *
+ * Classes are matched to the object schema with the same set of properties, because quicktype names
+ * inline objects after the property or array that contains them. Fields without a match keep their name.
+ */
+export function addWireNames({
+  parsed,
+  openApiSchema,
+}: {
+  parsed: ParsedPythonTypes
+  openApiSchema: OpenAPIV3.Document
+}) {
+  const keySets = collectObjectKeys(openApiSchema)
+  for (const block of parsed.blocks) {
+    if (block.kind !== 'dataclass') {
+      continue
+    }
+    const classPrefix = normalizeName(block.name)
+    for (const keys of keySets) {
+      if (keys.length !== block.fields.length) {
+        continue
+      }
+      const remaining = new Map(keys.map((key) => [key, normalizeName(key)]))
+      const wireNames: string[] = []
+      for (const field of block.fields) {
+        const fieldName = normalizeName(field.name)
+        const key = [...remaining.keys()].find(
+          (key) =>
+            remaining.get(key) === fieldName ||
+            classPrefix + remaining.get(key) === fieldName,
+        )
+        if (key === undefined) {
+          break
+        }
+        remaining.delete(key)
+        wireNames.push(key)
+      }
+      if (wireNames.length === block.fields.length) {
+        block.fields.forEach((field, i) => (field.wireName = wireNames[i]))
+        break
+      }
+    }
+  }
+  return parsed
+}
+
+function renderSlots(fields: PythonField[]) {
+  const names = fields.map((field) => `"${field.name}"`)
+  const trailingComma = names.length === 1 ? ',' : ''
+  const inline = `  __slots__ = (${names.join(', ')}${trailingComma})`
+  if (inline.length <= 100) {
+    return [inline]
+  }
+  return ['  __slots__ = (', ...names.map((name) => `    ${name},`), '  )']
+}
+
+function renderMsgspecField(field: PythonField) {
+  const [line, ...rest] = field.lines
+  // msgspec validates types while decoding, so required fields must accept null like in asNullable
+  const first = field.optional
+    ? line
+    : line.replace(`: ${field.annotation}`, `: Optional[${field.annotation}]`)
+  const renamed = field.wireName !== field.name
+  let value = ''
+  if (field.optional) {
+    value = renamed
+      ? ` = msgspec.field(default=None, name="${field.wireName}")`
+      : ' = None'
+  } else if (renamed) {
+    value = ` = msgspec.field(name="${field.wireName}")`
+  }
+  return [first + value, ...rest]
+}
+
+type Annotation = { name: string; args: Annotation[] }
+
+export function parseAnnotation(annotation: string): Annotation {
+  let index = 0
+  const parse = (): Annotation => {
+    const match = annotation.slice(index).match(/^\s*([A-Za-z0-9_.]+)/)
+    if (!match) {
+      throw new Error(`Cannot parse Python annotation ${annotation}`)
+    }
+    index += match[0].length
+    const args: Annotation[] = []
+    if (annotation[index] === '[') {
+      do {
+        index++
+        args.push(parse())
+      } while (annotation[index] === ',')
+      index++
+    }
+    return { name: match[1], args }
+  }
+  return parse()
+}
+
+// Python expression converting the value in expression between its JSON and annotation types
+function convertExpression({
+  annotation,
+  expression,
+  classes,
+  enums,
+  convertClass,
+  convertEnum,
+  depth = 0,
+}: {
+  annotation: Annotation
+  expression: string
+  classes: Set<string>
+  enums: Set<string>
+  convertClass: (className: string, expression: string) => string
+  convertEnum: (enumName: string, expression: string) => string
+  depth?: number
+}): string {
+  const recurse = (annotation: Annotation, expression: string) =>
+    convertExpression({
+      annotation,
+      expression,
+      classes,
+      enums,
+      convertClass,
+      convertEnum,
+      depth: depth + 1,
+    })
+  const { name, args } = annotation
+  if (name === 'Optional') {
+    const inner = recurse(args[0], expression)
+    return inner === expression
+      ? expression
+      : `None if ${expression} is None else ${inner}`
+  }
+  const item = depth ? `item${depth}` : 'item'
+  if (name === 'List') {
+    const inner = recurse(args[0], item)
+    return inner === item ? expression : `[${inner} for ${item} in ${expression}]`
+  }
+  if (name === 'Dict') {
+    const inner = recurse(args[1], item)
+    return inner === item
+      ? expression
+      : `{key: ${inner} for key, ${item} in ${expression}.items()}`
+  }
+  if (classes.has(name)) {
+    return convertClass(name, expression)
+  }
+  if (enums.has(name)) {
+    return convertEnum(name, expression)
+  }
+  return expression
+}
+
+// quicktype drops OpenAPI nullable, so required fields can be null on the wire too, like the geo of Dub links
+function asNullable(annotation: Annotation): Annotation {
+  return annotation.name === 'Optional'
+    ? annotation
+    : { name: 'Optional', args: [annotation] }
+}
+
+function collectTypeNames(parsed: ParsedPythonTypes) {
+  const classes = new Set<string>()
+  const enums = new Set<string>()
+  for (const block of parsed.blocks) {
+    if (block.kind === 'dataclass') {
+      classes.add(block.name)
+    } else if (block.kind === 'enum') {
+      enums.add(block.name)
+    }
+  }
+  return { classes, enums }
+}
+
+// models with at least this many fields, all optional scalars, store only the fields that are set
+export const sparseModelMinFields = 64
+
+const scalarAnnotations = ['str', 'int', 'float', 'bool', 'Any']
+
+type DataclassBlock = Extract<PythonBlock, { kind: 'dataclass' }>
+
+// wide objects like the country maps of Dub LinkGeoTargeting and Geo, where responses set a few keys
+function isSparseModel(block: DataclassBlock) {
+  return (
+    block.fields.length >= sparseModelMinFields &&
+    block.fields.every((field) => {
+      const annotation = parseAnnotation(field.annotation)
+      return (
+        field.optional && scalarAnnotations.includes(annotation.args[0].name)
+      )
+    })
+  )
+}
+
+const sparseModelClass = `class SparseModel:
+  """Base of wide models whose fields are mostly None, only the fields that are set are stored."""
+
+  __slots__ = ("_values",)
+  _fields: FrozenSet[str] = frozenset()
+
+  def __init_subclass__(cls, **kwargs: Any):
+    super().__init_subclass__(**kwargs)
+    cls._fields = frozenset(cls.__annotations__)
+
+  def __init__(self, **values: Any):
+    unknown = values.keys() - self._fields
+    if unknown:
+      raise TypeError(f"{type(self).__name__} got unexpected fields {', '.join(sorted(unknown))}")
+    self._values = {name: value for name, value in values.items() if value is not None}
+
+  @classmethod
+  def _from_values(cls, values: Dict[str, Any]) -> Any:
+    instance = cls.__new__(cls)
+    instance._values = values
+    return instance
+
+  def __getattr__(self, name: str) -> Any:
+    if name in self._fields:
+      return self._values.get(name)
+    raise AttributeError(f"{type(self).__name__} has no field {name}")
+
+  def __setattr__(self, name: str, value: Any) -> None:
+    if name not in self._fields:
+      object.__setattr__(self, name, value)
+    elif value is None:
+      self._values.pop(name, None)
+    else:
+      self._values[name] = value
+
+  def __copy__(self) -> Any:
+    return self._from_values(dict(self._values))
+
+  def __eq__(self, other: Any) -> bool:
+    return type(other) is type(self) and other._values == self._values
+
+  def __repr__(self) -> str:
+    fields = ", ".join(f"{name}={value!r}" for name, value in self._values.items())
+    return f"{type(self).__name__}({fields})"`.split('\n')
+
+// the wire key to attribute map is the decoder table, the encoder uses its inverse built at import
+function renderSparseTables(block: DataclassBlock) {
+  return [
+    [
+      `_${block.name}_attributes = {`,
+      ...block.fields.map(
+        (field) => `  "${field.wireName}": "${field.name}",`,
+      ),
+      '}',
+      `_${block.name}_wire_names = {name: key for key, name in _${block.name}_attributes.items()}`,
+    ],
+  ]
+}
+
+const decodeDocstring =
+  '  """Builds a cls instance from decoded JSON, renaming wire keys and converting nested models."""'
+
+function renderDecoders({
+  parsed,
+  style,
+}: {
+  parsed: ParsedPythonTypes
+  style: PythonStyle
+}) {
+  if (style === 'msgspec') {
+    return [
+      [
+        'def decode(cls: Type[T], data: Any) -> T:',
+        decodeDocstring,
+        '  return msgspec.convert(data, cls)',
+      ],
+    ]
+  }
+  const { classes, enums } = collectTypeNames(parsed)
+  const dataclasses = parsed.blocks.flatMap((block) =>
+    block.kind === 'dataclass' ? [block] : [],
+  )
+  const decoders = dataclasses.flatMap((block) => {
+    if (isSparseModel(block)) {
+      return [
+        ...renderSparseTables(block),
+        [
+          `def _decode_${block.name}(data: Dict[str, Any]) -> ${block.name}:`,
+          `  attributes = _${block.name}_attributes`,
+          `  return ${block.name}._from_values(`,
+          '    {attributes[key]: value for key, value in data.items() if value is not None and key in attributes}',
+          '  )',
+        ],
+      ]
+    }
+    return [renderDecoder({ block, classes, enums })]
+  })
+  return [
+    ...decoders,
+    [
+      'DECODERS: Dict[type, Callable[[Dict[str, Any]], Any]] = {',
+      ...dataclasses.map((block) => `  ${block.name}: _decode_${block.name},`),
+      '}',
+    ],
+    [
+      'def decode(cls: Type[T], data: Any) -> T:',
+      decodeDocstring,
+      '  return DECODERS[cls](data)',
+    ],
+  ]
+}
+
+function renderDecoder({
+  block,
+  classes,
+  enums,
+}: {
+  block: DataclassBlock
+  classes: Set<string>
+  enums: Set<string>
+}) {
+  return [
+    `def _decode_${block.name}(data: Dict[str, Any]) -> ${block.name}:`,
+    `  return ${block.name}(`,
+    ...block.fields.map((field) => {
+      const expression = field.optional
+        ? `data.get("${field.wireName}")`
+        : `data["${field.wireName}"]`
+      const value = convertExpression({
+        annotation: asNullable(parseAnnotation(field.annotation)),
+        expression,
+        classes,
+        enums,
+        convertClass: (className, expression) =>
+          `_decode_${className}(${expression})`,
+        convertEnum: (enumName, expression) => `${enumName}(${expression})`,
+      })
+      return `    ${field.name}=${value},`
+    }),
+    '  )',
+  ]
+}
+
+const encodeDocstring =
+  '  """Converts model instances, also in lists and dicts, to JSON values with wire keys and no None optionals."""'
+
+function renderEncoders({
+  parsed,
+  style,
+}: {
+  parsed: ParsedPythonTypes
+  style: PythonStyle
+}) {
+  if (style === 'msgspec') {
+    return [
+      [
+        'def encode(obj: Any) -> Any:',
+        encodeDocstring,
+        '  return msgspec.to_builtins(obj)',
+      ],
+    ]
+  }
+  const { classes, enums } = collectTypeNames(parsed)
+  const dataclasses = parsed.blocks.flatMap((block) =>
+    block.kind === 'dataclass' ? [block] : [],
+  )
+  const encoders = dataclasses.map((block) => {
+    if (isSparseModel(block)) {
+      return [
+        `def _encode_${block.name}(obj: ${block.name}) -> Dict[str, Any]:`,
+        `  wire_names = _${block.name}_wire_names`,
+        '  return {wire_names[name]: value for name, value in obj._values.items()}',
+      ]
+    }
+    const value = (field: PythonField) => {
+      const annotation = parseAnnotation(field.annotation)
+      return convertExpression({
+        // optional fields are only converted after the None check, required ones can be None too
+        annotation: field.optional ? annotation.args[0] : asNullable(annotation),
+        expression: `obj.${field.name}`,
+        classes,
+        enums,
+        convertClass: (className, expression) =>
+          `_encode_${className}(${expression})`,
+        convertEnum: (_, expression) => `${expression}.value`,
+      })
+    }
+    const required = block.fields.filter((field) => !field.optional)
+    const optional = block.fields.filter((field) => field.optional)
+    const items = required.map(
+      (field) => `    "${field.wireName}": ${value(field)},`,
+    )
+    if (!optional.length) {
+      return [
+        `def _encode_${block.name}(obj: ${block.name}) -> Dict[str, Any]:`,
+        '  return {',
+        ...items,
+        '  }',
+      ]
+    }
+    return [
+      `def _encode_${block.name}(obj: ${block.name}) -> Dict[str, Any]:`,
+      ...(items.length
+        ? ['  data = {', ...items, '  }']
+        : ['  data: Dict[str, Any] = {}']),
+      ...optional.flatMap((field) => [
+        `  if obj.${field.name} is not None:`,
+        `    data["${field.wireName}"] = ${value(field)}`,
+      ]),
+      '  return data',
+    ]
+  })
+  return [
+    ...encoders,
+    [
+      'ENCODERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {',
+      ...dataclasses.map((block) => `  ${block.name}: _encode_${block.name},`),
+      '}',
+    ],
+    [
+      'def encode(obj: Any) -> Any:',
+      encodeDocstring,
+      '  encoder = ENCODERS.get(type(obj))',
+      '  if encoder is not None:',
+      '    return encoder(obj)',
+      '  if isinstance(obj, list):',
+      '    return [encode(item) for item in obj]',
+      '  if isinstance(obj, dict):',
+      '    return {key: encode(value) for key, value in obj.items()}',
+      '  if isinstance(obj, View):',
+      '    return obj._data',
+      '  return obj',
+    ],
+  ]
+}
+
+const viewDocstring =
+  '  """Lazy stand-in for a cls instance over decoded JSON, only the fields that are read get converted."""'
+
+const viewClass = `class View:
+  """Read only model over its decoded JSON, each field is converted on first access and cached."""
+
+  __slots__ = ("__dict__", "_data", "_fields", "_model")
+
+  def __init__(self, model: type, data: Dict[str, Any]):
+    self._model = model
+    self._data = data
+    self._fields = VIEW_FIELDS[model]
+
+  def __getattr__(self, name: str) -> Any:
+    if name.startswith("_"):
+      raise AttributeError(name)
+    try:
+      key, convert = self._fields[name]
+    except KeyError:
+      raise AttributeError(f"{self._model.__name__} has no field {name}") from None
+    value = self._data.get(key)
+    if value is not None and convert is not None:
+      value = convert(value)
+    self.__dict__[name] = value
+    return value
+
+  def __repr__(self) -> str:
+    return f"View({self._model.__name__}, {self._data!r})"
+
+  def to_model(self) -> Any:
+    """Decodes all fields into the real model instance."""
+    return DECODERS[self._model](self._data)`.split('\n')
+
+function renderViews({
+  parsed,
+  style,
+}: {
+  parsed: ParsedPythonTypes
+  style: PythonStyle
+}) {
+  if (style === 'msgspec') {
+    // msgspec decodes whole Structs faster than a view converts a few fields
+    return [
+      [
+        'def view(cls: Type[T], data: Any) -> T:',
+        viewDocstring,
+        '  return msgspec.convert(data, cls)',
+      ],
+    ]
+  }
+  const { classes, enums } = collectTypeNames(parsed)
+  const dataclasses = parsed.blocks.flatMap((block) =>
+    block.kind === 'dataclass' ? [block] : [],
+  )
+  const converter = (field: PythonField) => {
+    const annotation = parseAnnotation(field.annotation)
+    const expression = convertExpression({
+      // None values are never converted
+      annotation: field.optional ? annotation.args[0] : annotation,
+      expression: 'value',
+      classes,
+      enums,
+      // nested models are views too, so a wide nested object costs nothing until it is read
+      convertClass: (className, expression) =>
+        `View(${className}, ${expression})`,
+      convertEnum: (enumName, expression) => `${enumName}(${expression})`,
+    })
+    if (expression === 'value') {
+      return 'None'
+    }
+    const enumName = expression.match(/^([A-Za-z0-9_]+)\(value\)$/)?.[1]
+    return enumName ?? `lambda value: ${expression}`
+  }
+  return [
+    viewClass,
+    [
+      'VIEW_FIELDS: Dict[type, Dict[str, Tuple[str, Optional[Callable[[Any], Any]]]]] = {',
+      ...dataclasses.flatMap((block) => [
+        `  ${block.name}: {`,
+        ...block.fields.map(
+          (field) =>
+            `    "${field.name}": ("${field.wireName}", ${converter(field)}),`,
+        ),
+        '  },',
+      ]),
+      '}',
+    ],
+    [
+      'def view(cls: Type[T], data: Any) -> T:',
+      viewDocstring,
+      '  return View(cls, data)  # type: ignore',
+    ],
+  ]
+}
+
+function addTypingImports(imports: string[], names: string[]) {
+  if (!names.length) {
+    return imports
+  }
+  const prefix = 'from typing import '
+  const index = imports.findIndex((line) => line.startsWith(prefix))
+  if (index === -1) {
+    return [...imports, `${prefix}${names.join(', ')}`]
+  }
+  const existing = imports[index].slice(prefix.length).split(', ')
+  const missing = names.filter((name) => !existing.includes(name))
+  return imports.map((line, i) =>
+    i === index ? [line, ...missing].join(', ') : line,
+  )
+}
+
+export function renderPythonTypes({
+  parsed,
+  style,
+  declarationsOnly = false,
+}: {
+  parsed: ParsedPythonTypes
+  style: PythonStyle
+  // only the models, for LLM prompts: decoders, encoders and views are used by the runtime, not by route methods
+  declarationsOnly?: boolean
+}) {
+  const hasSparseModels =
+    style !== 'msgspec' &&
+    parsed.blocks.some(
+      (block) => block.kind === 'dataclass' && isSparseModel(block),
+    )
+  const imports = addTypingImports(
+    parsed.imports.map((line) =>
+      style === 'msgspec' && line === 'from dataclasses import dataclass'
+        ? 'import msgspec'
+        : line,
+    ),
+    declarationsOnly
+      ? [
+          ...(hasSparseModels ? ['Any', 'Dict', 'FrozenSet'] : []),
+          ...(style === 'msgspec' ? ['Optional'] : []),
+        ]
+      : [
+          'Any',
+          'Callable',
+          'Dict',
+          ...(hasSparseModels ? ['FrozenSet'] : []),
+          'Optional',
+          'Tuple',
+          'Type',
+          'TypeVar',
+        ],
+  )
+  const blocks = parsed.blocks.map((block) => {
+    if (block.kind !== 'dataclass') {
+      return block.lines
+    }
+    if (style !== 'msgspec' && isSparseModel(block)) {
+      // fields stay annotations for type checkers, SparseModel returns None for the ones that are not set
+      return [
+        `class ${block.name}(SparseModel):`,
+        ...block.docLines,
+        '  __slots__ = ()',
+        '',
+        ...block.fields.flatMap((field) => field.lines),
+      ]
+    }
+    const fieldLines = block.fields.flatMap((field) =>
+      style === 'msgspec' ? renderMsgspecField(field) : field.lines,
+    )
+    if (style === 'msgspec') {
+      // optional fields default to None, so missing keys decode and arguments are keywords only
+      return [
+        `class ${block.name}(msgspec.Struct, kw_only=True, omit_defaults=True):`,
+        ...block.docLines,
+        ...fieldLines,
+      ]
+    }
+    if (style === 'slots') {
+      // no field has a default, so __slots__ does not clash with dataclass class attributes
+      return [
+        '@dataclass',
+        `class ${block.name}:`,
+        ...block.docLines,
+        ...renderSlots(block.fields),
+        '',
+        ...fieldLines,
+      ]
+    }
+    return [
+      '@dataclass',
+      `class ${block.name}:`,
+      ...block.docLines,
+      ...fieldLines,
+    ]
+  })
+  const helpers = declarationsOnly
+    ? []
+    : [
+        ['T = TypeVar("T")'],
+        ...renderDecoders({ parsed, style }),
+        ...renderEncoders({ parsed, style }),
+        ...renderViews({ parsed, style }),
+      ]
+  const code = [
+    ...(hasSparseModels ? [sparseModelClass] : []),
+    ...blocks,
+    ...helpers,
+  ]
+    .map((lines) => lines.join('\n'))
+    .join('\n\n\n')
+  return [...imports, '', '', code, ''].join('\n')
+}
+
+export function postProcessPythonTypes({
+  typesCode,
+  openApiSchema,
+  style,
+  declarationsOnly = false,
+}: {
+  typesCode: string
+  openApiSchema: OpenAPIV3.Document
+  style: PythonStyle
+  declarationsOnly?: boolean
+}) {
+  const parsed = addWireNames({
+    parsed: parsePythonTypes(typesCode),
+    openApiSchema,
+  })
+  return renderPythonTypes({ parsed, style, declarationsOnly })
+}
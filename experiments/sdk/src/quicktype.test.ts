@@ -55,4 +55,25 @@ describe('generateTypesFromSchema', () => {
       )
     })
   })
+  const pythonStyles = ['slots', 'msgspec'] as const
+  pythonStyles.forEach((pythonStyle) => {
+    it(`should generate partial python types with ${pythonStyle} style`, async () => {
+      const openapiPath = path.join(
+        __dirname,
+        '../scripts/openapi-tests/partial-schema.yml',
+      )
+      const openapiContent = fs.readFileSync(openapiPath, 'utf8')
+      const openApiSchema = yaml.load(openapiContent) as any
+
+      const result = await generateTypesFromSchema({
+        language: 'python',
+        openApiSchema,
+        pythonStyle,
+      })
+
+      await expect(result.typesCode).toMatchFileSnapshot(
+        `../scripts/openapi-tests/partial-types.${pythonStyle}.py`,
+      )
+    })
+  })
 })
@@ -9,15 +9,19 @@ import {
 import { Language } from './types'
 import { OpenAPIV3 } from 'openapi-types'
 import { camelCase, pascalCase } from 'quicktype-core/dist/support/Strings'
+import { PythonStyle, postProcessPythonTypes } from './python-types'
 
 interface GenerateTypesFromSchemaOptions {
   language: Language
   openApiSchema: OpenAPIV3.Document
+  // compact Python models, dataclasses with __slots__ or msgspec Structs
+  pythonStyle?: PythonStyle
 }
 
 export async function generateTypesFromSchema({
   language,
   openApiSchema,
+  pythonStyle = 'dataclasses',
 }: GenerateTypesFromSchemaOptions) {
   const schemas = openApiSchema.components?.schemas || {}
 
@@ -77,5 +81,23 @@ export async function generateTypesFromSchema({
     indentation: '  ',
   })
 
-  return { typesCode: lines.join('\n'), exportedNames }
+  let typesCode = lines.join('\n')
+  // the part of the types pasted in LLM prompts, python decoders, encoders and views are left out
+  let declarationsCode = typesCode
+  if (language === 'python') {
+    const dataclassesCode = typesCode
+    typesCode = postProcessPythonTypes({
+      typesCode: dataclassesCode,
+      openApiSchema,
+      style: pythonStyle,
+    })
+    declarationsCode = postProcessPythonTypes({
+      typesCode: dataclassesCode,
+      openApiSchema,
+      style: pythonStyle,
+      declarationsOnly: true,
+    })
+  }
+
+  return { typesCode, declarationsCode, exportedNames }
 }
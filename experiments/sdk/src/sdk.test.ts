@@ -49,6 +49,12 @@ for (const language of languages) {
             `${logFolder}/types.${languageToExtension[language]}`,
             generatedCode.typesCode,
           )
+          if (generatedCode.runtimeCode) {
+            await fs.promises.writeFile(
+              `${logFolder}/runtime.${languageToExtension[language]}`,
+              generatedCode.runtimeCode,
+            )
+          }
         },
       ) // Use longest timeout
 
@@ -20,6 +20,7 @@ import {
 } from './types'
 import { cleanupOpenApi } from './openapi'
 import { generateTypesFromSchema } from './quicktype'
+import { PythonStyle } from './python-types'
 
 const deepseek = createDeepSeek({
   apiKey: process.env.DEEPSEEK_API_KEY ?? '',
@@ -123,17 +124,23 @@ type RouteForLLM = {
 
 const componentTypesFileName = 'components'
 
+// static code shipped next to the generated client, it is never sent to the LLM
+const runtimeFileName = 'runtime'
+
 export async function generateSDKForRoute({
   route,
   openApiSchema,
   previousSdkCode,
   language,
+  pythonStyle,
   logFile = null,
 }: {
   route: RouteForLLM
   openApiSchema: OpenAPIV3.Document
   previousSdkCode?: string
   language: Language
+  // class style of the generated python models, dataclasses by default
+  pythonStyle?: PythonStyle
   logFile?: string | null
 }) {
   console.log(`generating sdk for route: ${route.method} ${route.path}`)
@@ -141,9 +148,11 @@ export async function generateSDKForRoute({
   const ymlSchema = YAML.dump(openApiSchema, { indent: 2, lineWidth: -1 })
 
   const { method, path } = route
-  const { typesCode, exportedNames } = await generateTypesFromSchema({
+  // python types also hold decoders and encoders, only the model declarations are pasted in the prompt
+  const { declarationsCode, exportedNames } = await generateTypesFromSchema({
     openApiSchema,
     language,
+    pythonStyle,
   })
 
   let typesPrompt = dedent`
@@ -154,7 +163,7 @@ export async function generateSDKForRoute({
   These types are not in the current scope, you have to use the right imported namespace to use them.
 
   \`\`\`${language}:${componentTypesFileName}.${extensions[language]}
-  ${typesCode}
+  ${declarationsCode}
   \`\`\`
   `
   // let typesPrompt = dedent`
@@ -272,6 +281,7 @@ export async function generateSDKFromOpenAPI({
   previousOpenApiSchema,
   logFolder = null,
   language = 'typescript',
+  pythonStyle,
   params,
   maxLLMConcurrency = 10,
 }: {
@@ -279,11 +289,20 @@ export async function generateSDKFromOpenAPI({
   previousOpenApiSchema?: OpenAPIV3.Document
   previousSdkCode?: string
   language?: Language
+  // class style of the generated python models: dataclasses, slots or msgspec
+  pythonStyle?: PythonStyle
   logFolder?: string | null
   params?: BoilerplateParams
   maxLLMConcurrency?: number
 }) {
   openApiSchema = cleanupOpenApi(openApiSchema)
+  const boilerplateParams = {
+    // TODO remove example boilerplate params for prod
+    ClientName: 'ExampleClient',
+    ErrorName: 'ExampleError',
+    UrlDefault: 'http://localhost:3000',
+    ...params,
+  }
   if (!previousSdkCode) {
     const boilerplatePath = path.resolve(
       __dirname,
@@ -296,15 +315,20 @@ export async function generateSDKFromOpenAPI({
     }
     previousSdkCode = replaceParamsInTemplate({
       template: fs.readFileSync(boilerplatePath, 'utf-8'),
-      params: {
-        // TODO remove example boilerplate params for prod
-        ClientName: 'ExampleClient',
-        ErrorName: 'ExampleError',
-        UrlDefault: 'http://localhost:3000',
-        ...params,
-      },
+      params: boilerplateParams,
     })
   }
+  const runtimePath = path.resolve(
+    __dirname,
+    `./boilerplates/${language}-${runtimeFileName}.${extensions[language]}`,
+  )
+  // languages without a runtime keep everything in the boilerplate
+  const runtimeCode = fs.existsSync(runtimePath)
+    ? replaceParamsInTemplate({
+        template: fs.readFileSync(runtimePath, 'utf-8'),
+        params: boilerplateParams,
+      })
+    : undefined
   const routes = getRoutesFromOpenAPI({ openApiSchema, previousOpenApiSchema })
 
   const results = await Array.fromAsync(
@@ -319,6 +343,7 @@ export async function generateSDKFromOpenAPI({
           openApiSchema: openApiSchemaSubset,
           previousSdkCode,
           language,
+          pythonStyle,
           logFile: logFolder
             ? `${logFolder}/${
                 route.operationId ||
@@ -343,8 +368,9 @@ export async function generateSDKFromOpenAPI({
   const { typesCode } = await generateTypesFromSchema({
     language,
     openApiSchema,
+    pythonStyle,
   })
-  return { typesCode, ...merged }
+  return { typesCode, runtimeCode, ...merged }
 }
 
 export async function mergeSDKOutputs({